@@ -0,0 +1,113 @@
+"""
+Response serialisation: FastAPI's response_model path versus ModelResponse.
+
+Builds the GET /blogs/{id} body for a blog with a growing number of
+comments, then serialises it the way FastAPI does for a route returning a
+model (validate against response_model, jsonable_encoder, json.dumps) and
+the way ModelResponse does (pydantic-core straight to bytes). When orjson
+is installed, model_dump() followed by orjson.dumps is reported for
+reference; it writes UTC datetimes as +00:00 rather than the Z the API
+sends today. It reports CPU time per response and checks that ModelResponse
+produces the same JSON as FastAPI. Needs no database.
+
+    python -m benchmarks.bench_response_serialization
+"""
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from src.responses import ModelResponse
+from src.schemas.api_response import APIResponse
+from src.schemas.blog import BlogDetail, BlogWithCommentsResponse, Comment, UserInfo
+
+COMMENT_COUNTS = [0, 20, 100, 500]
+REPEAT = 300
+
+
+def author(i: int) -> UserInfo:
+    return UserInfo(
+        id=str(uuid4()), name=f"User {i}",
+        image_url=f"https://example.com/uploads/ab/cd/{i:064x}.png",
+        image_srcset={"image/webp": f"https://example.com/uploads/ab/cd/{i:064x}.w320.webp 320w"})
+
+
+def blog_details(comment_count: int) -> APIResponse:
+    now = datetime.now(timezone.utc)
+    details = BlogWithCommentsResponse(
+        blog=BlogDetail(
+            id=str(uuid4()), title="A blog post", body="lorem ipsum " * 200,
+            cover_image_url="https://example.com/uploads/ab/cd/cover.png",
+            is_liked_by_user=True, total_likes=42, created_by=author(0), created_at=now),
+        comments=[
+            Comment(id=str(uuid4()), content=f"Comment {i} " * 10,
+                    created_by=author(i), created_at=now)
+            for i in range(comment_count)
+        ],
+        comments_next_cursor="eyJpZCI6ICIxIn0",
+    )
+    return APIResponse(data=details, success=True, message="Blog details fetched successfully")
+
+
+def response_route() -> APIRoute:
+    app = FastAPI()
+
+    @app.get("/blogs/{blog_id}", response_model=APIResponse[BlogWithCommentsResponse])
+    async def get_blog_details():
+        ...
+
+    return next(route for route in app.routes
+                if isinstance(route, APIRoute) and route.path == "/blogs/{blog_id}")
+
+
+async def cpu_time(render: Callable[[], Awaitable[bytes]]) -> float:
+    """Process CPU seconds per call, after one warm-up call."""
+    await render()
+    started = time.process_time()
+    for _ in range(REPEAT):
+        await render()
+    return (time.process_time() - started) / REPEAT
+
+
+async def main() -> None:
+    route = response_route()
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    print(f"{REPEAT} responses per case, CPU time per response")
+    print(f"{'comments':>9}{'body B':>9}{'response_model':>16}{'ModelResponse':>15}{'orjson':>10}{'speed-up':>10}")
+    for comment_count in COMMENT_COUNTS:
+        payload = blog_details(comment_count)
+
+        async def fastapi_path() -> bytes:
+            content = await serialize_response(
+                field=route.response_field, response_content=payload, is_coroutine=True)
+            return JSONResponse(content).body
+
+        async def model_response() -> bytes:
+            return ModelResponse(payload).body
+
+        async def orjson_path() -> bytes:
+            return orjson.dumps(payload.model_dump(by_alias=True))
+
+        expected = json.loads(await fastapi_path())
+        assert json.loads(await model_response()) == expected
+        baseline = await cpu_time(fastapi_path)
+        fast = await cpu_time(model_response)
+        orjson_column = "-"
+        if orjson is not None:
+            orjson_column = f"{await cpu_time(orjson_path) * 1e6:.0f}us"
+        print(f"{comment_count:>9}{len(await model_response()):>9}{baseline * 1e6:>14.0f}us"
+              f"{fast * 1e6:>13.0f}us{orjson_column:>10}{baseline / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+"""
+Static uploads: Starlette's StaticFiles versus CachedStaticFiles.
+
+Serves a content-addressed image and a compressible JSON manifest through
+each mount, in process over ASGI. For a full GET, a revalidation
+(If-None-Match) and a GET that accepts gzip, it reports throughput, the
+bytes the response body puts on the wire and the Cache-Control a client
+receives. With an immutable file a client skips even the revalidation.
+Needs no database.
+
+    python -m benchmarks.bench_static_files
+"""
+import asyncio
+import gzip
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from src.static_files import CachedStaticFiles
+
+REQUESTS = 2_000
+IMAGE_BYTES = 200 * 1024
+DIGEST = "ab" + "cd" + "0" * 60
+
+
+def prepare_files(root: Path) -> dict[str, str]:
+    blob_dir = root / "ab" / "cd"
+    blob_dir.mkdir(parents=True)
+    image = blob_dir / f"{DIGEST}.png"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n" + os.urandom(IMAGE_BYTES))
+    manifest = blob_dir / f"{DIGEST}.variants.json"
+    manifest.write_text('{"variants": [' + ", ".join(
+        f'{{"path": "uploads/ab/cd/{DIGEST}.w{w}.webp", "width": {w}, "format": "webp"}}'
+        for w in range(100, 2100, 100)) + "]}")
+    Path(f"{manifest}.gz").write_bytes(gzip.compress(manifest.read_bytes(), 9))
+    return {
+        "image": f"/uploads/ab/cd/{image.name}",
+        "manifest": f"/uploads/ab/cd/{manifest.name}",
+    }
+
+
+async def throughput(client: httpx.AsyncClient, path: str, headers: dict[str, str]) -> tuple[float, int, str, int]:
+    """Requests per second, body bytes on the wire, Cache-Control and status of one response."""
+    response = await client.get(path, headers=headers)
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await client.get(path, headers=headers)
+    elapsed = time.perf_counter() - started
+    wire_bytes = int(response.headers.get("content-length", len(response.content)))
+    return REQUESTS / elapsed, wire_bytes, response.headers.get("cache-control", "-"), response.status_code
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = prepare_files(Path(directory))
+        mounts = {
+            "StaticFiles": StaticFiles(directory=directory),
+            "CachedStaticFiles": CachedStaticFiles(directory=directory),
+        }
+        print(f"{REQUESTS} requests per case, in process over ASGI")
+        print(f"{'mount':<19}{'case':<24}{'status':>7}{'req/s':>9}{'body B':>9}  cache-control")
+        for name, static_files in mounts.items():
+            app = Starlette(routes=[Mount("/uploads", static_files)])
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                etag = (await client.get(paths["image"])).headers["etag"]
+                cases = {
+                    "image GET": (paths["image"], {"accept-encoding": "identity"}),
+                    "image revalidate": (paths["image"], {"if-none-match": etag}),
+                    "manifest GET gzip": (paths["manifest"], {"accept-encoding": "gzip"}),
+                }
+                for case, (path, headers) in cases.items():
+                    rate, wire_bytes, cache_control, status = await throughput(client, path, headers)
+                    print(f"{name:<19}{case:<24}{status:>7}{rate:>9.0f}{wire_bytes:>9}  {cache_control}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
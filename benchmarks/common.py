@@ -0,0 +1,104 @@
+"""
+Shared setup for the benchmarks in this package.
+
+Benchmarks run against a throwaway PostgreSQL database named by
+BENCH_DATABASE_URL: its public schema is dropped, migrated to the latest
+Alembic revision and seeded before measuring.
+"""
+import asyncio
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config import config
+from src.models.blog import Blog
+from src.models.user import User
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class BenchSeed:
+    user_ids: list[UUID]
+    blog_ids: list[UUID]
+
+
+def bench_database_url() -> str:
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        sys.exit("Set BENCH_DATABASE_URL to a throwaway PostgreSQL database "
+                 "(its public schema is dropped)")
+    return url
+
+
+async def prepare_database(url: str, users: int = 200, blogs: int = 2_000,
+                           body_size: int = 4_000) -> tuple[AsyncEngine, BenchSeed]:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+
+    # migrations/env.py reads the URL from the shared settings object
+    config.DATABASE_URL = url
+    alembic_config = AlembicConfig(str(PROJECT_ROOT / "alembic.ini"))
+    await asyncio.to_thread(alembic_command.upgrade, alembic_config, "head")
+
+    rng = random.Random(1234)
+    now = datetime.now(timezone.utc)
+    user_rows = [
+        {
+            "id": uuid4(),
+            "email": f"bench{i}@example.com",
+            "name": f"Bench User {i}",
+            "profile_image_url": "/images/default.jpg",
+            "password_hash": "not-a-real-hash",
+            "role": "user",
+        }
+        for i in range(users)
+    ]
+    user_ids = [user["id"] for user in user_rows]
+    blog_rows = [
+        {
+            "id": uuid4(),
+            "title": f"Benchmark blog {i}",
+            # Random text, so TOAST compression does not hide the body's size
+            "body": "".join(rng.choices(string.ascii_letters + " ", k=body_size)),
+            "cover_image_url": "/images/default.jpg",
+            "like_count": 0,
+            "created_by": rng.choice(user_ids),
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i),
+        }
+        for i in range(blogs)
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(insert(User.__table__), user_rows)  # type: ignore[attr-defined]
+        await conn.execute(insert(Blog.__table__), blog_rows)  # type: ignore[attr-defined]
+        await conn.execute(text("ANALYZE"))
+
+    return engine, BenchSeed(user_ids=user_ids, blog_ids=[blog["id"] for blog in blog_rows])
+
+
+async def time_async(run: Callable[[], Awaitable[object]], repeat: int) -> tuple[float, float]:
+    """Median and p95 wall time in milliseconds over `repeat` runs, after one warm-up."""
+    await run()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
@@ -10,6 +10,8 @@ from src.models.user import User
 from src.models.blog import Blog
 from src.models.comment import Comment
 from src.models.blog_like import BlogLike
+from src.models.table_counter import TableCounter
+from src.models.blog_like_counter import BlogLikeCounter
 from sqlmodel import SQLModel
 from src.config import config as Config
 # this is the Alembic Config object, which provides
@@ -21,8 +23,9 @@ config.set_main_option('sqlalchemy.url', database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
+# Loggers created before a migration run in-process keep logging
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
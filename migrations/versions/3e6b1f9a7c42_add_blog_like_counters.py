@@ -0,0 +1,38 @@
+"""Add blog like counter shards
+
+Revision ID: 3e6b1f9a7c42
+Revises: 7d4a9c2e8f15
+Create Date: 2026-10-17 19:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e6b1f9a7c42'
+down_revision: Union[str, Sequence[str], None] = '7d4a9c2e8f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('blog_like_counters',
+                    sa.Column('blog_id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('shard', postgresql.SMALLINT(), nullable=False),
+                    sa.Column('delta', postgresql.BIGINT(),
+                              server_default='0', nullable=False),
+                    sa.ForeignKeyConstraint(
+                        ['blog_id'], ['blogs.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('blog_id', 'shard')
+                    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('blog_like_counters')
@@ -0,0 +1,47 @@
+"""Add secondary indexes for hot queries
+
+Revision ID: 5b8e2f6c1d3a
+Revises: 24f37125a706
+Create Date: 2026-10-17 10:12:41.503318
+
+The unique index on lower(email) fails if two existing users share an
+email that differs only in case; merge those accounts before upgrading.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2f6c1d3a'
+down_revision: Union[str, Sequence[str], None] = '24f37125a706'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_blogs_created_at_id', 'blogs',
+                    ['created_at', 'id'], unique=False)
+    op.create_index('ix_blogs_created_by', 'blogs',
+                    ['created_by'], unique=False)
+    op.create_index('ix_comments_blog_id_created_at', 'comments',
+                    ['blog_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_blog_likes_liked_blog_id_user_id', 'blog_likes',
+                    ['blog_id', 'user_id'], unique=False,
+                    postgresql_where=sa.text('is_liked'))
+    op.create_index('uq_users_email_lower', 'users',
+                    [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_users_email_lower', table_name='users')
+    op.drop_index('ix_blog_likes_liked_blog_id_user_id',
+                  table_name='blog_likes',
+                  postgresql_where=sa.text('is_liked'))
+    op.drop_index('ix_comments_blog_id_created_at', table_name='comments')
+    op.drop_index('ix_blogs_created_by', table_name='blogs')
+    op.drop_index('ix_blogs_created_at_id', table_name='blogs')
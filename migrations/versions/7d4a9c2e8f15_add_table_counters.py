@@ -0,0 +1,39 @@
+"""Add table counters
+
+Revision ID: 7d4a9c2e8f15
+Revises: 5b8e2f6c1d3a
+Create Date: 2026-10-17 11:02:17.841290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlmodel.sql.sqltypes import AutoString
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4a9c2e8f15'
+down_revision: Union[str, Sequence[str], None] = '5b8e2f6c1d3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('table_counters',
+                    sa.Column('table_name', AutoString(), nullable=False),
+                    sa.Column('row_count', postgresql.BIGINT(),
+                              server_default='0', nullable=False),
+                    sa.PrimaryKeyConstraint('table_name')
+                    )
+    op.execute(
+        "INSERT INTO table_counters (table_name, row_count) "
+        "SELECT 'blogs', count(*) FROM blogs"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('table_counters')
@@ -0,0 +1,35 @@
+"""Index image URL columns
+
+Revision ID: 8c1f4e7b2a90
+Revises: 3e6b1f9a7c42
+Create Date: 2026-10-17 16:40:12.318504
+
+Uploads are stored by content hash and shared between rows, so a file may
+only be deleted once no blog cover or profile image still points at it.
+These indexes keep that reference count an index lookup.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f4e7b2a90'
+down_revision: Union[str, Sequence[str], None] = '3e6b1f9a7c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_blogs_cover_image_url', 'blogs',
+                    ['cover_image_url'], unique=False)
+    op.create_index('ix_users_profile_image_url', 'users',
+                    ['profile_image_url'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_profile_image_url', table_name='users')
+    op.drop_index('ix_blogs_cover_image_url', table_name='blogs')
@@ -1,12 +1,89 @@
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str = ""
+    # Optional read replica; GET requests are routed here when set
+    DATABASE_REPLICA_URL: str = ""
+    REPLICA_READ_YOUR_WRITES_SECONDS: float = 5.0
     JWT_ACCESS_TOKEN_SECRET_KEY: str = ""
     JWT_REFRESH_TOKEN_SECRET_KEY: str = ""
     JWT_ALGORITHM: str = ""
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # How GET /blogs computes totalItems
+    BLOG_COUNT_STRATEGY: Literal["exact",
+                                 "counter", "estimate", "cached"] = "counter"
+    BLOG_COUNT_CACHE_TTL: float = 30.0
+
+    # How like toggles update blogs.like_count: in the toggle's own statement,
+    # buffered in memory and flushed in batches, or spread over counter shards
+    LIKE_COUNT_MODE: Literal["inline", "write_behind", "sharded"] = "inline"
+    LIKE_FLUSH_INTERVAL_SECONDS: float = 1.0
+    LIKE_FLUSH_MAX_PENDING: int = 1000
+    LIKE_COUNTER_SHARDS: int = 16
+    LIKE_COUNTER_COMPACT_INTERVAL_SECONDS: float = 60.0
+
+    # Authenticated users cached per worker; the TTL is capped at the access token lifetime
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+
+    # Serialised GET /blogs bodies per worker; fresh for the TTL, then served stale while one reload runs
+    BLOG_LIST_CACHE_MAX_ENTRIES: int = 256
+    BLOG_LIST_CACHE_TTL_SECONDS: float = 5.0
+    BLOG_LIST_CACHE_STALE_SECONDS: float = 30.0
+    # Pages of the default page size loaded into the cache at startup
+    BLOG_LIST_CACHE_WARM_PAGES: int = 3
+
+    # Viewer-independent GET /blogs/{id} bodies per worker; the viewer's like flag is looked up per request
+    BLOG_DETAIL_CACHE_MAX_ENTRIES: int = 1024
+    BLOG_DETAIL_CACHE_TTL_SECONDS: float = 5.0
+
+    # bcrypt runs on its own bounded executor; calls beyond workers + queue get a 503
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
+    # Larger request bodies get a 413 before they are buffered; covers a 1MB image plus form fields
+    MAX_REQUEST_BODY_BYTES: int = 2 * 1024 * 1024
+
+    # An upload or temp file touched this recently is never deleted, even with no references yet
+    UPLOAD_GRACE_SECONDS: float = 300.0
+    # Background pass deleting uploads no blog or user references; one worker at a time runs it
+    UPLOAD_REAPER_INTERVAL_SECONDS: float = 600.0
+    UPLOAD_REAPER_BATCH_SIZE: int = 500
+
+    # Resized variants generated for every upload, on their own process pool
+    IMAGE_VARIANT_WIDTHS: list[int] = [320, 640, 1280]
+    IMAGE_VARIANT_FORMATS: list[Literal["webp", "avif"]] = ["webp"]
+    IMAGE_VARIANT_WORKERS: int = 1
+
+    # Cache lifetime for static files not named by content hash; hashed uploads are immutable
+    STATIC_MAX_AGE_SECONDS: int = 3600
+
+    # Where uploads are stored: the local uploads/ directory, or an S3-compatible bucket
+    STORAGE_BACKEND: Literal["local", "s3"] = "local"
+    S3_BUCKET: str = ""
+    # Set for MinIO or another S3-compatible service; empty means AWS
+    S3_ENDPOINT_URL: str = ""
+    S3_REGION: str = "us-east-1"
+    S3_ACCESS_KEY_ID: str = ""
+    S3_SECRET_ACCESS_KEY: str = ""
+    # Public (CDN) base URL for the bucket; empty means presigned download URLs
+    S3_PUBLIC_BASE_URL: str = ""
+    S3_PRESIGN_EXPIRY_SECONDS: int = 900
+
+    # Bearer token for the /metrics endpoints; empty leaves them unmounted
+    METRICS_TOKEN: str = ""
+
     # Server configuration
     SERVER_HOST: str = ""
     SERVER_PORT: int = 3000
@@ -2,16 +2,43 @@ from collections.abc import AsyncGenerator
 from src.config import config
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from src.db.pool_metrics import InstrumentedAsyncQueuePool
 
 # Import all models to ensure relationships are resolved
 from src.models.user import User  # type: ignore[arg-type]
 from src.models.blog import Blog  # type: ignore[arg-type]
 from src.models.comment import Comment  # type: ignore[arg-type]
 from src.models.blog_like import BlogLike  # type: ignore[arg-type]
+from src.models.table_counter import TableCounter  # type: ignore[arg-type]
+from src.models.blog_like_counter import BlogLikeCounter  # type: ignore[arg-type]
 
-async_engine = create_async_engine(
-    config.DATABASE_URL)
+
+def create_pooled_engine(url: str, name: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+        pool_logging_name=name,
+        connect_args={
+            # SQLAlchemy's prepared statement cache and asyncpg's own cache
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+async_engine = create_pooled_engine(config.DATABASE_URL, name="primary")
+
+
+replica_engine = (
+    create_pooled_engine(config.DATABASE_REPLICA_URL, name="replica")
+    if config.DATABASE_REPLICA_URL else None
+)
 
 
 async_session_maker = async_sessionmaker(
@@ -20,7 +47,19 @@ async_session_maker = async_sessionmaker(
     class_=AsyncSession,
 )
 
+# Falls back to the primary when no replica is configured
+replica_session_maker = async_sessionmaker(
+    bind=replica_engine or async_engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+
+async def get_replica_session() -> AsyncGenerator[AsyncSession, None]:
+    async with replica_session_maker() as session:
+        yield session
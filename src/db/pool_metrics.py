@@ -0,0 +1,62 @@
+import time
+from typing import Any
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.metrics import Histogram
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
+
+
+# Keyed by the pool logging name so metrics survive pool.recreate()
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited for a connection."""
+
+    def __init__(self, creator: Any, pool_size: int = 5, max_overflow: int = 10, **kw: Any):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        # QueuePool has no public accessor for this; recreate() passes it back in
+        self.max_overflow = max_overflow
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        name = self._orig_logging_name or "default"
+        return pool_metrics.setdefault(name, PoolMetrics())
+
+    def connect(self) -> PoolProxiedConnection:
+        metrics = self.metrics
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.checkout_timeouts += 1
+            raise
+        finally:
+            metrics.checkout_wait.observe(time.perf_counter() - start)
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.sync_engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if not isinstance(pool, InstrumentedAsyncQueuePool):
+        return status
+
+    metrics = pool.metrics
+    status.update({
+        "size": pool.size(),
+        "max_overflow": pool.max_overflow,
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool counts overflow from -pool_size until the pool is full
+        "overflow": max(pool.overflow(), 0),
+        "checkout_timeouts": metrics.checkout_timeouts,
+        "checkout_wait_seconds": metrics.checkout_wait.snapshot(),
+    })
+    return status
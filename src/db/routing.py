@@ -0,0 +1,26 @@
+import time
+from collections import OrderedDict
+
+
+class ReadYourWritesTracker:
+    """Remembers recent writers so their reads stay on the primary until the replica catches up."""
+
+    def __init__(self, window_seconds: float, max_entries: int = 10_000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._last_write: OrderedDict[str, float] = OrderedDict()
+
+    def record_write(self, key: str) -> None:
+        self._last_write[key] = time.monotonic()
+        self._last_write.move_to_end(key)
+        while len(self._last_write) > self.max_entries:
+            self._last_write.popitem(last=False)
+
+    def recently_wrote(self, key: str) -> bool:
+        written_at = self._last_write.get(key)
+        if written_at is None:
+            return False
+        if time.monotonic() - written_at > self.window_seconds:
+            del self._last_write[key]
+            return False
+        return True
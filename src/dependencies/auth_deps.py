@@ -3,9 +3,9 @@ from fastapi import Depends, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from src.models.user import User
 from src.services.auth_service import AuthService
-from src.utils import verify_access_token
 from fastapi.exceptions import HTTPException
 from .repositories_deps import UserRepositoryDep
+from .token_deps import decode_access_token
 
 
 class AccessTokenBearer(HTTPBearer):
@@ -18,7 +18,7 @@ class AccessTokenBearer(HTTPBearer):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated"
             )
-        if not verify_access_token(creds.credentials):
+        if not decode_access_token(request, creds.credentials):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Invalid or expired Token"
@@ -30,20 +30,24 @@ AccessTokenDep = Annotated[HTTPAuthorizationCredentials,
                            Depends(AccessTokenBearer())]
 
 
-async def get_current_user_from_token(token_details: AccessTokenDep,
+async def get_current_user_from_token(request: Request,
+                                      token_details: AccessTokenDep,
                                       user_repo: UserRepositoryDep
                                       ) -> Optional[User]:
-    user_data = verify_access_token(token_details.credentials)
+    user_data = decode_access_token(request, token_details.credentials)
     if not user_data:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
-    user_email = user_data.get("user", {}).get("email")
-    user = await AuthService(user_repo=user_repo).get_user_by_email(user_email)
+    user_id = user_data.get("user", {}).get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    user = await AuthService(user_repo=user_repo).get_principal(user_id)
     return user
 
 CurrentUserDep = Annotated[User, Depends(get_current_user_from_token)]
 
 
 async def get_optional_current_user(
+        request: Request,
         user_repo: UserRepositoryDep,
     token_details: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False))
@@ -51,15 +55,15 @@ async def get_optional_current_user(
     if not token_details:
         return None
 
-    user_data = verify_access_token(token_details.credentials)
+    user_data = decode_access_token(request, token_details.credentials)
     if not user_data:
         return None
 
-    user_email = user_data.get("user", {}).get("email")
-    if not user_email:
+    user_id = user_data.get("user", {}).get("user_id")
+    if not user_id:
         return None
 
-    user = await AuthService(user_repo=user_repo).get_user_by_email(user_email)
+    user = await AuthService(user_repo=user_repo).get_principal(user_id)
     return user
 
 OptionalCurrentUserDep = Annotated[Optional[User], Depends(
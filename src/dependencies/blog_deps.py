@@ -8,11 +8,18 @@ file_service = FileService()
 
 
 async def blog_data_with_image(
-    cover_image: UploadFile = Form(..., alias="coverImage"),
+    cover_image: UploadFile | None = Form(None, alias="coverImage"),
+    # A direct upload's imageUrl, instead of sending the file itself
+    cover_image_url: str | None = Form(None, alias="coverImageUrl"),
     title: str = Form(...),
     body: str = Form(...)
 ) -> AddBlogPostPayload:
-    image_path = await file_service.save_uploaded_file(file=cover_image)
+    if cover_image is not None:
+        image_path = await file_service.save_uploaded_file(file=cover_image)
+    elif cover_image_url:
+        image_path = await file_service.claim_direct_upload(cover_image_url)
+    else:
+        raise ValidationError("coverImage or coverImageUrl must be provided.")
     return AddBlogPostPayload(
         title=title,
         body=body,
@@ -24,6 +31,7 @@ BlogDataDep = Annotated[AddBlogPostPayload, Depends(blog_data_with_image)]
 
 async def update_blog_data(
     cover_image: UploadFile | None = Form(None, alias="coverImage"),
+    cover_image_url: str | None = Form(None, alias="coverImageUrl"),
     title: str | None = Form(None),
     body: str | None = Form(None)
 ) -> UpdateBlogPostPayload:
@@ -31,15 +39,18 @@ async def update_blog_data(
     body = body.strip() if body and body.strip() else None
     if not any([
         cover_image and cover_image.filename,
+        cover_image_url,
         title,
         body
     ]):
         raise ValidationError(
-            "At least one field (coverImage, title, or body) must be provided.")
+            "At least one field (coverImage, coverImageUrl, title, or body) must be provided.")
 
     image_path = None
     if cover_image and cover_image.filename:
         image_path = await file_service.save_uploaded_file(file=cover_image)
+    elif cover_image_url:
+        image_path = await file_service.claim_direct_upload(cover_image_url)
     return UpdateBlogPostPayload(
         title=title,
         body=body,
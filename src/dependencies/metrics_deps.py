@@ -0,0 +1,25 @@
+import secrets
+from fastapi import Request, status
+from fastapi.exceptions import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from src.config import config
+
+
+class MetricsTokenBearer(HTTPBearer):
+    def __init__(self, auto_error: bool = True):
+        super().__init__(auto_error=auto_error)
+
+    async def __call__(self, request: Request) -> HTTPAuthorizationCredentials:
+        creds = await super().__call__(request)
+        if creds is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated"
+            )
+        # An unset token never matches, even if the router is mounted some other way
+        if not config.METRICS_TOKEN or not secrets.compare_digest(
+                creds.credentials.encode(), config.METRICS_TOKEN.encode()):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid metrics token"
+            )
+        return creds
@@ -1,35 +1,76 @@
-from typing import Annotated
-from fastapi import Depends
+from collections.abc import AsyncGenerator
+from typing import Annotated, Optional
+from fastapi import Depends, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db.main import get_session
+from src.config import config
+from src.db.main import async_session_maker, replica_engine, replica_session_maker
+from src.db.routing import ReadYourWritesTracker
+from src.exceptions import BlogAPIException
 from src.repositories.user_repository import UserRepository
 from src.repositories.blog_repository import BlogRepository
 from src.repositories.comment_repository import CommentRepository
 from src.repositories.blog_like_repository import BlogLikeRepository
+from .token_deps import bearer_token, decode_access_token
 
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
 
-def get_user_repository(
-    session: Annotated[AsyncSession, Depends(get_session)]
-) -> UserRepository:
+write_tracker = ReadYourWritesTracker(
+    window_seconds=config.REPLICA_READ_YOUR_WRITES_SECONDS)
+
+
+def _request_principal_id(request: Request) -> Optional[str]:
+    token = bearer_token(request)
+    if token is None:
+        return None
+    try:
+        payload = decode_access_token(request, token)
+    except BlogAPIException:
+        return None
+    return (payload or {}).get("user", {}).get("user_id")
+
+
+async def get_routed_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only requests go to the replica unless the caller wrote recently; everything else to the primary."""
+    if replica_engine is None:
+        async with async_session_maker() as session:
+            yield session
+        return
+
+    principal_id = _request_principal_id(request)
+    is_read = request.method in READ_ONLY_METHODS
+    if is_read and not (principal_id and write_tracker.recently_wrote(principal_id)):
+        async with replica_session_maker() as session:
+            yield session
+        return
+
+    if principal_id and not is_read:
+        write_tracker.record_write(principal_id)
+    try:
+        async with async_session_maker() as session:
+            yield session
+    finally:
+        # Restart the window once the write has finished
+        if principal_id and not is_read:
+            write_tracker.record_write(principal_id)
+
+
+SessionDep = Annotated[AsyncSession, Depends(get_routed_session)]
+
+
+def get_user_repository(session: SessionDep) -> UserRepository:
     return UserRepository(session)
 
 
-def get_blog_repository(
-    session: Annotated[AsyncSession, Depends(get_session)]
-) -> BlogRepository:
+def get_blog_repository(session: SessionDep) -> BlogRepository:
     return BlogRepository(session)
 
 
-def get_comment_repository(
-    session: Annotated[AsyncSession, Depends(get_session)]
-) -> CommentRepository:
+def get_comment_repository(session: SessionDep) -> CommentRepository:
     return CommentRepository(session)
 
 
-def get_blog_like_repository(
-    session: Annotated[AsyncSession, Depends(get_session)]
-) -> BlogLikeRepository:
+def get_blog_like_repository(session: SessionDep) -> BlogLikeRepository:
     return BlogLikeRepository(session)
 
 
@@ -0,0 +1,34 @@
+from typing import Any, Optional
+from fastapi import Request
+
+from src.exceptions import BlogAPIException
+from src.utils import verify_access_token
+
+
+def decode_access_token(request: Request, token: str) -> Optional[dict[str, Any]]:
+    """verify_access_token, decoded at most once per request.
+
+    The bearer check, the current-user dependency and session routing all
+    need the claims; the outcome (payload or error) is kept on
+    request.state and replayed for later callers.
+    """
+    cached = getattr(request.state, "access_token", None)
+    if cached is not None and cached[0] == token:
+        outcome = cached[1]
+    else:
+        try:
+            outcome = verify_access_token(token)
+        except BlogAPIException as exc:
+            outcome = exc
+        request.state.access_token = (token, outcome)
+
+    if isinstance(outcome, BlogAPIException):
+        raise outcome
+    return outcome
+
+
+def bearer_token(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
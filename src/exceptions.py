@@ -70,6 +70,18 @@ class FileValidationError(ValidationError):
             "jpg", "jpeg", "png"], "max_size": "1MB"})
 
 
+class UnsupportedOperationError(BlogAPIException):
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=501)
+
+
+class ServiceUnavailableError(BlogAPIException):
+
+    def __init__(self, message: str = "Service temporarily unavailable, try again shortly"):
+        super().__init__(message, status_code=503)
+
+
 # Database Exceptions
 class DatabaseError(BlogAPIException):
 
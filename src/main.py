@@ -1,17 +1,58 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from datetime import datetime
 from src.middleware import register_logging_middleware
 from src.error_handlers import register_exception_handlers
-from .routes.blog_routes import blog_router
+from .routes.blog_routes import blog_router, warm_blog_list_cache
 from .routes.auth_routes import auth_router
+from .routes.metrics_routes import metrics_router
+from .routes.storage_routes import storage_router
+from .db.main import async_session_maker
+from .services.like_counters import like_counter
+from .password_hasher import password_hasher
+from .static_files import CachedStaticFiles
+from .services.image_derivatives import image_pipeline
+from .services.upload_reaper import upload_reaper
+from .config import config
+
+logger = logging.getLogger(__name__)
 
 version = "v1"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Flushes buffered like counts or compacts counter shards, depending on LIKE_COUNT_MODE
+    job = like_counter.maintenance_job()
+    job_task = None
+    if job is not None:
+        job_task = asyncio.create_task(job.run(async_session_maker))
+    # Deletes unreferenced uploads; requests never delete files themselves
+    reaper_task = asyncio.create_task(upload_reaper.run(async_session_maker))
+    try:
+        # The first pages are in the cache before the first request arrives
+        await warm_blog_list_cache(config.BLOG_LIST_CACHE_WARM_PAGES)
+    except Exception:
+        logger.exception("Failed to warm the blog list cache")
+    try:
+        yield
+    finally:
+        upload_reaper.stop()
+        await reaper_task
+        if job is not None and job_task is not None:
+            # run() does a final pass before it returns
+            job.stop()
+            await job_task
+        password_hasher.shutdown()
+        image_pipeline.shutdown()
+
 app = FastAPI(
     title="blog-backend-fastapi",
     description="A REST API for a blog web service",
-    version=version
+    version=version,
+    lifespan=lifespan
 )
 
 # Register middleware and exception handlers
@@ -28,7 +69,10 @@ async def health_check():
         "version": version
     }
 
-app.mount("/images", StaticFiles(directory="images"), name="images")
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount("/images", CachedStaticFiles(directory="images"), name="images")
+app.mount("/uploads", CachedStaticFiles(directory="uploads"), name="uploads")
 app.include_router(blog_router, prefix="/blogs", tags=['blogs'])
 app.include_router(auth_router, prefix="/user", tags=['auth'])
+if config.METRICS_TOKEN:
+    app.include_router(metrics_router, prefix="/metrics", tags=['metrics'])
+app.include_router(storage_router, prefix="/storage", tags=['storage'])
@@ -1,13 +1,63 @@
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
 from typing import Callable, Awaitable
 import logging
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
+from src.config import config
+
 logger = logging.getLogger('uvicorn.access')
 logger.disabled = True
 
+PAYLOAD_TOO_LARGE_DETAIL = "Request body too large"
+
+
+class RequestBodyLimitMiddleware:
+    """Rejects request bodies larger than max_body_bytes with 413.
+
+    A declared Content-Length over the limit is refused before any of the
+    body is read; a chunked body is cut off as soon as the bytes received
+    pass the limit, so an oversized upload is never fully buffered.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() \
+                and int(content_length) > self.max_body_bytes:
+            response = JSONResponse(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                content={"detail": PAYLOAD_TOO_LARGE_DETAIL})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # FastAPI passes HTTPException through body parsing unchanged
+                    raise HTTPException(
+                        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                        detail=PAYLOAD_TOO_LARGE_DETAIL)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
 
 def register_logging_middleware(app: FastAPI):
     @app.middleware("http")
@@ -28,6 +78,9 @@ def register_logging_middleware(app: FastAPI):
 
         return response
 
+    app.add_middleware(RequestBodyLimitMiddleware,
+                       max_body_bytes=config.MAX_REQUEST_BODY_BYTES)
+
     app.add_middleware(CORSMiddleware,
                        allow_origins=[
                            "https://blog-frontend-pi-nine.vercel.app", "http://localhost:3000", "http://localhost:3001"],
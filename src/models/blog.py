@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlmodel import Field, Relationship, Column
 import sqlalchemy.dialects.postgresql as pg
-from sqlalchemy import func
+from sqlalchemy import func, Index
 import uuid
 from .base_model import BaseModel
 
@@ -52,16 +52,27 @@ class Blog(BaseModel, table=True):
         )
     )
 
-    # Relationships
+    __table_args__ = (
+        # Serves ORDER BY created_at for the blog list
+        Index("ix_blogs_created_at_id", "created_at", "id"),
+        Index("ix_blogs_created_by", "created_by"),
+        # Counts references to a shared upload before it is deleted
+        Index("ix_blogs_cover_image_url", "cover_image_url"),
+    )
+
+    # Relationships never load implicitly; repositories pick a loading profile.
+    # The database cascades deletes, so the ORM never loads children to delete them.
     author: "User" = Relationship(
-        back_populates="blogs", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="blogs", sa_relationship_kwargs={"lazy": "raise"})
     likes: list["BlogLike"] = Relationship(
         back_populates="blog",
-        sa_relationship_kwargs={"lazy": "selectin"},
-        cascade_delete=True
+        sa_relationship_kwargs={"lazy": "raise"},
+        cascade_delete=True,
+        passive_deletes=True
     )
     comments: list["Comment"] = Relationship(
         back_populates="blog",
-        sa_relationship_kwargs={"lazy": "selectin"},
-        cascade_delete=True
+        sa_relationship_kwargs={"lazy": "raise"},
+        cascade_delete=True,
+        passive_deletes=True
     )
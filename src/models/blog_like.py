@@ -2,7 +2,7 @@ from datetime import datetime
 from .base_model import BaseModel
 from sqlmodel import Field, Column, Relationship
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
-from sqlalchemy import func, UniqueConstraint, ForeignKey
+from sqlalchemy import func, UniqueConstraint, ForeignKey, Index, text
 import uuid
 from typing import TYPE_CHECKING
 
@@ -51,10 +51,17 @@ class BlogLike(BaseModel, table=True):
 
     __table_args__ = (
         UniqueConstraint("blog_id", "user_id", name="uq_blog_user_like"),
+        # Liked rows only: like lookups and liker lists never read unliked rows
+        Index(
+            "ix_blog_likes_liked_blog_id_user_id",
+            "blog_id",
+            "user_id",
+            postgresql_where=text("is_liked"),
+        ),
     )
 
-    # Relationships
+    # Relationships never load implicitly; repositories pick a loading profile
     blog: "Blog" = Relationship(
-        back_populates="likes",  sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="likes",  sa_relationship_kwargs={"lazy": "raise"})
     user: "User" = Relationship(
-        back_populates="blog_likes",  sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="blog_likes",  sa_relationship_kwargs={"lazy": "raise"})
@@ -0,0 +1,23 @@
+import uuid
+from sqlmodel import SQLModel, Field, Column
+from sqlalchemy import ForeignKey
+import sqlalchemy.dialects.postgresql as pg
+
+
+class BlogLikeCounter(SQLModel, table=True):
+    """One shard of a blog's like count delta, not yet folded into blogs.like_count."""
+    __tablename__ = "blog_like_counters"  # type: ignore[arg-type]
+
+    blog_id: uuid.UUID = Field(
+        sa_column=Column(
+            pg.UUID(as_uuid=True),
+            ForeignKey("blogs.id", ondelete="CASCADE"),
+            primary_key=True
+        )
+    )
+    shard: int = Field(
+        sa_column=Column(pg.SMALLINT, primary_key=True)
+    )
+    delta: int = Field(
+        sa_column=Column(pg.BIGINT, nullable=False, server_default="0")
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlmodel import Field, Relationship, Column
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
-from sqlalchemy import func, ForeignKey
+from sqlalchemy import func, ForeignKey, Index
 import uuid
 from .base_model import BaseModel
 
@@ -54,8 +54,12 @@ class Comment(BaseModel, table=True):
         )
     )
 
-    # Relationships
+    __table_args__ = (
+        Index("ix_comments_blog_id_created_at", "blog_id", "created_at", "id"),
+    )
+
+    # Relationships never load implicitly; repositories pick a loading profile
     author: "User" = Relationship(
-        back_populates="comments", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="comments", sa_relationship_kwargs={"lazy": "raise"})
     blog: "Blog" = Relationship(
-        back_populates="comments", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="comments", sa_relationship_kwargs={"lazy": "raise"})
@@ -0,0 +1,12 @@
+from sqlmodel import SQLModel, Field, Column
+import sqlalchemy.dialects.postgresql as pg
+
+
+class TableCounter(SQLModel, table=True):
+    """Exact row count of a table, maintained by its repository on create/delete."""
+    __tablename__ = "table_counters"  # type: ignore[arg-type]
+
+    table_name: str = Field(primary_key=True)
+    row_count: int = Field(
+        sa_column=Column(pg.BIGINT, nullable=False, server_default="0")
+    )
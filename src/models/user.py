@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from sqlmodel import Field, Relationship
 import sqlalchemy.dialects.postgresql as pg
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index, text
 from sqlalchemy.sql import func
 import uuid
 from .base_model import BaseModel
@@ -51,12 +51,19 @@ class User(BaseModel, table=True):
             onupdate=func.now()
         )
     )
+
+    __table_args__ = (
+        Index("uq_users_email_lower", text("lower(email)"), unique=True),
+        Index("ix_users_profile_image_url", "profile_image_url"),
+    )
+
+    # Relationships never load implicitly; repositories pick a loading profile
     blogs: list["Blog"] = Relationship(
-        back_populates="author", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="author", sa_relationship_kwargs={"lazy": "raise"})
     blog_likes: list["BlogLike"] = Relationship(
-        back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise"})
     comments: list["Comment"] = Relationship(
-        back_populates="author", sa_relationship_kwargs={"lazy": "selectin"})
+        back_populates="author", sa_relationship_kwargs={"lazy": "raise"})
 
     def __repr__(self) -> str:
         return f"<User {self.email}>"
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, Optional, TypeVar
+
+from src.config import config
+from src.exceptions import ServiceUnavailableError
+from src.metrics import Histogram
+from src.utils import generate_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+    # Runs in the worker; time.monotonic is shared by threads and processes on one host
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic() - started
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification on a bounded executor, off the event loop.
+
+    At most `workers` calls run at once and `max_queue` more may wait; beyond
+    that a call fails fast with ServiceUnavailableError (503) instead of
+    piling up behind a login burst.
+    """
+
+    def __init__(self, executor_kind: Literal["thread", "process"], workers: int, max_queue: int):
+        self.executor_kind = executor_kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_wait = Histogram()
+        self.hash_time = Histogram()
+        self.rejected = 0
+        self._in_flight = 0
+        self._executor: Optional[Executor] = None
+
+    async def hash(self, password: str) -> str:
+        return await self._run(generate_password_hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(verify_password, password, password_hash)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceUnavailableError("Too many sign-in attempts in progress, try again shortly")
+
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        job = self._get_executor().submit(_timed_call, fn, *args)
+        self._in_flight += 1
+        # Released when the job itself ends, not when the caller stops waiting:
+        # a cancelled request leaves a started bcrypt call running in the pool
+        job.add_done_callback(lambda _: self._release(loop))
+        result, started, elapsed = await asyncio.wrap_future(job)
+        self.queue_wait.observe(max(started - submitted, 0.0))
+        self.hash_time.observe(elapsed)
+        return result
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Called on a pool thread, or the submitting thread if the job was cancelled
+        try:
+            loop.call_soon_threadsafe(self._finished)
+        except RuntimeError:
+            # The loop has closed; nothing is left to admit
+            pass
+
+    def _finished(self) -> None:
+        self._in_flight -= 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher")
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "rejected": self.rejected,
+            "queue_wait_seconds": self.queue_wait.snapshot(),
+            "hash_seconds": self.hash_time.snapshot(),
+        }
+
+
+password_hasher = PasswordHasher(
+    executor_kind=config.PASSWORD_HASH_EXECUTOR,
+    workers=config.PASSWORD_HASH_WORKERS,
+    max_queue=config.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -8,6 +8,8 @@ from .user_repository import UserRepository
 from .blog_repository import BlogRepository
 from .comment_repository import CommentRepository
 from .blog_like_repository import BlogLikeRepository
+from .image_reference_repository import ImageReferenceRepository
+from .loading_profiles import LoadingProfile
 
 __all__ = [
     "BaseRepository",
@@ -15,4 +17,6 @@ __all__ = [
     "BlogRepository",
     "CommentRepository",
     "BlogLikeRepository",
+    "ImageReferenceRepository",
+    "LoadingProfile",
 ]
@@ -4,6 +4,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.models.base_model import BaseModel
+from .loading_profiles import LoadingProfile, loader_options
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
@@ -20,8 +21,12 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(obj)
         return obj
 
-    async def get_by_id(self, id: UUID | str) -> Optional[ModelType]:
+    async def get_by_id(
+        self, id: UUID | str, profile: Optional[LoadingProfile] = None
+    ) -> Optional[ModelType]:
         statement = select(self.model).where(self.model.id == id)
+        if profile is not None:
+            statement = statement.options(*loader_options(profile))
         result = await self.session.exec(statement)
         return result.first()
 
@@ -1,46 +1,160 @@
 
-from typing import List
+from typing import NamedTuple, Optional
 from uuid import UUID, uuid4
-from sqlmodel import select
+from sqlmodel import delete, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy import func
+from sqlalchemy import exists, func, literal
 from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models.blog import Blog
 from src.models.blog_like import BlogLike
+from src.models.blog_like_counter import BlogLikeCounter
+from src.models.user import User
 from .base import BaseRepository
 
 
+class Liker(NamedTuple):
+    """The user columns a liker list shows."""
+    id: UUID
+    name: str
+    profile_image_url: str
+
+
 class BlogLikeRepository(BaseRepository[BlogLike]):
 
     def __init__(self, session: AsyncSession):
         super().__init__(BlogLike, session)
 
-    async def get_like_status(self, blog_id: str, user_id: UUID) -> bool:
-        stmt = select(BlogLike.is_liked).where(
-            (BlogLike.blog_id == blog_id) & (BlogLike.user_id == user_id)
-        )
+    async def has_liked(self, blog_id: UUID | str, user_id: UUID) -> bool:
+        # Answered from the partial (blog_id, user_id) WHERE is_liked index
+        stmt = select(exists().where(
+            (BlogLike.blog_id == blog_id)
+            & (BlogLike.user_id == user_id)
+            & (BlogLike.is_liked == True)
+        ))
         result = await self.session.exec(stmt)
-        return result.first() or False
-
-    async def upsert(self, blog_id: str, user_id: UUID, is_liked: bool) -> None:
-        stmt = (
-            pg_insert(BlogLike)
-            .values(
-                id=uuid4(),
-                blog_id=blog_id,
-                user_id=user_id,
-                is_liked=is_liked
-            )
-            .on_conflict_do_update(
+        return bool(result.one())
+
+    async def set_like_status(
+        self, blog_id: UUID | str, user_id: UUID, is_liked: bool,
+        adjust_count: bool = True, shard: Optional[int] = None
+    ) -> Optional[bool]:
+        """Records the user's like state and adjusts blogs.like_count in one statement.
+
+        Returns None when the blog does not exist, otherwise whether the
+        state changed. The upsert locks the (blog, user) like row, so
+        concurrent toggles by the same user are applied one after another
+        and each transition is counted exactly once. With a shard the
+        change goes to that blog_like_counters row instead of the blog row;
+        with adjust_count off the caller is responsible for the counter.
+        """
+        target = select(Blog.id).where(Blog.id == blog_id).cte("target")
+
+        # Unliking something never liked has nothing to record
+        existing = select(BlogLike.id).where(
+            (BlogLike.blog_id == target.c.id) & (BlogLike.user_id == user_id))
+        insert_stmt = pg_insert(BlogLike).from_select(
+            ["id", "blog_id", "user_id", "is_liked"],
+            select(
+                literal(uuid4()), target.c.id, literal(user_id), literal(is_liked)
+            ).where(literal(is_liked) | exists(existing)),
+        )
+        changed = (
+            insert_stmt.on_conflict_do_update(
                 index_elements=["blog_id", "user_id"],
-                set_={"is_liked": is_liked, "updated_at": func.now()},
+                set_={"is_liked": insert_stmt.excluded.is_liked,
+                      "updated_at": func.now()},
+                where=BlogLike.is_liked.is_distinct_from(  # type: ignore[attr-defined]
+                    insert_stmt.excluded.is_liked),
+            )
+            .returning(BlogLike.blog_id)
+            .cte("changed")
+        )
+
+        # The transition is reported from the last step that ran
+        outcome = changed.c.blog_id
+        delta = 1 if is_liked else -1
+        if adjust_count and shard is not None:
+            shard_insert = pg_insert(BlogLikeCounter).from_select(
+                ["blog_id", "shard", "delta"],
+                select(changed.c.blog_id, literal(shard), literal(delta)),
             )
+            counted = (
+                shard_insert.on_conflict_do_update(
+                    index_elements=["blog_id", "shard"],
+                    set_={"delta": BlogLikeCounter.delta + shard_insert.excluded.delta},
+                )
+                .returning(BlogLikeCounter.blog_id)
+                .cte("counted")
+            )
+            outcome = counted.c.blog_id
+        elif adjust_count:
+            counted = (
+                update(Blog)
+                .where(Blog.id.in_(select(changed.c.blog_id)))  # type: ignore[attr-defined]
+                .values(like_count=func.greatest(Blog.like_count + delta, 0))
+                .returning(Blog.id)
+                .cte("counted")
+            )
+            outcome = counted.c.id
+
+        stmt = select(
+            exists(select(target.c.id)).label("found"),
+            exists(select(outcome)).label("changed"),
         )
-        await self.session.exec(stmt)
+        result = await self.session.exec(stmt)  # type: ignore[call-overload]
+        found, state_changed = result.one()
         await self.session.commit()
+        return state_changed if found else None
+
+    async def sum_counter_shards(self, blog_id: UUID | str) -> int:
+        """Likes recorded in counter shards and not yet folded into blogs.like_count."""
+        result = await self.session.exec(
+            select(func.coalesce(func.sum(BlogLikeCounter.delta), 0))
+            .where(BlogLikeCounter.blog_id == blog_id)
+        )
+        return int(result.one())
+
+    async def fold_counter_shards(self) -> int:
+        """Moves every shard's delta into blogs.like_count; returns how many blogs changed.
+
+        The shards are deleted in the same statement, so a toggle that
+        lands meanwhile waits on the row lock and then starts a new shard.
+        """
+        folded = delete(BlogLikeCounter).returning(
+            BlogLikeCounter.blog_id, BlogLikeCounter.delta).cte("folded")
+        sums = (
+            select(folded.c.blog_id, func.sum(folded.c.delta).label("delta"))
+            .group_by(folded.c.blog_id)
+            .cte("sums")
+        )
+        applied = (
+            update(Blog)
+            .where(Blog.id == sums.c.blog_id)
+            .values(like_count=func.greatest(Blog.like_count + sums.c.delta, 0))
+            .returning(Blog.id)
+            .cte("applied")
+        )
+        result = await self.session.exec(
+            select(func.count()).select_from(applied))
+        blogs_changed = result.one()
+        await self.session.commit()
+        return blogs_changed
+
+    async def get_likers_page(
+        self, blog_id: UUID | str, after_user_id: Optional[UUID], limit: int
+    ) -> list[Liker]:
+        """Users who like the blog, ordered by user id, strictly after the anchor.
 
-    async def get_likes_for_blog(self, blog_id: str) -> List[BlogLike]:
-        statement = select(BlogLike).where(
-            (BlogLike.blog_id == blog_id) & (BlogLike.is_liked == True)
+        Walks the partial (blog_id, user_id) WHERE is_liked index and joins
+        each liker's user row by primary key.
+        """
+        statement = (
+            select(User.id, User.name, User.profile_image_url)
+            .join(BlogLike, BlogLike.user_id == User.id)  # type: ignore[arg-type]
+            .where((BlogLike.blog_id == blog_id) & (BlogLike.is_liked == True))
         )
+        if after_user_id is not None:
+            statement = statement.where(BlogLike.user_id > after_user_id)
+        statement = statement.order_by(BlogLike.user_id).limit(limit)
         result = await self.session.exec(statement)
-        return list(result.all())
+        return [Liker._make(row) for row in result]
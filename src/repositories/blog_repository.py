@@ -1,45 +1,137 @@
-from typing import Optional, Tuple
-from sqlmodel import select, desc, func
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import Integer, Select, column, exists, func, tuple_, values
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlmodel import select, desc, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.models.blog import Blog
+from src.models.table_counter import TableCounter
 from .base import BaseRepository
+from .count_strategies import CountStrategy, blog_count_strategy
+from .loading_profiles import LoadingProfile
+
+
+class BlogCard(NamedTuple):
+    """The columns a blog list shows, read without building ORM instances."""
+    id: UUID
+    title: str
+    cover_image_url: str
+    created_at: datetime
+
+
+BLOG_CARD_COLUMNS = (Blog.id, Blog.title, Blog.cover_image_url, Blog.created_at)
 
 
 class BlogRepository(BaseRepository[Blog]):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, count_strategy: Optional[CountStrategy] = None):
         super().__init__(Blog, session)
+        self.count_strategy = count_strategy or blog_count_strategy
+
+    async def create(self, obj: Blog) -> Blog:
+        # Committed together with the insert by the base implementation
+        await self._adjust_row_count(1)
+        return await super().create(obj)
+
+    async def delete_by_id(self, id: UUID | str) -> bool:
+        obj = await self.get_by_id(id)
+        if not obj:
+            return False
+
+        await self._adjust_row_count(-1)
+        await self.session.delete(obj)
+        await self.session.commit()
+        return True
+
+    async def _adjust_row_count(self, delta: int) -> None:
+        await self.session.exec(
+            update(TableCounter)
+            .where(TableCounter.table_name == Blog.__tablename__)
+            .values(row_count=TableCounter.row_count + delta)
+        )
+
+    async def apply_like_deltas(self, deltas: dict[UUID, int]) -> None:
+        """Adds each delta to its blog's like_count in a single UPDATE ... FROM (VALUES ...)."""
+        rows = values(
+            column("id", PgUUID(as_uuid=True)), column("delta", Integer),
+            name="deltas"
+        ).data(sorted(deltas.items()))
+        await self.session.exec(
+            update(Blog)
+            .where(Blog.id == rows.c.id)
+            .values(like_count=func.greatest(Blog.like_count + rows.c.delta, 0))
+        )
+        await self.session.commit()
 
     async def get_all_ordered_by_date(self) -> list[Blog]:
         statement = select(Blog).order_by(desc(Blog.created_at))
         result = await self.session.exec(statement)
         return list(result.all())
 
+    async def count(self) -> int:
+        return await self.count_strategy.count(self.session, Blog)
+
     async def get_paginated_blogs(
         self,
         page: int = 1,
-        page_size: int = 9
-    ) -> Tuple[list[Blog], int]:
+        page_size: int = 9,
+        include_total: bool = True
+    ) -> Tuple[list[BlogCard], Optional[int]]:
+        """Returns up to page_size + 1 cards, for split_page."""
         offset = (page - 1) * page_size
 
-        # Get total count
-        count_statement = select(func.count()).select_from(Blog)
-        count_result = await self.session.exec(count_statement)
-        total_count = count_result.one()
+        total_count = await self.count() if include_total else None
 
         # Get paginated blogs
         statement = (
-            select(Blog)
-            .order_by(desc(Blog.created_at))
+            select(*BLOG_CARD_COLUMNS)
+            .order_by(desc(Blog.created_at), desc(Blog.id))
             .offset(offset)
-            .limit(page_size)
+            .limit(page_size + 1)
         )
+        return await self._fetch_cards(statement), total_count
+
+    async def get_blogs_by_keyset(
+        self,
+        anchor: Optional[Tuple[datetime, UUID]],
+        limit: int,
+        backwards: bool = False
+    ) -> list[BlogCard]:
+        """Newest-first blog cards strictly older than the anchor, or strictly newer when backwards.
+
+        Backwards pages hold the `limit` blogs closest to the anchor. Both
+        directions are a range scan on the (created_at, id) index.
+        """
+        key = tuple_(Blog.created_at, Blog.id)
+        statement = select(*BLOG_CARD_COLUMNS)
+        if anchor is not None:
+            # A plain tuple is bound with the column types of the key
+            statement = statement.where(
+                key > anchor if backwards else key < anchor)
+        if backwards:
+            statement = statement.order_by(Blog.created_at, Blog.id)
+        else:
+            statement = statement.order_by(
+                desc(Blog.created_at), desc(Blog.id))
+        blogs = await self._fetch_cards(statement.limit(limit))
+        if backwards:
+            blogs.reverse()
+        return blogs
+
+    async def _fetch_cards(self, statement: Select) -> list[BlogCard]:
         result = await self.session.exec(statement)
-        blogs = list(result.all())
-        return blogs, total_count
+        return [BlogCard._make(row) for row in result]
 
     async def get_by_id_with_relationships(self, blog_id: str) -> Optional[Blog]:
-        return await self.get_by_id(blog_id)
+        return await self.get_by_id(blog_id, LoadingProfile.BLOG_DETAIL)
+
+    async def get_like_count(self, blog_id: UUID | str) -> Optional[int]:
+        """The stored like_count, or None when the blog does not exist."""
+        result = await self.session.exec(
+            select(Blog.like_count).where(Blog.id == blog_id))
+        return result.first()
 
     async def exists(self, blog_id: str) -> bool:
-        blog = await self.get_by_id(blog_id)
-        return blog is not None
+        result = await self.session.exec(
+            select(exists().where(Blog.id == blog_id)))
+        return bool(result.one())
@@ -1,9 +1,38 @@
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import tuple_
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.models.comment import Comment
 from .base import BaseRepository
+from .loading_profiles import LoadingProfile, loader_options
 
 
 class CommentRepository(BaseRepository[Comment]):
 
     def __init__(self, session: AsyncSession):
         super().__init__(Comment, session)
+
+    async def get_comments_page(
+        self,
+        blog_id: UUID | str,
+        after: Optional[Tuple[datetime, UUID]],
+        limit: int
+    ) -> list[Comment]:
+        """Oldest-first comments of a blog, with their authors, strictly after the anchor.
+
+        A range scan on the (blog_id, created_at, id) index.
+        """
+        statement = (
+            select(Comment)
+            .where(Comment.blog_id == blog_id)
+            .options(*loader_options(LoadingProfile.COMMENT_WITH_AUTHOR))
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(Comment.created_at, Comment.id) > after)
+        statement = statement.order_by(
+            Comment.created_at, Comment.id).limit(limit)
+        result = await self.session.exec(statement)
+        return list(result.all())
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from sqlalchemy import text
+from sqlmodel import SQLModel, select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import config
+from src.models.table_counter import TableCounter
+
+
+class CountStrategy(ABC):
+    """How a listing obtains the total number of rows in its table."""
+
+    @abstractmethod
+    async def count(self, session: AsyncSession, model: type[SQLModel]) -> int:
+        ...
+
+
+class ExactCount(CountStrategy):
+    """count(*) on every call; always correct, but a full scan on PostgreSQL."""
+
+    async def count(self, session: AsyncSession, model: type[SQLModel]) -> int:
+        result = await session.exec(select(func.count()).select_from(model))
+        return result.one()
+
+
+class CounterTableCount(CountStrategy):
+    """Reads the row maintained in table_counters; exact and a single primary key lookup."""
+
+    def __init__(self, fallback: CountStrategy | None = None):
+        self.fallback = fallback or ExactCount()
+
+    async def count(self, session: AsyncSession, model: type[SQLModel]) -> int:
+        statement = select(TableCounter.row_count).where(
+            TableCounter.table_name == model.__tablename__)
+        result = await session.exec(statement)
+        row_count = result.first()
+        if row_count is None:
+            return await self.fallback.count(session, model)
+        return row_count
+
+
+class PlannerEstimateCount(CountStrategy):
+    """The planner's estimate from pg_class.reltuples; approximate between ANALYZE runs."""
+
+    def __init__(self, fallback: CountStrategy | None = None):
+        self.fallback = fallback or ExactCount()
+
+    async def count(self, session: AsyncSession, model: type[SQLModel]) -> int:
+        statement = text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(:table_name)"
+        ).bindparams(table_name=model.__tablename__)
+        result = await session.exec(statement)  # type: ignore[call-overload]
+        estimate = result.scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        if estimate is None or estimate < 0:
+            return await self.fallback.count(session, model)
+        return estimate
+
+
+class CachedExactCount(CountStrategy):
+    """An exact count reused for ttl_seconds, so at most one scan per table per TTL."""
+
+    def __init__(self, ttl_seconds: float, source: CountStrategy | None = None):
+        self.ttl_seconds = ttl_seconds
+        self.source = source or ExactCount()
+        self._cache: dict[str, tuple[int, float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def count(self, session: AsyncSession, model: type[SQLModel]) -> int:
+        table_name = str(model.__tablename__)
+        cached = self._fresh(table_name)
+        if cached is not None:
+            return cached
+
+        async with self._lock:
+            # Another request may have refreshed it while we waited
+            cached = self._fresh(table_name)
+            if cached is not None:
+                return cached
+            total = await self.source.count(session, model)
+            self._cache[table_name] = (total, time.monotonic() + self.ttl_seconds)
+            return total
+
+    def _fresh(self, table_name: str) -> int | None:
+        cached = self._cache.get(table_name)
+        if cached is None or cached[1] <= time.monotonic():
+            return None
+        return cached[0]
+
+
+def count_strategy_from_config() -> CountStrategy:
+    strategies: dict[str, CountStrategy] = {
+        "exact": ExactCount(),
+        "counter": CounterTableCount(),
+        "estimate": PlannerEstimateCount(),
+        "cached": CachedExactCount(ttl_seconds=config.BLOG_COUNT_CACHE_TTL),
+    }
+    return strategies[config.BLOG_COUNT_STRATEGY]
+
+
+blog_count_strategy = count_strategy_from_config()
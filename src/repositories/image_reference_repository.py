@@ -0,0 +1,28 @@
+from sqlmodel import select, union
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.models.blog import Blog
+from src.models.user import User
+
+
+class ImageReferenceRepository:
+    """Finds which uploaded files rows still point at.
+
+    Uploads are content addressed, so identical images share one file; a
+    file no blog or user references can be deleted.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def referenced_urls(self, image_urls: list[str]) -> set[str]:
+        if not image_urls:
+            return set()
+        # Both lookups are answered from the image URL indexes
+        statement = union(
+            select(Blog.cover_image_url).where(
+                Blog.cover_image_url.in_(image_urls)),  # type: ignore[attr-defined]
+            select(User.profile_image_url).where(
+                User.profile_image_url.in_(image_urls)),  # type: ignore[union-attr]
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars().all())
@@ -0,0 +1,41 @@
+"""
+Named loading profiles for repository queries.
+
+Every relationship is declared with lazy="raise", so touching one that a
+query did not load fails loudly instead of issuing a hidden query. A
+repository method that needs related rows applies one of these profiles,
+which keeps the statements and rows fetched per endpoint fixed.
+"""
+from enum import Enum
+
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.models.blog import Blog
+from src.models.comment import Comment
+
+
+class LoadingProfile(str, Enum):
+    # The authenticated user's own columns, nothing they own
+    AUTH_PRINCIPAL = "auth_principal"
+    # A blog with its author; comments and likes are paged separately
+    BLOG_DETAIL = "blog_detail"
+    # A comment with its author
+    COMMENT_WITH_AUTHOR = "comment_with_author"
+
+
+LOADING_PROFILES: dict[LoadingProfile, tuple[ExecutableOption, ...]] = {
+    LoadingProfile.AUTH_PRINCIPAL: (
+        raiseload("*"),
+    ),
+    LoadingProfile.BLOG_DETAIL: (
+        joinedload(Blog.author),  # type: ignore[arg-type]
+    ),
+    LoadingProfile.COMMENT_WITH_AUTHOR: (
+        joinedload(Comment.author),  # type: ignore[arg-type]
+    ),
+}
+
+
+def loader_options(profile: LoadingProfile) -> tuple[ExecutableOption, ...]:
+    return LOADING_PROFILES[profile]
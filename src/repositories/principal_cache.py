@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.config import config
+from src.models.user import User
+from src.utils import ACCESS_TOKEN_EXPIRY_DURATION
+
+
+class PrincipalCache:
+    """Authenticated users by id, so requests with a valid token skip the user lookup.
+
+    A bounded LRU whose entries expire after ttl_seconds. Entries are
+    invalidated by UserRepository when the row changes; other workers keep
+    their copy until it expires, so the TTL bounds how stale a principal
+    can be.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[User, float]] = OrderedDict()
+
+    def get(self, user_id: str) -> Optional[User]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return user
+
+    def put(self, user_id: str, user: User) -> None:
+        self._entries[user_id] = (user, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    max_entries=config.PRINCIPAL_CACHE_MAX_ENTRIES,
+    # Never trust a cached principal longer than the token that named it
+    ttl_seconds=min(config.PRINCIPAL_CACHE_TTL_SECONDS,
+                    ACCESS_TOKEN_EXPIRY_DURATION),
+)
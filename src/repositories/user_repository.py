@@ -1,20 +1,78 @@
-from typing import Optional
-from sqlmodel import select
+from typing import Any, Optional
+from uuid import UUID
+from sqlmodel import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel.ext.asyncio.session import AsyncSession
 from src.models.user import User
 from .base import BaseRepository
+from .loading_profiles import LoadingProfile, loader_options
+from .principal_cache import PrincipalCache, principal_cache
 
 
 class UserRepository(BaseRepository[User]):
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: Optional[PrincipalCache] = None):
         super().__init__(User, session)
+        self.principal_cache = cache or principal_cache
+
+    async def get_principal(self, user_id: str) -> Optional[User]:
+        """The user a valid access token names, from the principal cache when possible."""
+        user = self.principal_cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = await self.get_by_id(user_id, LoadingProfile.AUTH_PRINCIPAL)
+        if user is None:
+            return None
+        # Detached, so requests sharing it through the cache never touch this session
+        self.session.expunge(user)
+        self.principal_cache.put(user_id, user)
+        return user
+
+    async def update(self, obj: User) -> User:
+        user = await super().update(obj)
+        self.principal_cache.invalidate(str(user.id))
+        return user
+
+    async def update_by_id(self, id: UUID | str, update_data: dict[str, Any]) -> Optional[User]:
+        user = await super().update_by_id(id, update_data)
+        self.principal_cache.invalidate(str(id))
+        return user
+
+    async def delete_by_id(self, id: UUID | str) -> bool:
+        deleted = await super().delete_by_id(id)
+        self.principal_cache.invalidate(str(id))
+        return deleted
 
     async def get_by_email(self, email: str) -> Optional[User]:
-        statement = select(User).where(User.email == email)
+        # Matches the unique index on lower(email)
+        statement = (
+            select(User)
+            .where(func.lower(User.email) == email.lower())
+            .options(*loader_options(LoadingProfile.AUTH_PRINCIPAL))
+        )
         result = await self.session.exec(statement)
         return result.first()
 
-    async def email_exists(self, email: str) -> bool:
-        user = await self.get_by_email(email)
-        return user is not None
+    async def create_if_email_free(self, user: User) -> Optional[User]:
+        """Inserts the user unless the email is taken, in one statement.
+
+        Conflicts are detected by the unique index on lower(email), so a
+        duplicate returns None instead of raising, and RETURNING fills in the
+        server defaults without a follow-up SELECT.
+        """
+        values = {
+            column.key: getattr(user, column.key)
+            for column in User.__table__.columns  # type: ignore[attr-defined]
+            if getattr(user, column.key, None) is not None
+        }
+        statement = (
+            pg_insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+            .returning(User)
+        )
+        result = await self.session.execute(select(User).from_statement(statement))
+        created_user = result.scalars().first()
+        await self.session.commit()
+        return created_user
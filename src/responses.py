@@ -0,0 +1,105 @@
+import hashlib
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class ModelResponse(Response):
+    """A pydantic model serialised straight to JSON bytes, with its camelCase aliases.
+
+    Returning a Response makes FastAPI skip re-validating the body against
+    response_model and running jsonable_encoder over it. Only return models
+    the service already built as the response schema; response_model is then
+    used for the OpenAPI docs alone.
+    """
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        super().__init__(content, status_code, headers, self.media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        # pydantic-core's serializer writes bytes in one pass, without an intermediate dict
+        return to_json(content, by_alias=True)
+
+
+def body_digest(*parts: bytes) -> str:
+    """A hex digest of the bytes a response is built from, for strong ETags."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class RenderedBody:
+    """A JSON body with the validators a conditional GET is checked against."""
+    body: bytes
+    etag: str
+    # Epoch seconds; when this body was rendered, unless an identical one came before it
+    last_modified: float
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> "RenderedBody":
+        return cls(body, f'"{body_digest(body)}"', time.time())
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[float] = None) -> bool:
+    """Whether the client's copy is current, judged the way RFC 9110 orders the checks."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses the weak comparison, so W/"x" matches "x"
+        return any(candidate.strip().removeprefix("W/") == etag
+                   for candidate in if_none_match.split(","))
+
+    # Only consulted when the client sent no ETag
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return int(last_modified) <= since.timestamp()
+
+
+def conditional_response(
+    request: Request,
+    etag: str,
+    render: Callable[[], bytes],
+    last_modified: Optional[float] = None,
+    vary: Optional[str] = None,
+) -> Response:
+    """A 304 when the client's copy is current, otherwise the JSON body.
+
+    render is only called for a 200, so a matching request never builds the
+    body. no-cache lets clients and proxies keep the body but revalidate it
+    on every use.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(int(last_modified), usegmt=True)
+    if vary is not None:
+        headers["Vary"] = vary
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(render(), media_type="application/json", headers=headers)
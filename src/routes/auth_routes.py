@@ -1,12 +1,15 @@
 from fastapi import UploadFile, Form, APIRouter, HTTPException, status
 from pathlib import Path
-from src.services.file_service import FileService
+from typing import Optional
+from src.services.file_service import FileService, PendingUpload
 from src.exceptions import InvalidCredentialsError, InvalidTokenError
 from src.schemas.api_response import APIResponse
+from src.responses import ModelResponse
 from src.schemas.user import LogOutResponse, LoginResponse, LogoutRequestModel, TokenPairResponse, TokenRefreshRequest, UserCreateModel, UserLoginModel, UserModel, UserResponse
 from src.services.auth_service import AuthService
 from fastapi import Depends
-from src.utils import create_access_token, create_refresh_token, verify_password, verify_refresh_token
+from src.password_hasher import password_hasher
+from src.utils import create_access_token, create_refresh_token, verify_refresh_token
 from src.dependencies.repositories_deps import UserRepositoryDep
 
 auth_router = APIRouter()
@@ -14,38 +17,50 @@ UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
 
 
+async def profile_image_upload(
+    profile_image: UploadFile | None = Form(
+        None, alias="profileImage"),
+) -> Optional[PendingUpload]:
+    # Validated here, written only once the user row exists
+    if profile_image is None:
+        return None
+    return await FileService().prepare_upload(file=profile_image)
+
+
 async def user_data_with_image(
     fullname: str = Form(...),
     email: str = Form(...),
     password: str = Form(...),
-    profile_image: UploadFile | None = Form(
-        None, alias="profileImage"),
+    profile_image: Optional[PendingUpload] = Depends(profile_image_upload),
+    # A direct upload's imageUrl, instead of sending the file itself
+    profile_image_url: str | None = Form(None, alias="profileImageUrl"),
 ) -> UserCreateModel:
-
-    image_path = await FileService().save_optional_file(file=profile_image)
-
-    return UserCreateModel(
+    user_data = UserCreateModel(
         name=fullname,
         email=email,
         password=password,
-        profile_image_url=image_path,
     )
+    if profile_image is not None:
+        user_data.profile_image_url = profile_image.url
+    elif profile_image_url:
+        user_data.profile_image_url = await FileService().claim_direct_upload(profile_image_url)
+    return user_data
 
 
 @auth_router.post("/signup", response_model=APIResponse[UserModel], status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_repo: UserRepositoryDep,
     user_data: UserCreateModel = Depends(user_data_with_image),
+    profile_image: Optional[PendingUpload] = Depends(profile_image_upload),
 ):
     auth_service = AuthService(user_repo)
 
-    if await auth_service.user_exists(user_data.email):
+    new_user = await auth_service.create_user(user_data, profile_image)
+    if new_user is None:
         raise HTTPException(
             status_code=400,
             detail="User with this email already exists"
         )
-
-    new_user = await auth_service.create_user(user_data)
     return APIResponse(data=new_user, message="User created successfully", success=True)
 
 
@@ -58,7 +73,7 @@ async def login_user(login_data: UserLoginModel, user_repo: UserRepositoryDep):
     user = await auth_service.get_user_by_email(email)
 
     if user is not None:
-        password_valid = verify_password(password, user.password_hash)
+        password_valid = await password_hasher.verify(password, user.password_hash)
         if password_valid:
             access_token = create_access_token(user_data={
                 'email': user.email,
@@ -76,7 +91,7 @@ async def login_user(login_data: UserLoginModel, user_repo: UserRepositoryDep):
 
             await auth_service.save_refresh_token(user, refresh_token)
 
-            return APIResponse(data=LoginResponse(
+            return ModelResponse(APIResponse(data=LoginResponse(
                 access_token=access_token,
                 refresh_token=refresh_token,
                 user=UserResponse(
@@ -84,7 +99,7 @@ async def login_user(login_data: UserLoginModel, user_repo: UserRepositoryDep):
                     id=str(user.id),
                     name=user.name
                 )
-            ), message="Login successful", success=True)
+            ), message="Login successful", success=True))
 
     raise InvalidCredentialsError()
 
@@ -102,7 +117,7 @@ async def refresh_access_token(request_body: TokenRefreshRequest, user_repo: Use
     tokenResponse = await auth_service.refresh_tokens(
         request_body.refresh_token, user_id
     )
-    return APIResponse(data=tokenResponse, message="Token refreshed successfully", success=True)
+    return ModelResponse(APIResponse(data=tokenResponse, message="Token refreshed successfully", success=True), status_code=status.HTTP_201_CREATED)
 
 
 @auth_router.post('/logout', response_model=LogOutResponse, status_code=status.HTTP_200_OK)
@@ -110,4 +125,4 @@ async def log_out_user(request_model: LogoutRequestModel, user_repo: UserReposit
     auth_service = AuthService(user_repo)
     await auth_service.remove_refresh_token(request_model.user_id)
 
-    return LogOutResponse(message="Logged out successfully", success=True)
+    return ModelResponse(LogOutResponse(message="Logged out successfully", success=True))
@@ -1,16 +1,21 @@
-from src.schemas.pagination import PaginationParams
-from typing import Annotated
-from src.exceptions import AuthenticationError
+from src.schemas.pagination import CursorPageParams, PaginationParams
+from uuid import UUID
+from src.exceptions import AuthenticationError, ResourceNotFoundError
 from src.services.blog_like_service import BlogLikeService
 from src.services.comment_service import CommentService
-from src.schemas.blog import BlogLikeResponse, BlogListResponse, BlogResponse, BlogWithCommentsResponse, CommentPayload, CommentResponse, CommentCreateModel, LikePayload
+from src.schemas.blog import BlogLikeResponse, BlogListResponse, BlogResponse, BlogWithCommentsResponse, CommentListResponse, CommentPayload, CommentResponse, CommentCreateModel, LikePayload
 from src.services.blog_service import BlogService
-from fastapi import APIRouter, Depends, status
-from sqlmodel.ext.asyncio.session import AsyncSession
-from src.db.main import get_session
+from src.services.blog_list_cache import BlogListKey, blog_list_cache
+from src.services.blog_detail_cache import DetailFragment, blog_detail_cache
+from src.db.main import async_session_maker
+from src.repositories.blog_repository import BlogRepository
+from src.repositories.comment_repository import CommentRepository
+from src.repositories.blog_like_repository import BlogLikeRepository
+from fastapi import APIRouter, Depends, Request, status
 from src.dependencies.auth_deps import CurrentUserDep, OptionalCurrentUserDep
 from src.dependencies.repositories_deps import BlogRepositoryDep, CommentRepositoryDep, BlogLikeRepositoryDep
 from src.schemas.api_response import APIResponse
+from src.responses import ModelResponse, RenderedBody, body_digest, conditional_response
 from src.dependencies.blog_deps import BlogDataDep, UpdateBlogDataDep
 from pathlib import Path
 
@@ -31,7 +36,7 @@ async def add_blog_post(
     blog_service = BlogService(blog_repo)
     data = await blog_service.add_blog_post(blog_data, current_user)
 
-    return APIResponse(data=BlogResponse(blog=data), success=True, message="Blog post created successfully")
+    return ModelResponse(APIResponse(data=BlogResponse(blog=data), success=True, message="Blog post created successfully"), status_code=status.HTTP_201_CREATED)
 
 
 @blog_router.patch('/{blog_id}', response_model=APIResponse[BlogResponse], status_code=status.HTTP_200_OK)
@@ -46,7 +51,7 @@ async def update_blog_post(
     blog_service = BlogService(blog_repo)
     data = await blog_service.update_blog_post(blog_id, blog_data, current_user)
 
-    return APIResponse(data=BlogResponse(blog=data), success=True, message="Blog post updated successfully")
+    return ModelResponse(APIResponse(data=BlogResponse(blog=data), success=True, message="Blog post updated successfully"))
 
 
 @blog_router.delete('/{blog_id}', status_code=status.HTTP_200_OK)
@@ -64,35 +69,98 @@ async def delete_blog_post(
     return APIResponse(data={}, success=True, message="Blog post deleted successfully")
 
 
-@blog_router.get('', response_model=APIResponse[BlogListResponse], status_code=status.HTTP_200_OK)
-async def get_blog_list(
-    blog_repo: BlogRepositoryDep,
-    pagination: PaginationParams = Depends()
-):
-    blog_service = BlogService(blog_repo)
-    blog_items, pagination_meta = await blog_service.get_blog_list(
-        page=pagination.page,
-        page_size=pagination.page_size
-    )
+async def render_blog_list_page(key: BlogListKey) -> RenderedBody:
+    """One GET /blogs body. Read from the primary, so a page cached right after a write includes it."""
+    page, page_size, cursor, include_total = key
+    async with async_session_maker() as session:
+        blog_service = BlogService(BlogRepository(session))
+        blog_items, pagination_meta = await blog_service.get_blog_list(
+            page=page or 1,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=include_total
+        )
 
-    return APIResponse(
+    return RenderedBody.from_bytes(ModelResponse(APIResponse(
         data=BlogListResponse(blogs=blog_items, pagination=pagination_meta),
         success=True,
         message="Blog list fetched successfully"
+    )).body)
+
+
+async def warm_blog_list_cache(pages: int) -> None:
+    page_size = PaginationParams().page_size
+    for page in range(1, pages + 1):
+        key: BlogListKey = (page, page_size, None, True)
+        await blog_list_cache.get(key, lambda: render_blog_list_page(key))
+
+
+@blog_router.get('', response_model=APIResponse[BlogListResponse], status_code=status.HTTP_200_OK)
+async def get_blog_list(request: Request, pagination: PaginationParams = Depends()):
+    # The page number is ignored once a cursor is given
+    key: BlogListKey = (
+        None if pagination.cursor else pagination.page,
+        pagination.page_size,
+        pagination.cursor,
+        pagination.include_total,
     )
+    page = await blog_list_cache.get(key, lambda: render_blog_list_page(key))
+    return conditional_response(request, page.etag, lambda: page.body, page.last_modified)
+
+
+async def render_blog_detail_fragment(blog_id: str) -> DetailFragment:
+    """The viewer-independent GET /blogs/{id} body, read from the primary like the listings."""
+    async with async_session_maker() as session:
+        blog_service = BlogService(
+            BlogRepository(session), CommentRepository(session), BlogLikeRepository(session))
+        blog_details = await blog_service.get_blog_details(blog_id, None)
+
+    return DetailFragment.from_body(ModelResponse(APIResponse(
+        data=blog_details, success=True, message="Blog details fetched successfully")).body)
 
 
 @blog_router.get('/{blog_id}', response_model=APIResponse[BlogWithCommentsResponse], status_code=status.HTTP_200_OK)
 async def get_blog_details(
     blog_id: str,
+    request: Request,
     blog_repo: BlogRepositoryDep,
+    blog_like_repo: BlogLikeRepositoryDep,
     current_user: OptionalCurrentUserDep
 ):
-    blog_service = BlogService(blog_repo)
+    try:
+        # One cache entry per blog, however the id is spelled
+        blog_key = str(UUID(blog_id))
+    except ValueError:
+        raise ResourceNotFoundError("Blog", blog_id)
+
+    fragment = await blog_detail_cache.get(blog_key, lambda: render_blog_detail_fragment(blog_key))
+    blog_service = BlogService(blog_repo, blog_like_repo=blog_like_repo)
     user_id = current_user.id if current_user else None
-    blog_details = await blog_service.get_blog_details(blog_id, user_id)
+    is_liked_by_user = await blog_service.check_if_user_liked(blog_key, user_id)
+
+    # The like flag depends on who asks, so caches must key the body on the token too
+    return conditional_response(
+        request,
+        fragment.etag(is_liked_by_user),
+        lambda: fragment.render(is_liked_by_user),
+        fragment.last_modified,
+        vary="Authorization",
+    )
+
+
+@blog_router.get('/{blog_id}/comments', response_model=APIResponse[CommentListResponse], status_code=status.HTTP_200_OK)
+async def get_blog_comments(
+    blog_id: str,
+    request: Request,
+    blog_repo: BlogRepositoryDep,
+    comment_repo: CommentRepositoryDep,
+    page: CursorPageParams = Depends()
+):
+    blog_service = BlogService(blog_repo, comment_repo)
+    comments = await blog_service.get_blog_comments(blog_id, page.cursor, page.limit)
 
-    return APIResponse(data=blog_details, success=True, message="Blog details fetched successfully")
+    body = ModelResponse(APIResponse(data=comments, success=True, message="Comments fetched successfully")).body
+    return conditional_response(request, f'"{body_digest(body)}"', lambda: body)
 
 
 @blog_router.post('/{blog_id}/comments', response_model=APIResponse[CommentResponse], status_code=status.HTTP_201_CREATED)
@@ -107,7 +175,7 @@ async def add_comment(
         blog_id=blog_id, content=comment_data.content, created_by=current_user.id)
     comment = await comment_service.add_comment(model, current_user)
 
-    return APIResponse(data=comment, success=True, message="Comment added successfully")
+    return ModelResponse(APIResponse(data=comment, success=True, message="Comment added successfully"), status_code=status.HTTP_201_CREATED)
 
 
 @blog_router.put('/{blog_id}/comments/{comment_id}', response_model=APIResponse[CommentResponse], status_code=status.HTTP_200_OK)
@@ -121,38 +189,41 @@ async def update_comment(
     comment_service = CommentService(comment_repo)
     comment = await comment_service.update_comment(comment_id, comment_data.content, current_user)
 
-    return APIResponse(data=comment, success=True, message="Comment updated successfully")
+    return ModelResponse(APIResponse(data=comment, success=True, message="Comment updated successfully"))
 
 
 @blog_router.post('/{blog_id}/likes', response_model=APIResponse[LikePayload], status_code=status.HTTP_200_OK)
 async def like_unlike_blog(
     blog_id: str,
     payload: LikePayload,
-    session: Annotated[AsyncSession, Depends(get_session)],
     blog_repo: BlogRepositoryDep,
     blog_like_repo: BlogLikeRepositoryDep,
     current_user: CurrentUserDep
 ):
     blog_like_service = BlogLikeService(blog_repo, blog_like_repo)
-    result = await blog_like_service.update_like_status(blog_id, current_user.id, payload.is_liked, session)
+    result = await blog_like_service.update_like_status(blog_id, current_user.id, payload.is_liked)
 
-    return APIResponse(
+    return ModelResponse(APIResponse(
         data=LikePayload(is_liked=result),
         success=True,
         message=f"Blog {'liked' if result else 'unliked'} successfully"
-    )
+    ))
 
 
 @blog_router.get('/{blog_id}/likes', response_model=APIResponse[BlogLikeResponse], status_code=status.HTTP_200_OK)
 async def get_blog_likes(
     blog_id: str,
+    request: Request,
     blog_repo: BlogRepositoryDep,
     blog_like_repo: BlogLikeRepositoryDep,
+    page: CursorPageParams = Depends()
 ):
     blog_like_service = BlogLikeService(blog_repo, blog_like_repo)
-    users = await blog_like_service.get_total_likes(blog_id)
-    return APIResponse(
-        data=BlogLikeResponse(total_likes=len(users), users=users),
+    likes = await blog_like_service.get_likers(blog_id, page.cursor, page.limit)
+    body = ModelResponse(APIResponse(
+        data=likes,
         success=True,
         message="Total likes fetched successfully"
-    )
+    )).body
+    # Not cached, so a match saves the transfer rather than the rendering
+    return conditional_response(request, f'"{body_digest(body)}"', lambda: body)
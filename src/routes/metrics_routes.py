@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, status
+from src.db.main import async_engine, replica_engine
+from src.db.pool_metrics import pool_status
+from src.dependencies.metrics_deps import MetricsTokenBearer
+from src.password_hasher import password_hasher
+from src.services.blog_detail_cache import blog_detail_cache
+from src.services.blog_list_cache import blog_list_cache
+from src.services.upload_reaper import upload_reaper
+
+metrics_router = APIRouter(dependencies=[Depends(MetricsTokenBearer())])
+
+
+@metrics_router.get('/db-pool', status_code=status.HTTP_200_OK)
+async def get_db_pool_metrics():
+    pools = {"primary": pool_status(async_engine)}
+    if replica_engine is not None:
+        pools["replica"] = pool_status(replica_engine)
+    return pools
+
+
+@metrics_router.get('/password-hasher', status_code=status.HTTP_200_OK)
+async def get_password_hasher_metrics():
+    return password_hasher.snapshot()
+
+
+@metrics_router.get('/upload-reaper', status_code=status.HTTP_200_OK)
+async def get_upload_reaper_metrics():
+    return upload_reaper.snapshot()
+
+
+@metrics_router.get('/blog-list-cache', status_code=status.HTTP_200_OK)
+async def get_blog_list_cache_metrics():
+    return blog_list_cache.snapshot()
+
+
+@metrics_router.get('/blog-detail-cache', status_code=status.HTTP_200_OK)
+async def get_blog_detail_cache_metrics():
+    return blog_detail_cache.snapshot()
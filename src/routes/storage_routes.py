@@ -0,0 +1,30 @@
+from fastapi import APIRouter, status
+from src.dependencies.auth_deps import CurrentUserDep
+from src.exceptions import AuthenticationError
+from src.schemas.api_response import APIResponse
+from src.responses import ModelResponse
+from src.schemas.storage import DirectUploadRequest, DirectUploadResponse, PresignedUploadModel
+from src.services.file_service import FileService
+
+storage_router = APIRouter()
+
+
+@storage_router.post('/uploads', response_model=APIResponse[DirectUploadResponse], status_code=status.HTTP_201_CREATED)
+async def create_direct_upload(
+    upload_request: DirectUploadRequest,
+    current_user: CurrentUserDep,
+):
+    if not current_user:
+        raise AuthenticationError()
+    image_url, presigned = await FileService().create_direct_upload(
+        upload_request.content_type, upload_request.size, upload_request.sha256)
+
+    upload = None
+    if presigned is not None:
+        upload = PresignedUploadModel(
+            url=presigned.url, method=presigned.method, headers=presigned.headers)
+    return ModelResponse(APIResponse(
+        data=DirectUploadResponse(image_url=image_url, upload=upload),
+        success=True,
+        message="Direct upload created successfully"
+    ), status_code=status.HTTP_201_CREATED)
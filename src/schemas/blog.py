@@ -1,5 +1,6 @@
 from src.schemas.pagination import PaginationMeta
 from datetime import datetime
+from typing import Optional
 from fastapi_camelcase import CamelModel
 import uuid
 
@@ -20,6 +21,8 @@ class UserInfo(CamelModel):
     id: str
     name: str
     image_url: str
+    # Resized variants by MIME type, e.g. {"image/webp": "<url> 320w, <url> 640w"}
+    image_srcset: dict[str, str] = {}
 
 
 class BlogModel(CamelModel):
@@ -27,6 +30,7 @@ class BlogModel(CamelModel):
     title: str
     body: str
     cover_image_url: str
+    cover_image_srcset: dict[str, str] = {}
     created_by: UserInfo
     created_at: datetime
     updated_at: datetime
@@ -40,6 +44,7 @@ class BlogItem(CamelModel):
     id: uuid.UUID
     title: str
     cover_image_url: str
+    cover_image_srcset: dict[str, str] = {}
     created_at: datetime
 
 
@@ -53,6 +58,7 @@ class BlogDetail(CamelModel):
     title: str
     body: str
     cover_image_url: str
+    cover_image_srcset: dict[str, str] = {}
     is_liked_by_user: bool
     total_likes: int
     created_by: UserInfo
@@ -68,7 +74,15 @@ class Comment(CamelModel):
 
 class BlogWithCommentsResponse(CamelModel):
     blog: BlogDetail
+    # The first page of comments; GET /blogs/{id}/comments serves the rest
     comments: list[Comment]
+    comments_next_cursor: Optional[str] = None
+
+
+class CommentListResponse(CamelModel):
+    comments: list[Comment]
+    has_next: bool
+    next_cursor: Optional[str] = None
 
 
 class CommentPayload(CamelModel):
@@ -91,4 +105,7 @@ class LikePayload(CamelModel):
 
 class BlogLikeResponse(CamelModel):
     total_likes: int
+    # One page of likers, ordered by user id
     users: list[UserInfo]
+    has_next: bool = False
+    next_cursor: Optional[str] = None
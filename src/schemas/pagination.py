@@ -1,7 +1,13 @@
-from typing import Generic, TypeVar
+import base64
+import uuid
+from datetime import datetime
+from typing import Generic, Literal, Optional, TypeVar
 from pydantic import BaseModel, Field
+from pydantic import ValidationError as PydanticValidationError
 from fastapi_camelcase import CamelModel
 
+from src.exceptions import ValidationError
+
 T = TypeVar('T')
 
 
@@ -11,15 +17,76 @@ class PaginationParams(BaseModel):
         default=1, ge=1, description="Page number (starts from 1)")
     page_size: int = Field(default=9, ge=1, le=100,
                            description="Number of items per page")
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from nextCursor/prevCursor; when set, page is ignored")
+    include_total: bool = Field(
+        default=True,
+        description="Set to false to skip counting totalItems/totalPages")
+
+
+class CursorPageParams(BaseModel):
+    """Query parameters for cursor-only listings (comments, likers)"""
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from nextCursor; omit for the first page")
+    limit: int = Field(default=20, ge=1, le=100,
+                       description="Number of items per page")
+
+
+def split_page(rows: list[T], limit: int, from_end: bool = False) -> tuple[list[T], bool]:
+    """Trims rows fetched with limit + 1 to one page; the extra row only tells whether there is more.
+
+    from_end keeps the last `limit` rows, for pages read backwards and reversed.
+    """
+    has_more = len(rows) > limit
+    if not has_more:
+        return rows, False
+    return (rows[-limit:] if from_end else rows[:limit]), True
+
+
+C = TypeVar('C', bound='OpaqueCursor')
+
+
+class OpaqueCursor(BaseModel):
+    """A listing position handed to clients as an opaque base64url string"""
+
+    def encode(self) -> str:
+        raw = self.model_dump_json().encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls: type[C], cursor: str) -> C:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            return cls.model_validate_json(raw)
+        except (ValueError, PydanticValidationError):
+            raise ValidationError("Invalid pagination cursor")
+
+
+class KeysetCursor(OpaqueCursor):
+    """Position in a (created_at, id) ordered listing"""
+    created_at: datetime
+    id: uuid.UUID
+    direction: Literal["next", "prev"] = "next"
+
+
+class IdCursor(OpaqueCursor):
+    """Position in a listing ordered by a single UUID key"""
+    id: uuid.UUID
 
 
 class PaginationMeta(CamelModel):
-    current_page: int
+    # None when the page was requested by cursor
+    current_page: Optional[int]
     page_size: int
-    total_items: int
-    total_pages: int
+    # None when the client opted out of the total
+    total_items: Optional[int]
+    total_pages: Optional[int]
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class PaginatedResponse(CamelModel, Generic[T]):
@@ -0,0 +1,24 @@
+from typing import Literal, Optional
+
+from fastapi_camelcase import CamelModel
+from pydantic import Field
+
+
+class DirectUploadRequest(CamelModel):
+    content_type: Literal["image/jpeg", "image/png"]
+    size: int = Field(gt=0)
+    # Hex SHA-256 of the file; storage rejects a body that does not match it
+    sha256: str = Field(pattern=r"^[0-9a-f]{64}$")
+
+
+class PresignedUploadModel(CamelModel):
+    url: str
+    method: str
+    headers: dict[str, str]
+
+
+class DirectUploadResponse(CamelModel):
+    # Pass back as coverImageUrl/profileImageUrl once the upload has finished
+    image_url: str
+    # None when identical bytes are already stored and nothing needs uploading
+    upload: Optional[PresignedUploadModel] = None
@@ -2,7 +2,9 @@ from typing import Optional
 from src.repositories.user_repository import UserRepository
 from src.models.user import User
 from src.schemas.user import TokenPairResponse, UserCreateModel
-from src.utils import create_access_token, create_refresh_token, generate_password_hash
+from src.password_hasher import password_hasher
+from src.services.file_service import FileService, PendingUpload
+from src.utils import create_access_token, create_refresh_token
 from src.exceptions import (
     ResourceNotFoundError,
     DatabaseError,
@@ -13,22 +15,50 @@ from src.exceptions import (
 class AuthService:
     def __init__(self, user_repo: UserRepository):
         self.user_repo = user_repo
+        self.file_service = FileService()
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         return await self.user_repo.get_by_email(email)
 
-    async def user_exists(self, email: str) -> bool:
-        return await self.user_repo.email_exists(email)
+    async def get_principal(self, user_id: str) -> Optional[User]:
+        return await self.user_repo.get_principal(user_id)
 
-    async def create_user(self, user_data: UserCreateModel) -> User:
+    async def create_user(
+        self, user_data: UserCreateModel, profile_image: Optional[PendingUpload] = None
+    ) -> Optional[User]:
+        """Creates the user, or returns None if the email is already registered.
+
+        The profile image is written only after the insert succeeds, so a
+        duplicate signup leaves nothing behind on disk.
+        """
+        try:
+            return await self._insert_user(user_data, profile_image)
+        finally:
+            # A no-op once the image has been moved into place
+            if profile_image is not None:
+                profile_image.discard()
+
+    async def _insert_user(
+        self, user_data: UserCreateModel, profile_image: Optional[PendingUpload]
+    ) -> Optional[User]:
+        # Outside the try: a saturated hasher is a 503, not a database failure
+        password_hash = await password_hasher.hash(user_data.password)
         try:
             user_data_dict = user_data.model_dump()
             new_user = User(**user_data_dict)
-            new_user.password_hash = generate_password_hash(user_data.password)
-            return await self.user_repo.create(new_user)
+            new_user.password_hash = password_hash
+            created_user = await self.user_repo.create_if_email_free(new_user)
         except Exception:
             raise DatabaseError("Failed to create user account")
 
+        if created_user is not None and profile_image is not None:
+            try:
+                await self.file_service.store(profile_image)
+            except Exception:
+                await self.user_repo.delete_by_id(created_user.id)
+                raise DatabaseError("Failed to save profile image")
+        return created_user
+
     async def save_refresh_token(self, user: User, refresh_token: str) -> User:
         user.refresh_token = refresh_token
         return await self.user_repo.update(user)
@@ -0,0 +1,57 @@
+import logging
+import time
+from dataclasses import dataclass
+
+from src.config import config
+from src.responses import body_digest
+from src.services.versioned_cache import VersionedCache
+
+LIKED_KEY = b'"isLikedByUser":'
+
+
+@dataclass(frozen=True)
+class DetailFragment:
+    """A serialised GET /blogs/{id} body, split where the viewer's like flag goes."""
+    head: bytes
+    tail: bytes
+    digest: str
+    # Epoch seconds; when this fragment was rendered, unless an identical one came before it
+    last_modified: float
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "DetailFragment":
+        # Quotes inside string values are escaped, so only the real key matches
+        head, marker, tail = body.partition(LIKED_KEY + b"false")
+        if not marker:
+            raise ValueError("Body has no isLikedByUser=false to split on")
+        head += LIKED_KEY
+        return cls(head, tail, body_digest(head, tail), time.time())
+
+    def render(self, is_liked_by_user: bool) -> bytes:
+        return self.head + (b"true" if is_liked_by_user else b"false") + self.tail
+
+    def etag(self, is_liked_by_user: bool) -> str:
+        # The two renderings differ in one byte run, so each gets its own strong ETag
+        return f'"{self.digest}-{1 if is_liked_by_user else 0}"'
+
+
+class BlogDetailCache(VersionedCache[str, DetailFragment]):
+    """The viewer-independent part of each blog's detail, by canonical blog id.
+
+    Editing or deleting the blog, adding or editing a comment and toggling
+    a like invalidate that blog alone. With no stale_seconds, the TTL bounds
+    how old a detail can be in other workers. A reload that
+    renders the same bytes keeps the earlier fragment, so its ETag and
+    Last-Modified stay put.
+    """
+    # A load fails for a blog that does not exist, which the request reports as a 404
+    load_failure_level = logging.DEBUG
+
+    def unchanged(self, cached: DetailFragment, loaded: DetailFragment) -> bool:
+        return cached.digest == loaded.digest
+
+
+blog_detail_cache = BlogDetailCache(
+    max_entries=config.BLOG_DETAIL_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.BLOG_DETAIL_CACHE_TTL_SECONDS,
+)
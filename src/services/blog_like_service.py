@@ -1,75 +1,70 @@
+from typing import Optional
 from uuid import UUID
-from sqlmodel import update
-from sqlalchemy import func, cast, Boolean
 from fastapi import HTTPException
-from sqlmodel.ext.asyncio.session import AsyncSession
 from src.repositories.blog_repository import BlogRepository
 from src.repositories.blog_like_repository import BlogLikeRepository
-from src.schemas.blog import UserInfo
-from src.models.blog import Blog
+from src.schemas.blog import BlogLikeResponse, UserInfo
+from src.schemas.pagination import IdCursor, split_page
+from src.services.blog_detail_cache import BlogDetailCache, blog_detail_cache
 from src.services.file_service import FileService
+from src.services.like_counters import LikeCounter, like_counter
 
 
 class BlogLikeService:
-    def __init__(self, blog_repo: BlogRepository, blog_like_repo: BlogLikeRepository):
+    def __init__(
+        self,
+        blog_repo: BlogRepository,
+        blog_like_repo: BlogLikeRepository,
+        counter: Optional[LikeCounter] = None,
+        detail_cache: Optional[BlogDetailCache] = None
+    ):
         self.blog_repo = blog_repo
         self.blog_like_repo = blog_like_repo
+        self.counter = counter or like_counter
+        # The blog's cached detail carries its like count
+        self.detail_cache = detail_cache or blog_detail_cache
+        self.file_service = FileService()
 
     async def update_like_status(
         self,
         blog_id: str,
         user_id: UUID,
         is_liked: bool,
-        session: AsyncSession,
     ) -> bool:
-        await self._ensure_blog_exists(blog_id)
-        previous_is_liked = await self._get_previous_like_state(blog_id, user_id)
-
-        if previous_is_liked == is_liked:
-            return is_liked
-
-        await self._upsert_blog_like(blog_id, user_id, is_liked)
-        await self._update_blog_like_count(blog_id, is_liked, session)
-
-        await session.commit()
+        state_changed = await self.counter.record(
+            self.blog_like_repo, blog_id, user_id, is_liked)
+        if state_changed is None:
+            raise HTTPException(status_code=404, detail="Blog not found")
+        if state_changed:
+            self.detail_cache.invalidate(str(UUID(blog_id)))
         return is_liked
 
-    async def _ensure_blog_exists(self, blog_id: str) -> None:
-        exists = await self.blog_repo.exists(blog_id)
-        if not exists:
+    async def get_likers(
+        self, blog_id: str, cursor: Optional[str], limit: int
+    ) -> BlogLikeResponse:
+        after = IdCursor.decode(cursor) if cursor else None
+        like_count = await self.blog_repo.get_like_count(blog_id)
+        if like_count is None:
             raise HTTPException(status_code=404, detail="Blog not found")
 
-    async def _get_previous_like_state(self, blog_id: str, user_id: UUID) -> bool:
-        return await self.blog_like_repo.get_like_status(blog_id, user_id)
-
-    async def _upsert_blog_like(
-        self, blog_id: str, user_id: UUID, is_liked: bool
-    ) -> None:
-        await self.blog_like_repo.upsert(blog_id, user_id, is_liked)
+        likers = await self.blog_like_repo.get_likers_page(
+            blog_id, after.id if after else None, limit + 1)
+        likers, has_next = split_page(likers, limit)
+        unapplied = await self.counter.unapplied(self.blog_like_repo, UUID(blog_id))
 
-    async def _update_blog_like_count(
-        self, blog_id: str, is_liked: bool, session: AsyncSession
-    ) -> None:
-        delta = 1 if is_liked else -1
-        await session.exec(
-            update(Blog)
-            .where(cast(Blog.id == blog_id, Boolean))
-            .values(like_count=func.greatest(Blog.like_count + delta, 0))
-        )
-
-    async def get_total_likes(self, blog_id: str) -> list[UserInfo]:
-        await self._ensure_blog_exists(blog_id)
-
-        likes = await self.blog_like_repo.get_likes_for_blog(blog_id)
-
-        users: list[UserInfo] = []
-        for like in likes:
-            user = like.user
-            users.append(
+        return BlogLikeResponse(
+            total_likes=like_count + unapplied,
+            users=[
                 UserInfo(
-                    id=str(user.id),
-                    name=user.name,
-                    image_url=FileService().build_file_url(user.profile_image_url)
+                    id=str(liker.id),
+                    name=liker.name,
+                    image_url=self.file_service.build_file_url(
+                        liker.profile_image_url),
+                    image_srcset=self.file_service.build_srcset(
+                        liker.profile_image_url)
                 )
-            )
-        return users
+                for liker in likers
+            ],
+            has_next=has_next,
+            next_cursor=IdCursor(id=likers[-1].id).encode() if has_next else None
+        )
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from src.config import config
+from src.responses import RenderedBody
+from src.services.versioned_cache import VersionedCache
+
+# (page, page_size, cursor, include_total); page is None for cursor requests
+BlogListKey = tuple[Optional[int], int, Optional[str], bool]
+
+
+class BlogListCache(VersionedCache[BlogListKey, RenderedBody]):
+    """Serialised GET /blogs bodies, so repeated list requests skip the database.
+
+    Creating, editing or deleting a blog can move any page, so each write
+    calls invalidate() and drops every body at once. Bodies are served
+    stale while they reload. A reload that renders the same bytes keeps the
+    earlier body, so its ETag and Last-Modified stay put.
+    """
+
+    def unchanged(self, cached: RenderedBody, loaded: RenderedBody) -> bool:
+        return cached.etag == loaded.etag
+
+
+blog_list_cache = BlogListCache(
+    max_entries=config.BLOG_LIST_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.BLOG_LIST_CACHE_TTL_SECONDS,
+    stale_seconds=config.BLOG_LIST_CACHE_STALE_SECONDS,
+)
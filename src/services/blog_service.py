@@ -1,19 +1,42 @@
-from src.repositories.blog_repository import BlogRepository
+from src.repositories.blog_repository import BlogCard, BlogRepository
+from src.repositories.blog_like_repository import BlogLikeRepository
+from src.repositories.comment_repository import CommentRepository
 from src.models.blog import Blog
 from src.models.user import User
 from src.models.comment import Comment
-from src.schemas.blog import AddBlogPostPayload, UpdateBlogPostPayload, BlogDetail, BlogItem, BlogModel, UserInfo, BlogWithCommentsResponse
+from src.schemas.blog import AddBlogPostPayload, UpdateBlogPostPayload, BlogDetail, BlogItem, BlogModel, UserInfo, BlogWithCommentsResponse, CommentListResponse
 from uuid import UUID
 from src.schemas.blog import Comment as CommentSchema
 from src.exceptions import AuthorizationError, ResourceNotFoundError, DatabaseError
+from src.services.blog_detail_cache import BlogDetailCache, blog_detail_cache
+from src.services.blog_list_cache import BlogListCache, blog_list_cache
 from src.services.file_service import FileService
-from src.schemas.pagination import PaginationMeta
-from typing import Tuple
+from src.services.like_counters import LikeCounter, like_counter
+from src.schemas.pagination import CursorPageParams, KeysetCursor, PaginationMeta, split_page
+from typing import Literal, Optional, Tuple
+
+
+DETAIL_COMMENTS_PAGE_SIZE = CursorPageParams().limit
 
 
 class BlogService:
-    def __init__(self, blog_repo: BlogRepository):
+    def __init__(
+        self,
+        blog_repo: BlogRepository,
+        comment_repo: Optional[CommentRepository] = None,
+        blog_like_repo: Optional[BlogLikeRepository] = None,
+        counter: Optional[LikeCounter] = None,
+        list_cache: Optional[BlogListCache] = None,
+        detail_cache: Optional[BlogDetailCache] = None
+    ):
         self.blog_repo = blog_repo
+        # Only the blog detail and comment listing read through these
+        self.comment_repo = comment_repo
+        self.blog_like_repo = blog_like_repo
+        self.counter = counter or like_counter
+        # Every create, edit and delete invalidates the cached listings and details
+        self.list_cache = list_cache or blog_list_cache
+        self.detail_cache = detail_cache or blog_detail_cache
         self.file_service = FileService()
 
     async def add_blog_post(
@@ -24,6 +47,7 @@ class BlogService:
         try:
             new_blog = Blog(**payload.model_dump(), created_by=user.id)
             created_blog = await self.blog_repo.create(new_blog)
+            self.list_cache.invalidate()
 
             return self._build_blog_model(created_blog, user)
         except Exception:
@@ -36,12 +60,11 @@ class BlogService:
         user: User
     ) -> BlogModel:
         try:
-            blog = await self._validate_blog_ownership(blog_id, user)
-            old_image_url = blog.cover_image_url
+            await self._validate_blog_ownership(blog_id, user)
             update_data = self._build_update_data(payload)
             updated_blog = await self._update_blog_record(blog_id, update_data)
-            if payload.cover_image_url and old_image_url != payload.cover_image_url:
-                await self.file_service.delete_file_if_exists(old_image_url)
+            self.list_cache.invalidate()
+            self.detail_cache.invalidate(str(updated_blog.id))
             return self._build_blog_model(updated_blog, user)
         except ResourceNotFoundError:
             raise
@@ -60,7 +83,8 @@ class BlogService:
             success = await self.blog_repo.delete_by_id(blog_id)
             if not success:
                 raise ResourceNotFoundError("Blog", blog_id)
-            await self.file_service.delete_file_if_exists(blog.cover_image_url)
+            self.list_cache.invalidate()
+            self.detail_cache.invalidate(str(blog.id))
             return True
         except ResourceNotFoundError:
             raise
@@ -100,10 +124,14 @@ class BlogService:
             body=blog.body,
             cover_image_url=self.file_service.build_file_url(
                 blog.cover_image_url),
+            cover_image_srcset=self.file_service.build_srcset(
+                blog.cover_image_url),
             created_by=UserInfo(
                 id=str(user.id),
                 name=user.name,
                 image_url=self.file_service.build_file_url(
+                    user.profile_image_url),
+                image_srcset=self.file_service.build_srcset(
                     user.profile_image_url)
             ),
             created_at=blog.created_at,
@@ -113,43 +141,118 @@ class BlogService:
     async def get_blog_list(
         self,
         page: int = 1,
-        page_size: int = 9
+        page_size: int = 9,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> Tuple[list[BlogItem], PaginationMeta]:
-        blogs, total_count = await self.blog_repo.get_paginated_blogs(page, page_size)
+        if cursor:
+            return await self._get_blog_list_by_cursor(cursor, page_size, include_total)
 
-        total_pages = (total_count + page_size -
-                       1) // page_size
+        blogs, total_count = await self.blog_repo.get_paginated_blogs(
+            page, page_size, include_total)
+        blogs, has_next = split_page(blogs, page_size)
+        has_previous = page > 1
 
         pagination_meta = PaginationMeta(
             current_page=page,
             page_size=page_size,
             total_items=total_count,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1
+            total_pages=self._total_pages(total_count, page_size),
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=self._edge_cursor(blogs, "next") if has_next else None,
+            prev_cursor=self._edge_cursor(
+                blogs, "prev") if has_previous else None
+        )
+
+        return self._build_blog_items(blogs), pagination_meta
+
+    async def _get_blog_list_by_cursor(
+        self,
+        cursor: str,
+        page_size: int,
+        include_total: bool
+    ) -> Tuple[list[BlogItem], PaginationMeta]:
+        position = KeysetCursor.decode(cursor)
+        backwards = position.direction == "prev"
+
+        blogs = await self.blog_repo.get_blogs_by_keyset(
+            (position.created_at, position.id), page_size + 1, backwards)
+        blogs, has_more = split_page(blogs, page_size, from_end=backwards)
+
+        # The cursor's own row lies on the side we came from
+        has_next = True if backwards else has_more
+        has_previous = has_more if backwards else True
+        total_count = await self.blog_repo.count() if include_total else None
+
+        pagination_meta = PaginationMeta(
+            current_page=None,
+            page_size=page_size,
+            total_items=total_count,
+            total_pages=self._total_pages(total_count, page_size),
+            has_next=has_next and bool(blogs),
+            has_previous=has_previous and bool(blogs),
+            next_cursor=self._edge_cursor(blogs, "next") if has_next else None,
+            prev_cursor=self._edge_cursor(
+                blogs, "prev") if has_previous else None
         )
 
-        blog_items = [
+        return self._build_blog_items(blogs), pagination_meta
+
+    def _total_pages(self, total_count: Optional[int], page_size: int) -> Optional[int]:
+        if total_count is None:
+            return None
+        return (total_count + page_size - 1) // page_size
+
+    def _edge_cursor(self, blogs: list[BlogCard], direction: Literal["next", "prev"]) -> Optional[str]:
+        if not blogs:
+            return None
+        edge = blogs[-1] if direction == "next" else blogs[0]
+        return KeysetCursor(created_at=edge.created_at, id=edge.id, direction=direction).encode()
+
+    def _build_blog_items(self, blogs: list[BlogCard]) -> list[BlogItem]:
+        return [
             BlogItem(
                 id=blog.id,
                 title=blog.title,
                 cover_image_url=self.file_service.build_file_url(
                     blog.cover_image_url),
+                cover_image_srcset=self.file_service.build_srcset(
+                    blog.cover_image_url),
                 created_at=blog.created_at
             )
             for blog in blogs
         ]
 
-        return blog_items, pagination_meta
-
     async def get_blog_details(
         self, blog_id: str, user_id: UUID | None
     ) -> BlogWithCommentsResponse:
         blog = await self._fetch_blog_with_relationships(blog_id)
-        is_liked_by_user = self._check_if_user_liked(blog, user_id)
-        sanitized_blog = self._build_sanitized_blog(blog, is_liked_by_user)
-        sanitized_comments = self._build_sanitized_comments(blog.comments)
-        return BlogWithCommentsResponse(blog=sanitized_blog, comments=sanitized_comments)
+        is_liked_by_user = await self.check_if_user_liked(blog_id, user_id)
+        total_likes = blog.like_count + await self._count_unapplied_likes(blog)
+        sanitized_blog = self._build_sanitized_blog(
+            blog, is_liked_by_user, total_likes)
+        comments, next_cursor = await self._fetch_comments_page(
+            blog_id, None, DETAIL_COMMENTS_PAGE_SIZE)
+        return BlogWithCommentsResponse(
+            blog=sanitized_blog,
+            comments=self._build_sanitized_comments(comments),
+            comments_next_cursor=next_cursor
+        )
+
+    async def get_blog_comments(
+        self, blog_id: str, cursor: Optional[str], limit: int
+    ) -> CommentListResponse:
+        after = KeysetCursor.decode(cursor) if cursor else None
+        if not await self.blog_repo.exists(blog_id):
+            raise ResourceNotFoundError("Blog", blog_id)
+        comments, next_cursor = await self._fetch_comments_page(
+            blog_id, after, limit)
+        return CommentListResponse(
+            comments=self._build_sanitized_comments(comments),
+            has_next=next_cursor is not None,
+            next_cursor=next_cursor
+        )
 
     async def _fetch_blog_with_relationships(self, blog_id: str) -> Blog:
         try:
@@ -162,12 +265,34 @@ class BlogService:
         except Exception:
             raise DatabaseError("Failed to fetch blog details")
 
-    def _check_if_user_liked(self, blog: Blog, user_id: UUID | None) -> bool:
-        if not user_id:
+    async def _fetch_comments_page(
+        self, blog_id: str, after: Optional[KeysetCursor], limit: int
+    ) -> Tuple[list[Comment], Optional[str]]:
+        if self.comment_repo is None:
+            raise DatabaseError("Comments are not available")
+        anchor = (after.created_at, after.id) if after else None
+        comments = await self.comment_repo.get_comments_page(
+            blog_id, anchor, limit + 1)
+        comments, has_next = split_page(comments, limit)
+        if not has_next:
+            return comments, None
+        last = comments[-1]
+        return comments, KeysetCursor(created_at=last.created_at, id=last.id).encode()
+
+    async def _count_unapplied_likes(self, blog: Blog) -> int:
+        # Buffered or sharded likes not yet folded into blogs.like_count
+        if self.blog_like_repo is None:
+            return 0
+        return await self.counter.unapplied(self.blog_like_repo, blog.id)
+
+    async def check_if_user_liked(self, blog_id: str, user_id: UUID | None) -> bool:
+        if not user_id or self.blog_like_repo is None:
             return False
-        return any(like.user_id == user_id for like in blog.likes)
+        return await self.blog_like_repo.has_liked(blog_id, user_id)
 
-    def _build_sanitized_blog(self, blog: Blog, is_liked_by_user: bool) -> BlogDetail:
+    def _build_sanitized_blog(
+        self, blog: Blog, is_liked_by_user: bool, total_likes: int
+    ) -> BlogDetail:
         author = blog.author
 
         return BlogDetail(
@@ -176,13 +301,17 @@ class BlogService:
             body=blog.body,
             cover_image_url=self.file_service.build_file_url(
                 blog.cover_image_url),
+            cover_image_srcset=self.file_service.build_srcset(
+                blog.cover_image_url),
             is_liked_by_user=is_liked_by_user,
-            total_likes=blog.like_count,
+            total_likes=total_likes,
             created_by=UserInfo(
                 id=str(author.id),
                 name=author.name,
                 image_url=self.file_service.build_file_url(
                     author.profile_image_url),
+                image_srcset=self.file_service.build_srcset(
+                    author.profile_image_url),
             ),
             created_at=blog.created_at,
         )
@@ -197,6 +326,8 @@ class BlogService:
                     name=comment.author.name,
                     image_url=self.file_service.build_file_url(
                         comment.author.profile_image_url),
+                    image_srcset=self.file_service.build_srcset(
+                        comment.author.profile_image_url),
                 ),
                 created_at=comment.created_at,
             )
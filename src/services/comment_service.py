@@ -1,3 +1,5 @@
+from typing import Optional
+from src.services.blog_detail_cache import BlogDetailCache, blog_detail_cache
 from src.services.file_service import FileService
 from src.repositories.comment_repository import CommentRepository
 from src.models.comment import Comment as CommentModel
@@ -7,8 +9,14 @@ from src.exceptions import ResourceNotFoundError, DatabaseError, AuthorizationEr
 
 
 class CommentService:
-    def __init__(self, comment_repo: CommentRepository):
+    def __init__(
+        self,
+        comment_repo: CommentRepository,
+        detail_cache: Optional[BlogDetailCache] = None
+    ):
         self.comment_repo = comment_repo
+        # The blog's cached detail carries its first page of comments
+        self.detail_cache = detail_cache or blog_detail_cache
 
     async def add_comment(
         self,
@@ -20,6 +28,7 @@ class CommentService:
                 **comment_data.model_dump(),
             )
             created_comment = await self.comment_repo.create(comment)
+            self.detail_cache.invalidate(str(created_comment.blog_id))
             return self._to_comment_response(created_comment, user)
         except Exception:
             raise DatabaseError("Failed to add comment")
@@ -35,12 +44,13 @@ class CommentService:
         if comment is None:
             raise ResourceNotFoundError("Comment", comment_id)
 
-        if comment.author.id != user.id:
+        if comment.created_by != user.id:
             raise AuthorizationError(
                 "You are not allowed to edit this comment")
 
         comment.content = new_content
         updated_comment = await self.comment_repo.update(comment)
+        self.detail_cache.invalidate(str(updated_comment.blog_id))
 
         return self._to_comment_response(updated_comment, user)
 
@@ -52,7 +62,8 @@ class CommentService:
                 created_by=UserInfo(
                     id=str(author.id),
                     name=author.name,
-                    image_url=FileService().build_file_url(author.profile_image_url)
+                    image_url=FileService().build_file_url(author.profile_image_url),
+                    image_srcset=FileService().build_srcset(author.profile_image_url)
                 ),
                 created_at=comment.created_at
             )
@@ -1,65 +1,198 @@
-import time
+import hashlib
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+import anyio
 from fastapi import UploadFile
-from fastapi import UploadFile
-from src.exceptions import FileValidationError
+from src.exceptions import FileValidationError, UnsupportedOperationError
 from src.config import config
+from src.services.image_derivatives import MIME_TYPES, image_pipeline
+from src.services.storage import (
+    BLOB_KEY,
+    UPLOAD_URL_PREFIX,
+    LocalStorageBackend,
+    PresignedUpload,
+    StorageBackend,
+    storage_backend,
+)
 
 ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png"}
 MAX_FILE_SIZE = 1 * 1024 * 1024  # 1 MB
+CHUNK_SIZE = 64 * 1024  # bounds the memory one upload holds at a time
+
+# Leading bytes each allowed type starts with
+FILE_SIGNATURES = {
+    "jpg": b"\xff\xd8\xff",
+    "jpeg": b"\xff\xd8\xff",
+    "png": b"\x89PNG\r\n\x1a\n",
+}
+SIGNATURE_LENGTH = max(len(signature) for signature in FILE_SIGNATURES.values())
+# One stored extension per type, so identical bytes always map to one key
+CANONICAL_EXTENSIONS = {"jpg": "jpg", "jpeg": "jpg", "png": "png"}
+CONTENT_TYPES = {"jpg": "image/jpeg", "png": "image/png"}
+CONTENT_TYPE_EXTENSIONS = {content_type: ext for ext, content_type in CONTENT_TYPES.items()}
+
+
+@dataclass
+class PendingUpload:
+    """A validated upload streamed to a temp file; FileService.store() moves it to key."""
+    key: str
+    temp_path: Path
+
+    @property
+    def url(self) -> str:
+        return f"{UPLOAD_URL_PREFIX}{self.key}"
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self.key.rsplit(".", 1)[1]]
+
+    def discard(self) -> None:
+        self.temp_path.unlink(missing_ok=True)
 
 
 class FileService:
 
-    def __init__(self, upload_dir: str = "uploads"):
+    def __init__(self, upload_dir: str = "uploads", storage: Optional[StorageBackend] = None):
+        # Temp files are streamed here before they are handed to storage
         self.upload_dir = Path(upload_dir)
         self.upload_dir.mkdir(exist_ok=True)
+        self.storage = storage or storage_backend
 
     async def save_uploaded_file(self, file: UploadFile) -> str:
-        content = await file.read()
-        self.validate_file(file, content)
+        upload = await self.prepare_upload(file)
+        await self.store(upload)
+        return upload.url
 
-        timestamp = int(time.time())
-        file_name = f"{timestamp}-{file.filename}"
-        file_path = self.upload_dir / file_name
+    async def store(self, upload: PendingUpload) -> None:
+        """Hands a prepared upload to storage and queues its resized variants."""
+        await self.storage.save(upload.key, upload.temp_path, upload.content_type)
+        # Variants are generated from local files; object storage serves originals only
+        if isinstance(self.storage, LocalStorageBackend):
+            image_pipeline.schedule(self.storage.path(upload.key), upload.url)
 
-        with open(file_path, "wb") as buffer:
-            buffer.write(content)
+    async def create_direct_upload(
+        self, content_type: str, size: int, sha256: str
+    ) -> tuple[str, Optional[PresignedUpload]]:
+        """The image URL and storage request for an upload that bypasses the API.
+
+        The key is derived from the sha256 the client declares, and storage
+        verifies the body against it, so the content-addressed layout holds.
+        The request is None when identical bytes are already stored.
+        """
+        ext = CONTENT_TYPE_EXTENSIONS.get(content_type)
+        if ext is None:
+            raise FileValidationError(
+                f"Invalid file type. Allowed: {', '.join(CONTENT_TYPES.values())}")
+        if size > MAX_FILE_SIZE:
+            raise FileValidationError("File too large. Max size allowed is 1MB")
+        key = self.blob_key(sha256, ext)
+        presigned = self.storage.presign_upload(key, content_type, size, sha256)
+        if presigned is None:
+            raise UnsupportedOperationError(
+                "Direct uploads need an object storage backend (STORAGE_BACKEND=s3)")
+        if await self.storage.exists(key):
+            await self.storage.touch(key)
+            return f"{UPLOAD_URL_PREFIX}{key}", None
+        return f"{UPLOAD_URL_PREFIX}{key}", presigned
 
-        return f"/{self.upload_dir}/{file_name}"
+    async def claim_direct_upload(self, image_url: str) -> str:
+        """Checks that a directly uploaded image exists and is one before a row points at it.
 
-    async def save_optional_file(
-        self,
-        file: UploadFile | None,
-        default_path: str = "/images/default.jpg"
-    ) -> str:
-        if file:
-            return await self.save_uploaded_file(file)
-        return default_path
+        The signed checksum only proves the bytes are what the client
+        declared, so their first bytes are checked against the type here.
+        """
+        key = image_url.removeprefix(UPLOAD_URL_PREFIX)
+        if not image_url.startswith(UPLOAD_URL_PREFIX) or not BLOB_KEY.match(key):
+            raise FileValidationError("Not an uploaded image URL")
+        head = await self.storage.read_prefix(key, SIGNATURE_LENGTH)
+        if head is None:
+            raise FileValidationError("Image has not been uploaded")
+        self.validate_signature(head, key.rsplit(".", 1)[1])
+        # Restarts the reaper's grace period, which covers the row being written
+        await self.storage.touch(key)
+        return image_url
 
-    async def delete_file_if_exists(self, relative_path: str) -> None:
+    async def prepare_upload(self, file: UploadFile) -> PendingUpload:
+        """Streams an upload into a temp file, validating it chunk by chunk.
+
+        The upload is abandoned, and its temp file removed, as soon as it
+        exceeds MAX_FILE_SIZE or its first bytes do not match its extension.
+        """
+        ext = self.validate_extension(file)
+        temp_path = self.upload_dir / f".{uuid4().hex}.part"
         try:
-            # Ensure no leading slash (so the join works properly)
-            clean_path = relative_path.lstrip("/")
-            file_path = Path(clean_path)
-            if file_path.exists():
-                file_path.unlink()
-        except Exception as e:
-            print(f"Warning: failed to delete file {relative_path}: {e}")
-
-    def validate_file(self, file: UploadFile, content: bytes) -> None:
-        """Validate file type and size."""
+            digest, ext = await self._stream_to(file, temp_path, ext)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        return PendingUpload(key=self.blob_key(digest, ext), temp_path=temp_path)
+
+    def blob_key(self, digest: str, ext: str) -> str:
+        """Content-addressed key: ab/cd/abcd....png, fanned out over 65536 directories."""
+        return f"{digest[:2]}/{digest[2:4]}/{digest}.{CANONICAL_EXTENSIONS[ext]}"
+
+    async def _stream_to(
+        self, file: UploadFile, temp_path: Path, ext: Optional[str]
+    ) -> tuple[str, str]:
+        """Writes the upload to temp_path; returns its sha256 and its detected type."""
+        size = 0
+        head = b""
+        detected_ext = ext or ""
+        digest = hashlib.sha256()
+        async with await anyio.open_file(temp_path, "wb") as buffer:
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise FileValidationError(
+                        "File too large. Max size allowed is 1MB"
+                    )
+                if len(head) < SIGNATURE_LENGTH:
+                    head += chunk[:SIGNATURE_LENGTH - len(head)]
+                    if len(head) == SIGNATURE_LENGTH:
+                        detected_ext = self.validate_signature(head, ext)
+                digest.update(chunk)
+                await buffer.write(chunk)
+        if len(head) < SIGNATURE_LENGTH:
+            detected_ext = self.validate_signature(head, ext)
+        return digest.hexdigest(), detected_ext
+
+    def validate_extension(self, file: UploadFile) -> Optional[str]:
+        """Validate the file type by its name; None when the upload has no name."""
         if not file.filename:
-            return
+            return None
         ext = file.filename.split(".")[-1].lower()
         if ext not in ALLOWED_EXTENSIONS:
             raise FileValidationError(
                 f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
             )
-        if len(content) > MAX_FILE_SIZE:
-            raise FileValidationError(
-                "File too large. Max size allowed is 1MB"
-            )
+        return ext
+
+    def validate_signature(self, head: bytes, ext: Optional[str]) -> str:
+        """Validate that the content starts like the type its name claims; returns that type."""
+        candidates = [ext] if ext else list(FILE_SIGNATURES)
+        for candidate in candidates:
+            if head.startswith(FILE_SIGNATURES[candidate]):
+                return candidate
+        raise FileValidationError(
+            "File content does not match its type"
+        )
 
     def build_file_url(self, path: str) -> str:
+        if path.startswith(UPLOAD_URL_PREFIX):
+            return self.storage.url(path.removeprefix(UPLOAD_URL_PREFIX))
         return f"{config.server_url}{path}"
+
+    def build_srcset(self, path: str) -> dict[str, str]:
+        """srcset strings per MIME type for an image's resized variants, if they are ready."""
+        # Variants are only generated next to files on local disk
+        if not isinstance(self.storage, LocalStorageBackend):
+            return {}
+        srcsets: dict[str, list[str]] = {}
+        for variant in image_pipeline.variants(path):
+            srcsets.setdefault(MIME_TYPES[variant["format"]], []).append(
+                f"{self.build_file_url('/' + variant['path'])} {variant['width']}w")
+        return {mime_type: ", ".join(entries) for mime_type, entries in srcsets.items()}
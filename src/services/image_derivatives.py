@@ -0,0 +1,189 @@
+"""
+Resized, re-encoded variants of uploaded images.
+
+Each upload gets a variant per configured width and format, written next to
+it as <name>.w<width>.<format>. A <name>.variants.json manifest, written
+last, lists them. Variants are generated on a process pool after the upload
+is saved, so no request waits for them. Responses list the variants from the
+manifest to build srcsets and fall back to the original until it is read.
+Manifests are read in a thread, never on the event loop.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from PIL import Image, ImageOps
+
+from src.config import config
+from src.services.storage import BLOB_KEY, UPLOAD_URL_PREFIX
+
+logger = logging.getLogger(__name__)
+
+MIME_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+ENCODER_OPTIONS: dict[str, dict[str, Any]] = {
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60},
+}
+# How long an upload without a manifest is taken to have none before looking again
+MISSING_RECHECK_SECONDS = 30.0
+
+
+def manifest_path(source: Path) -> Path:
+    return source.with_name(f"{source.stem}.variants.json")
+
+
+def read_manifest(relative_path: str) -> Optional[list[dict[str, Any]]]:
+    """The variants listed next to an upload; None when it has no readable manifest."""
+    try:
+        return json.loads(manifest_path(Path(relative_path.lstrip("/"))).read_text())["variants"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def generate_derivatives(source: str, widths: list[int], formats: list[str]) -> list[dict[str, Any]]:
+    """Writes the variants of one image and its manifest; runs in a worker process.
+
+    Only widths narrower than the original are produced (the original itself
+    if it is narrower than all of them), so nothing is upscaled.
+    """
+    source_path = Path(source)
+    manifest = manifest_path(source_path)
+    if manifest.exists():
+        # Content-addressed uploads share variants with every earlier copy
+        return json.loads(manifest.read_text())["variants"]
+
+    variants: list[dict[str, Any]] = []
+    with Image.open(source_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        targets = [width for width in sorted(widths) if width < image.width] or [image.width]
+
+        for width in targets:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize(
+                (width, height), Image.Resampling.LANCZOS)
+            for image_format in formats:
+                target = source_path.with_name(f"{source_path.stem}.w{width}.{image_format}")
+                temp = target.with_name(f".{target.name}.part")
+                resized.save(temp, format=image_format.upper(), **ENCODER_OPTIONS[image_format])
+                os.replace(temp, target)
+                variants.append({
+                    "path": target.as_posix(),
+                    "width": width,
+                    "format": image_format,
+                })
+
+    temp_manifest = manifest.with_name(f".{manifest.name}.part")
+    temp_manifest.write_text(json.dumps({"variants": variants}))
+    os.replace(temp_manifest, manifest)
+    return variants
+
+
+class ImageDerivativePipeline:
+    """Schedules variant generation on a process pool and reads back the manifests."""
+
+    def __init__(self, widths: list[int], formats: list[str], workers: int, cache_entries: int = 10_000):
+        self.widths = widths
+        self.formats = formats
+        self.workers = workers
+        self.cache_entries = cache_entries
+        self._executor: Optional[Executor] = None
+        self._pending: set[asyncio.Future[Any]] = set()
+        # Variants of a content-addressed file never change once listed
+        self._variants: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        # Uploads found without a manifest, until when they are taken to have none
+        self._missing: OrderedDict[str, float] = OrderedDict()
+        self._reads: dict[str, asyncio.Task[None]] = {}
+
+    def schedule(self, source: Path, image_url: Optional[str] = None) -> None:
+        """Queues variant generation for a saved upload without waiting for it."""
+        if not self.formats or not self.widths or manifest_path(source).exists():
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._get_executor(), generate_derivatives, str(source), self.widths, self.formats)
+        self._pending.add(future)
+        future.add_done_callback(lambda done: self._finished(done, image_url))
+
+    def _finished(self, future: "asyncio.Future[Any]", image_url: Optional[str]) -> None:
+        self._pending.discard(future)
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.error("Failed to generate image variants", exc_info=future.exception())
+        elif image_url is not None:
+            self._remember(image_url, future.result())
+
+    def variants(self, relative_path: str) -> list[dict[str, Any]]:
+        """The generated variants of an upload; empty until its manifest has been read.
+
+        Never touches the disk. An upload not seen before has its manifest
+        read in a thread and its variants listed from the next call on.
+        """
+        cached = self._variants.get(relative_path)
+        if cached is not None:
+            self._variants.move_to_end(relative_path)
+            return cached
+        # Defaults and uploads from before content addressing never get variants
+        if not BLOB_KEY.match(relative_path.removeprefix(UPLOAD_URL_PREFIX)):
+            return []
+        if self._missing.get(relative_path, 0.0) > time.monotonic():
+            return []
+        self._start_read(relative_path)
+        return []
+
+    def forget(self, relative_path: str) -> None:
+        self._variants.pop(relative_path, None)
+        self._missing.pop(relative_path, None)
+
+    def _start_read(self, relative_path: str) -> None:
+        if relative_path in self._reads:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._read(relative_path))
+        except RuntimeError:
+            # Outside the event loop nothing can wait for the read
+            return
+        self._reads[relative_path] = task
+        task.add_done_callback(lambda _: self._reads.pop(relative_path, None))
+
+    async def _read(self, relative_path: str) -> None:
+        variants = await asyncio.to_thread(read_manifest, relative_path)
+        if variants is None:
+            self._missing[relative_path] = time.monotonic() + MISSING_RECHECK_SECONDS
+            self._missing.move_to_end(relative_path)
+            if len(self._missing) > self.cache_entries:
+                self._missing.popitem(last=False)
+        else:
+            self._remember(relative_path, variants)
+
+    def _remember(self, relative_path: str, variants: list[dict[str, Any]]) -> None:
+        self._missing.pop(relative_path, None)
+        self._variants[relative_path] = variants
+        self._variants.move_to_end(relative_path)
+        if len(self._variants) > self.cache_entries:
+            self._variants.popitem(last=False)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+image_pipeline = ImageDerivativePipeline(
+    widths=config.IMAGE_VARIANT_WIDTHS,
+    formats=config.IMAGE_VARIANT_FORMATS,
+    workers=config.IMAGE_VARIANT_WORKERS,
+)
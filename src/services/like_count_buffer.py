@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import config
+from src.repositories.blog_repository import BlogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LikeCountBuffer:
+    """Per-blog like_count deltas held in memory and written in one batched UPDATE.
+
+    Used when LIKE_COUNT_MODE is "write_behind": like toggles stop queueing
+    on the blog row's lock and the counter row is updated once per flush.
+    Deltas live in this process only; readers add pending() to the stored
+    count, and deltas not yet flushed are lost if the process dies.
+    """
+
+    def __init__(self, flush_interval_seconds: float, max_pending: int):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+        self._deltas: defaultdict[UUID, int] = defaultdict(int)
+        # The batch being written; still counted by pending() until it commits
+        self._in_flight: dict[UUID, int] = {}
+        self._pending_toggles = 0
+        self._wake = asyncio.Event()
+        self._stopping = False
+
+    def add(self, blog_id: UUID, delta: int) -> None:
+        self._deltas[blog_id] += delta
+        self._pending_toggles += 1
+        if self._pending_toggles >= self.max_pending:
+            self._wake.set()
+
+    def pending(self, blog_id: UUID) -> int:
+        return self._deltas.get(blog_id, 0) + self._in_flight.get(blog_id, 0)
+
+    async def flush(self, session_maker: async_sessionmaker) -> int:
+        """Writes every buffered delta; returns how many blogs were updated."""
+        # Swapped out before the first await so toggles during the write start a new batch
+        batch = {blog_id: delta for blog_id, delta in self._deltas.items() if delta}
+        self._deltas = defaultdict(int)
+        self._pending_toggles = 0
+        if not batch:
+            return 0
+
+        self._in_flight = batch
+        try:
+            async with session_maker() as session:
+                await BlogRepository(session).apply_like_deltas(batch)
+                # Committed: readers now see the batch in the stored count
+                self._in_flight = {}
+        except Exception:
+            # Keep the deltas for the next flush rather than losing them
+            self._in_flight = {}
+            for blog_id, delta in batch.items():
+                self._deltas[blog_id] += delta
+            raise
+        return len(batch)
+
+    async def run(self, session_maker: async_sessionmaker) -> None:
+        """Flushes every interval or when max_pending toggles pile up, and once more on stop()."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush(session_maker)
+            except Exception:
+                logger.exception("Failed to flush buffered like counts")
+        try:
+            await self.flush(session_maker)
+        except Exception:
+            # Shutdown goes on; these deltas are lost with the process
+            logger.exception("Failed to flush buffered like counts on shutdown")
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+
+
+like_count_buffer = LikeCountBuffer(
+    flush_interval_seconds=config.LIKE_FLUSH_INTERVAL_SECONDS,
+    max_pending=config.LIKE_FLUSH_MAX_PENDING,
+)
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.repositories.blog_like_repository import BlogLikeRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LikeCounterCompactor:
+    """Periodically folds blog_like_counters shards back into blogs.like_count.
+
+    Used when LIKE_COUNT_MODE is "sharded". Readers add the remaining shards
+    to the stored count, so compaction only keeps the shard table small and
+    like_count close to the truth for anything that reads the column alone.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._wake = asyncio.Event()
+        self._stopping = False
+
+    async def compact(self, session_maker: async_sessionmaker) -> int:
+        async with session_maker() as session:
+            return await BlogLikeRepository(session).fold_counter_shards()
+
+    async def run(self, session_maker: async_sessionmaker) -> None:
+        """Compacts every interval until stop(), then once more."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.compact(session_maker)
+            except Exception:
+                logger.exception("Failed to compact like counter shards")
+        try:
+            await self.compact(session_maker)
+        except Exception:
+            # Shutdown goes on; the shards stay and are folded on the next start
+            logger.exception("Failed to compact like counter shards on shutdown")
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
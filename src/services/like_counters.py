@@ -0,0 +1,99 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Optional, Protocol
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import config
+from src.repositories.blog_like_repository import BlogLikeRepository
+from src.services.like_count_buffer import LikeCountBuffer, like_count_buffer
+from src.services.like_counter_compactor import LikeCounterCompactor
+
+
+class MaintenanceJob(Protocol):
+    """Background work a counter needs, run for the lifetime of the app."""
+
+    async def run(self, session_maker: async_sessionmaker) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class LikeCounter(ABC):
+    """How a like toggle reaches blogs.like_count."""
+
+    @abstractmethod
+    async def record(
+        self, repo: BlogLikeRepository, blog_id: str, user_id: UUID, is_liked: bool
+    ) -> Optional[bool]:
+        """Stores the like state; None when the blog does not exist, else whether it changed."""
+
+    async def unapplied(self, repo: BlogLikeRepository, blog_id: UUID) -> int:
+        """Likes counted somewhere other than blogs.like_count, to add when reading it."""
+        return 0
+
+    def maintenance_job(self) -> Optional[MaintenanceJob]:
+        return None
+
+
+class InlineLikeCounter(LikeCounter):
+    """Updates blogs.like_count in the toggle's own statement."""
+
+    async def record(
+        self, repo: BlogLikeRepository, blog_id: str, user_id: UUID, is_liked: bool
+    ) -> Optional[bool]:
+        return await repo.set_like_status(blog_id, user_id, is_liked)
+
+
+class WriteBehindLikeCounter(LikeCounter):
+    """Buffers deltas in this process; the buffer flushes them to blogs.like_count in batches."""
+
+    def __init__(self, buffer: LikeCountBuffer):
+        self.buffer = buffer
+
+    async def record(
+        self, repo: BlogLikeRepository, blog_id: str, user_id: UUID, is_liked: bool
+    ) -> Optional[bool]:
+        state_changed = await repo.set_like_status(
+            blog_id, user_id, is_liked, adjust_count=False)
+        if state_changed:
+            self.buffer.add(UUID(blog_id), 1 if is_liked else -1)
+        return state_changed
+
+    async def unapplied(self, repo: BlogLikeRepository, blog_id: UUID) -> int:
+        return self.buffer.pending(blog_id)
+
+    def maintenance_job(self) -> Optional[MaintenanceJob]:
+        return self.buffer
+
+
+class ShardedLikeCounter(LikeCounter):
+    """Spreads deltas over blog_like_counters rows; compaction folds them into blogs.like_count."""
+
+    def __init__(self, shards: int, compact_interval_seconds: float):
+        self.shards = shards
+        self.compactor = LikeCounterCompactor(compact_interval_seconds)
+
+    async def record(
+        self, repo: BlogLikeRepository, blog_id: str, user_id: UUID, is_liked: bool
+    ) -> Optional[bool]:
+        return await repo.set_like_status(
+            blog_id, user_id, is_liked, shard=random.randrange(self.shards))
+
+    async def unapplied(self, repo: BlogLikeRepository, blog_id: UUID) -> int:
+        return await repo.sum_counter_shards(blog_id)
+
+    def maintenance_job(self) -> Optional[MaintenanceJob]:
+        return self.compactor
+
+
+def like_counter_from_config() -> LikeCounter:
+    if config.LIKE_COUNT_MODE == "write_behind":
+        return WriteBehindLikeCounter(like_count_buffer)
+    if config.LIKE_COUNT_MODE == "sharded":
+        return ShardedLikeCounter(
+            config.LIKE_COUNTER_SHARDS, config.LIKE_COUNTER_COMPACT_INTERVAL_SECONDS)
+    return InlineLikeCounter()
+
+
+like_counter = like_counter_from_config()
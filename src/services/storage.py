@@ -0,0 +1,361 @@
+"""
+Where uploaded files live.
+
+Rows store an upload as "/uploads/<key>", with the key naming the file by
+its content hash, whichever backend holds the bytes. The local backend keeps
+them under uploads/ and serves them from the /uploads mount. The S3 backend
+keeps them in a bucket (AWS, MinIO or another S3-compatible service). It can
+also presign direct uploads, so image bytes never pass through the API
+workers.
+"""
+import asyncio
+import base64
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
+
+from src.config import config
+
+UPLOAD_URL_PREFIX = "/uploads/"
+# Presigned GET URLs kept per worker, so repeated renders of one image agree
+SIGNED_URL_CACHE_ENTRIES = 10_000
+# ab/cd/abcd....png: an original upload, named by the sha256 of its bytes
+BLOB_KEY = re.compile(r"^([0-9a-f]{2})/([0-9a-f]{2})/\1\2[0-9a-f]{60}\.(jpg|png)$")
+# <timestamp>-<client filename>, at the root: uploads saved before content addressing
+LEGACY_KEY = re.compile(r"^[0-9]+-[^/]+\.(jpg|jpeg|png)$", re.IGNORECASE)
+
+
+@dataclass
+class PresignedUpload:
+    """A request the client sends straight to storage to upload one object."""
+    url: str
+    method: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class StoredObject:
+    """One stored file, as listed by StorageBackend.scan()."""
+    key: str
+    size: int
+    modified_at: float
+
+
+class StorageBackend(ABC):
+
+    @abstractmethod
+    async def save(self, key: str, source: Path, content_type: str) -> None:
+        """Stores source under key and removes source; an existing key is kept as is."""
+        ...
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def read_prefix(self, key: str, length: int) -> Optional[bytes]:
+        """The first length bytes of key, or None if it does not exist."""
+        ...
+
+    @abstractmethod
+    async def modified_at(self, key: str) -> Optional[float]:
+        """Unix time key was last written, or None if it does not exist."""
+        ...
+
+    @abstractmethod
+    async def touch(self, key: str) -> None:
+        """Marks key as just written, restarting its grace period."""
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> int:
+        """Deletes key and everything derived from it (keys sharing its stem); returns bytes freed."""
+        ...
+
+    @abstractmethod
+    def scan(self) -> AsyncIterator[StoredObject]:
+        """Every stored file, derived ones included, a directory or page at a time."""
+        ...
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """URL a client downloads key from."""
+        ...
+
+    def presign_upload(
+        self, key: str, content_type: str, size: int, sha256: str
+    ) -> Optional[PresignedUpload]:
+        """A direct upload the storage verifies against size and sha256, if supported."""
+        return None
+
+
+class LocalStorageBackend(StorageBackend):
+
+    def __init__(self, root: str = "uploads"):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    async def save(self, key: str, source: Path, content_type: str) -> None:
+        target = self.path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            # Same bytes are already stored; refresh the mtime so the reaper
+            # leaves the old copy alone until a row references it again
+            await self.touch(key)
+            source.unlink(missing_ok=True)
+            return
+        # Same filesystem, so the rename is atomic: readers never see a partial file
+        os.replace(source, target)
+
+    async def exists(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    async def read_prefix(self, key: str, length: int) -> Optional[bytes]:
+        return await asyncio.to_thread(self._read_prefix, self.path(key), length)
+
+    @staticmethod
+    def _read_prefix(target: Path, length: int) -> Optional[bytes]:
+        try:
+            with open(target, "rb") as file:
+                return file.read(length)
+        except FileNotFoundError:
+            return None
+
+    async def modified_at(self, key: str) -> Optional[float]:
+        try:
+            return self.path(key).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    async def touch(self, key: str) -> None:
+        os.utime(self.path(key))
+
+    async def delete(self, key: str) -> int:
+        return await asyncio.to_thread(self._delete, self.path(key), bool(BLOB_KEY.match(key)))
+
+    @staticmethod
+    def _delete(target: Path, with_derived: bool) -> int:
+        freed = 0
+        # Resized variants and their manifest share a blob's stem; a legacy
+        # name may share its stem with an unrelated upload, so it goes alone
+        for derived in target.parent.glob(f"{target.stem}.*") if with_derived else [target]:
+            try:
+                freed += derived.stat().st_size
+                derived.unlink()
+            except FileNotFoundError:
+                pass
+        return freed
+
+    async def scan(self) -> AsyncIterator[StoredObject]:
+        # Uploads from before content addressing sit at the root
+        for stored in await asyncio.to_thread(self._list_files, self.root):
+            yield stored
+        # Keys fan out as ab/cd/<hash>, so each listing covers one small directory
+        for first in await asyncio.to_thread(self._subdirectories, self.root):
+            for second in await asyncio.to_thread(self._subdirectories, first):
+                for stored in await asyncio.to_thread(self._list_files, second):
+                    yield stored
+
+    @staticmethod
+    def _subdirectories(directory: Path) -> list[Path]:
+        try:
+            with os.scandir(directory) as entries:
+                return sorted(Path(entry.path) for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            return []
+
+    def _list_files(self, directory: Path) -> list[StoredObject]:
+        files: list[StoredObject] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    key = Path(entry.path).relative_to(self.root).as_posix()
+                    files.append(StoredObject(key, stat.st_size, stat.st_mtime))
+        except FileNotFoundError:
+            pass
+        return files
+
+    def url(self, key: str) -> str:
+        return f"{config.server_url}{UPLOAD_URL_PREFIX}{key}"
+
+
+class S3StorageBackend(StorageBackend):
+    """An S3-compatible bucket; boto3 is only needed when this backend is configured."""
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str = "",
+        region: str = "us-east-1",
+        access_key_id: str = "",
+        secret_access_key: str = "",
+        public_base_url: str = "",
+        presign_expiry_seconds: int = 900,
+    ):
+        try:
+            import boto3
+            from botocore.config import Config as BotoConfig
+        except ImportError as exc:
+            raise RuntimeError(
+                "STORAGE_BACKEND=s3 needs boto3: pip install boto3") from exc
+
+        self.bucket = bucket
+        self.public_base_url = public_base_url.rstrip("/")
+        self.presign_expiry_seconds = presign_expiry_seconds
+        # A reused URL still has at least half its lifetime left when it is rendered
+        self.signed_url_reuse_seconds = presign_expiry_seconds / 2
+        self._signed_urls: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region,
+            aws_access_key_id=access_key_id or None,
+            aws_secret_access_key=secret_access_key or None,
+            # Path-style addressing works with MinIO and with AWS alike
+            config=BotoConfig(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+
+    async def save(self, key: str, source: Path, content_type: str) -> None:
+        try:
+            if await self.exists(key):
+                await self.touch(key)
+            else:
+                await asyncio.to_thread(
+                    self.client.upload_file, str(source), self.bucket, key,
+                    ExtraArgs={"ContentType": content_type,
+                               "CacheControl": "public, max-age=31536000, immutable"})
+        finally:
+            source.unlink(missing_ok=True)
+
+    async def exists(self, key: str) -> bool:
+        return await self.modified_at(key) is not None
+
+    async def read_prefix(self, key: str, length: int) -> Optional[bytes]:
+        from botocore.exceptions import ClientError
+        try:
+            response = await asyncio.to_thread(
+                self.client.get_object, Bucket=self.bucket, Key=key, Range=f"bytes=0-{length - 1}")
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return await asyncio.to_thread(response["Body"].read)
+
+    async def modified_at(self, key: str) -> Optional[float]:
+        head = await self._head(key)
+        return None if head is None else head["LastModified"].timestamp()
+
+    async def _head(self, key: str) -> Optional[dict[str, Any]]:
+        from botocore.exceptions import ClientError
+        try:
+            return await asyncio.to_thread(self.client.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    async def touch(self, key: str) -> None:
+        # An in-place copy is the only way to bump LastModified; it stays server side
+        head = await self._head(key)
+        if head is None:
+            return
+        await asyncio.to_thread(
+            self.client.copy_object, Bucket=self.bucket, Key=key,
+            CopySource={"Bucket": self.bucket, "Key": key},
+            MetadataDirective="REPLACE",
+            ContentType=head.get("ContentType", "application/octet-stream"),
+            CacheControl=head.get("CacheControl", "public, max-age=31536000, immutable"))
+
+    async def delete(self, key: str) -> int:
+        # Only a blob has derived objects under its stem
+        prefix = f"{key.rsplit('.', 1)[0]}." if BLOB_KEY.match(key) else key
+        listing = await asyncio.to_thread(
+            self.client.list_objects_v2, Bucket=self.bucket, Prefix=prefix)
+        contents = [item for item in listing.get("Contents", [])
+                    if BLOB_KEY.match(key) or item["Key"] == key]
+        if contents:
+            await asyncio.to_thread(
+                self.client.delete_objects, Bucket=self.bucket,
+                Delete={"Objects": [{"Key": item["Key"]} for item in contents]})
+        return sum(item["Size"] for item in contents)
+
+    async def scan(self) -> AsyncIterator[StoredObject]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = iter(paginator.paginate(Bucket=self.bucket))
+        # Each page (up to 1000 keys) is fetched off the event loop
+        while (page := await asyncio.to_thread(next, pages, None)) is not None:
+            for item in page.get("Contents", []):
+                yield StoredObject(item["Key"], item["Size"], item["LastModified"].timestamp())
+
+    def url(self, key: str) -> str:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{key}"
+        # Each signature carries its signing time, so a fresh one per render would
+        # change every cached body and ETag and make browsers download the image again
+        now = time.monotonic()
+        cached = self._signed_urls.get(key)
+        if cached is not None and now - cached[1] < self.signed_url_reuse_seconds:
+            self._signed_urls.move_to_end(key)
+            return cached[0]
+        url = self.client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=self.presign_expiry_seconds)
+        self._signed_urls[key] = (url, now)
+        self._signed_urls.move_to_end(key)
+        if len(self._signed_urls) > SIGNED_URL_CACHE_ENTRIES:
+            self._signed_urls.popitem(last=False)
+        return url
+
+    def presign_upload(
+        self, key: str, content_type: str, size: int, sha256: str
+    ) -> Optional[PresignedUpload]:
+        # Length, type and checksum are signed, so storage rejects any other body
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ContentType": content_type,
+                "ContentLength": size,
+                "ChecksumSHA256": checksum,
+                "CacheControl": "public, max-age=31536000, immutable",
+            },
+            ExpiresIn=self.presign_expiry_seconds,
+        )
+        return PresignedUpload(url=url, method="PUT", headers={
+            "Content-Type": content_type,
+            "Content-Length": str(size),
+            "x-amz-checksum-sha256": checksum,
+            "Cache-Control": "public, max-age=31536000, immutable",
+        })
+
+
+def storage_backend_from_config() -> StorageBackend:
+    if config.STORAGE_BACKEND == "s3":
+        return S3StorageBackend(
+            bucket=config.S3_BUCKET,
+            endpoint_url=config.S3_ENDPOINT_URL,
+            region=config.S3_REGION,
+            access_key_id=config.S3_ACCESS_KEY_ID,
+            secret_access_key=config.S3_SECRET_ACCESS_KEY,
+            public_base_url=config.S3_PUBLIC_BASE_URL,
+            presign_expiry_seconds=config.S3_PRESIGN_EXPIRY_SECONDS,
+        )
+    return LocalStorageBackend()
+
+
+storage_backend = storage_backend_from_config()
@@ -0,0 +1,216 @@
+"""
+Background deletion of uploads nothing references.
+
+Requests never delete files. A blog edit or delete only changes rows, and an
+upload from a request that later failed is simply left behind. The reaper
+periodically walks storage a directory (or S3 page) at a time, asks the
+database which of each batch of files blogs or users still point at, and
+deletes the rest once they are older than UPLOAD_GRACE_SECONDS. The grace
+period covers uploads whose row is still being written. Uploads saved at the
+root of the upload directory before content addressing are reaped the same
+way. It also removes the temp files that abandoned uploads and interrupted
+variant encodes leave behind.
+"""
+import asyncio
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import config
+from src.repositories.image_reference_repository import ImageReferenceRepository
+from src.services.image_derivatives import image_pipeline
+from src.services.storage import (
+    BLOB_KEY,
+    LEGACY_KEY,
+    UPLOAD_URL_PREFIX,
+    StorageBackend,
+    StoredObject,
+    storage_backend,
+)
+
+logger = logging.getLogger(__name__)
+
+# Any fixed key works; it only has to differ from other advisory locks in the database
+REAPER_LOCK_KEY = 0x75706C64
+
+# .<name>.part: a file being written, renamed into place once complete
+TEMP_FILE_NAME = re.compile(r"^\..+\.part$")
+
+ReferenceLookup = Callable[[list[str]], Awaitable[set[str]]]
+
+
+@dataclass
+class ReapReport:
+    files_scanned: int = 0
+    files_deleted: int = 0
+    temp_files_deleted: int = 0
+    bytes_reclaimed: int = 0
+    duration_seconds: float = 0.0
+
+
+class UploadReaper:
+    """Deletes unreferenced uploads and stale temp files every interval."""
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        upload_dir: str = "uploads",
+        interval_seconds: float = 600.0,
+        grace_seconds: float = 300.0,
+        batch_size: int = 500,
+    ):
+        self.storage = storage
+        self.upload_dir = Path(upload_dir)
+        self.interval_seconds = interval_seconds
+        self.grace_seconds = grace_seconds
+        self.batch_size = batch_size
+        self.last_report: Optional[ReapReport] = None
+        self.totals = ReapReport()
+        self.runs = 0
+        self._wake = asyncio.Event()
+        self._stopping = False
+
+    async def reap(self, session_maker: async_sessionmaker) -> Optional[ReapReport]:
+        """One pass; None when another worker holds the reaper lock."""
+        async with session_maker() as lock_session:
+            # Held until this session's transaction ends, so only one worker scans at a time
+            locked = await lock_session.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REAPER_LOCK_KEY})
+            if not locked.scalar():
+                return None
+
+            async def find_referenced(image_urls: list[str]) -> set[str]:
+                async with session_maker() as session:
+                    return await ImageReferenceRepository(session).referenced_urls(image_urls)
+
+            report = await self.sweep(find_referenced)
+            await lock_session.rollback()
+        return report
+
+    async def sweep(self, find_referenced: ReferenceLookup) -> ReapReport:
+        started = time.monotonic()
+        report = ReapReport()
+        cutoff = time.time() - self.grace_seconds
+        batch: list[StoredObject] = []
+        async for stored in self.storage.scan():
+            if self._stopping:
+                break
+            report.files_scanned += 1
+            # Variant encodes write their temp files inside the shard directories
+            if TEMP_FILE_NAME.match(stored.key.rsplit("/", 1)[-1]):
+                if stored.modified_at <= cutoff:
+                    await self._delete_temp_file(stored, report)
+                continue
+            # Variants and manifests go with their original, never on their own
+            is_upload = BLOB_KEY.match(stored.key) or LEGACY_KEY.match(stored.key)
+            if not is_upload or stored.modified_at > cutoff:
+                continue
+            batch.append(stored)
+            if len(batch) >= self.batch_size:
+                await self._reap_batch(batch, find_referenced, report)
+                batch = []
+        if batch and not self._stopping:
+            await self._reap_batch(batch, find_referenced, report)
+
+        # Uploads stream into the local upload directory whichever backend stores them
+        temp_files, temp_bytes = await asyncio.to_thread(self._sweep_temp_files, cutoff)
+        report.temp_files_deleted += temp_files
+        report.bytes_reclaimed += temp_bytes
+        report.duration_seconds = time.monotonic() - started
+        self._record(report)
+        return report
+
+    async def _reap_batch(
+        self, batch: list[StoredObject], find_referenced: ReferenceLookup, report: ReapReport
+    ) -> None:
+        referenced = await find_referenced(
+            [f"{UPLOAD_URL_PREFIX}{stored.key}" for stored in batch])
+        for stored in batch:
+            image_url = f"{UPLOAD_URL_PREFIX}{stored.key}"
+            if image_url in referenced:
+                continue
+            try:
+                # The same bytes may have been uploaded again since the scan listed them
+                modified_at = await self.storage.modified_at(stored.key)
+                if modified_at is None or time.time() - modified_at < self.grace_seconds:
+                    continue
+                report.bytes_reclaimed += await self.storage.delete(stored.key)
+                report.files_deleted += 1
+                image_pipeline.forget(image_url)
+            except Exception:
+                logger.exception("Failed to delete unreferenced upload %s", image_url)
+
+    async def _delete_temp_file(self, stored: StoredObject, report: ReapReport) -> None:
+        try:
+            freed = await self.storage.delete(stored.key)
+        except Exception:
+            logger.exception("Failed to delete temp file %s", stored.key)
+            return
+        report.temp_files_deleted += 1
+        report.bytes_reclaimed += freed
+
+    def _sweep_temp_files(self, cutoff: float) -> tuple[int, int]:
+        deleted = freed = 0
+        for temp_path in self.upload_dir.glob(".*.part"):
+            try:
+                stat = temp_path.stat()
+                if stat.st_mtime > cutoff:
+                    continue
+                temp_path.unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+            freed += stat.st_size
+        return deleted, freed
+
+    def _record(self, report: ReapReport) -> None:
+        self.last_report = report
+        self.runs += 1
+        self.totals.files_scanned += report.files_scanned
+        self.totals.files_deleted += report.files_deleted
+        self.totals.temp_files_deleted += report.temp_files_deleted
+        self.totals.bytes_reclaimed += report.bytes_reclaimed
+        self.totals.duration_seconds += report.duration_seconds
+        logger.info(
+            "Upload reaper scanned %d files, deleted %d uploads and %d temp files, reclaimed %d bytes",
+            report.files_scanned, report.files_deleted,
+            report.temp_files_deleted, report.bytes_reclaimed)
+
+    def snapshot(self) -> dict:
+        return {
+            "runs": self.runs,
+            "last_run": asdict(self.last_report) if self.last_report else None,
+            "totals": asdict(self.totals),
+        }
+
+    async def run(self, session_maker: async_sessionmaker) -> None:
+        """Reaps every interval until stop(); a pass in progress ends at its next file."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping:
+                break
+            try:
+                await self.reap(session_maker)
+            except Exception:
+                logger.exception("Upload reaper pass failed")
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+
+
+upload_reaper = UploadReaper(
+    storage_backend,
+    interval_seconds=config.UPLOAD_REAPER_INTERVAL_SECONDS,
+    grace_seconds=config.UPLOAD_GRACE_SECONDS,
+    batch_size=config.UPLOAD_REAPER_BATCH_SIZE,
+)
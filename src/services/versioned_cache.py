@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+# (version of the whole cache, version of the key)
+Version = tuple[int, int]
+
+
+@dataclass
+class CachedValue(Generic[V]):
+    value: V
+    version: Version
+    fresh_until: float
+    stale_until: float
+
+
+class VersionedCache(Generic[K, V]):
+    """Loaded values in a bounded LRU, with at most one load per key at a time.
+
+    A value is served as is for ttl_seconds, then for another stale_seconds
+    while one background load replaces it. invalidate(key) drops one key and
+    invalidate() every key; either bumps a version, so a load started before
+    the write is not stored. Values live in this worker only: other workers
+    keep theirs until they go stale, so ttl_seconds plus stale_seconds bounds
+    how old a value can be. A reload equal to the cached value, per
+    unchanged(), keeps the cached one.
+    """
+    load_failure_level = logging.WARNING
+
+    def __init__(self, max_entries: int, ttl_seconds: float, stale_seconds: float = 0.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.version = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, CachedValue[V]] = OrderedDict()
+        # Key versions are only kept while the key is cached or loading, so this stays bounded
+        self._versions: dict[K, int] = {}
+        # In-flight loads by version too, so no request after a write joins one started before it
+        self._loading: dict[tuple[K, Version], asyncio.Task[V]] = {}
+
+    async def get(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        if self.max_entries <= 0:
+            return await load()
+
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and entry.version == self._version(key):
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._start_load(key, load)
+                return entry.value
+
+        self.misses += 1
+        # Shielded so a client that disconnects does not cancel the load others wait on
+        return await asyncio.shield(self._start_load(key, load))
+
+    def invalidate(self, key: Optional[K] = None) -> None:
+        if key is None:
+            self.version += 1
+            self._entries.clear()
+            # Loads from before the bump carry the old cache version, which never matches again
+            self._versions.clear()
+            return
+        self._entries.pop(key, None)
+        self._versions[key] = self._versions.get(key, 0) + 1
+        # With nothing in flight no old value can be stored, so the key's version can start over
+        self._forget_version(key)
+
+    def unchanged(self, cached: V, loaded: V) -> bool:
+        """Whether a reload matches the cached value; override to keep the cached one's validators."""
+        return False
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "version": self.version,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+    def _version(self, key: K) -> Version:
+        return self.version, self._versions.get(key, 0)
+
+    def _start_load(self, key: K, load: Callable[[], Awaitable[V]]) -> asyncio.Task[V]:
+        version = self._version(key)
+        task = self._loading.get((key, version))
+        if task is None:
+            task = asyncio.create_task(self._fill(key, load, version))
+            self._loading[(key, version)] = task
+            task.add_done_callback(lambda done: self._finish_load(key, version, done))
+        return task
+
+    async def _fill(self, key: K, load: Callable[[], Awaitable[V]], version: Version) -> V:
+        try:
+            value = await load()
+        finally:
+            self._loading.pop((key, version), None)
+        # A write during the load may not be in this value
+        if version != self._version(key):
+            if key not in self._entries:
+                self._forget_version(key)
+            return value
+
+        previous = self._entries.get(key)
+        if previous is not None and previous.version == version and self.unchanged(previous.value, value):
+            value = previous.value
+        now = time.monotonic()
+        self._entries[key] = CachedValue(
+            value, version, now + self.ttl_seconds, now + self.ttl_seconds + self.stale_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._forget_version(evicted)
+        return value
+
+    def _forget_version(self, key: K) -> None:
+        if not any(loading_key == key for loading_key, _ in self._loading):
+            self._versions.pop(key, None)
+
+    def _finish_load(self, key: K, version: Version, task: asyncio.Task[V]) -> None:
+        self._loading.pop((key, version), None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.log(self.load_failure_level, "Failed to load %s for %s: %s",
+                       type(self).__name__, key, task.exception())
@@ -0,0 +1,119 @@
+"""
+Static file serving for /uploads and /images with HTTP caching.
+
+Content-addressed uploads (named by the SHA-256 of their bytes) never change
+behind their URL, so they are marked immutable for a year; anything else is
+cached for STATIC_MAX_AGE_SECONDS. A conditional request for an upload is
+answered 304 from a stat of the file, before any precompressed sibling is
+looked up. Starlette's StaticFiles answers the other conditional requests,
+serves Range requests and uses the ASGI pathsend extension (sendfile) on
+servers that offer it. This adds the Cache-Control policy and serves
+precompressed .br/.gz siblings.
+"""
+import mimetypes
+import re
+import stat
+
+import anyio.to_thread
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from src.config import config
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# <aa>/<bb>/<sha256>.<anything>: the upload itself, its variants and their manifest
+CONTENT_ADDRESSED_PATH = re.compile(r"^([0-9a-f]{2})/([0-9a-f]{2})/\1\2[0-9a-f]{60}\.[^/]+$")
+# Preferred first; each is served only if the client accepts it and the sibling exists
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Already-compressed formats gain nothing from a second pass, so no sibling lookup
+INCOMPRESSIBLE_TYPES = {"image/jpeg", "image/png", "image/webp", "image/avif", "image/gif"}
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content codings an Accept-Encoding header allows, leaving out those with q=0."""
+    encodings = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        key, _, value = params.strip().partition("=")
+        if key.strip().lower() == "q":
+            try:
+                if float(value) == 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            encodings.add(name)
+    return encodings
+
+
+class CachedStaticFiles(StaticFiles):
+
+    def __init__(self, *args, max_age_seconds: int | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_age_seconds = (
+            config.STATIC_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds)
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = None
+        if scope["method"] in ("GET", "HEAD"):
+            response = await self._immutable_not_modified(path, scope)
+            if response is None:
+                response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if response.status_code in (200, 304):
+            response.headers["cache-control"] = self.cache_control(path)
+            response.headers["vary"] = "accept-encoding"
+        return response
+
+    def cache_control(self, path: str) -> str:
+        if self.is_content_addressed(path):
+            return IMMUTABLE_CACHE_CONTROL
+        return f"public, max-age={self.max_age_seconds}"
+
+    def is_content_addressed(self, path: str) -> bool:
+        return CONTENT_ADDRESSED_PATH.match(path.replace("\\", "/")) is not None
+
+    async def _immutable_not_modified(self, path: str, scope: Scope) -> Response | None:
+        if not self.is_content_addressed(path):
+            return None
+        request_headers = Headers(scope=scope)
+        if "if-none-match" not in request_headers and "if-modified-since" not in request_headers:
+            return None
+        # The blob may never have existed or the reaper may have deleted it,
+        # and the client's validator may be stale; anything but a match falls through
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None
+        response = FileResponse(full_path, stat_result=stat_result)
+        if not self.is_not_modified(response.headers, request_headers):
+            return None
+        return NotModifiedResponse(response.headers)
+
+    async def _precompressed_response(self, path: str, scope: Scope) -> Response | None:
+        media_type = mimetypes.guess_type(path)[0] or "text/plain"
+        if media_type in INCOMPRESSIBLE_TYPES:
+            return None
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        if not accepted:
+            return None
+
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + suffix)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+            response = FileResponse(
+                full_path, stat_result=stat_result, media_type=media_type,
+                headers={"content-encoding": encoding})
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
@@ -1,12 +1,24 @@
+import asyncio
+import os
+from pathlib import Path
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock
 from uuid import uuid4
 from datetime import datetime
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config import config
 
 from src.models.user import User
 from src.models.blog import Blog
 from src.schemas.user import UserCreateModel
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 @pytest.fixture
 def mock_user_repository():
@@ -71,3 +83,37 @@ def sample_user_create_data():
         email="john@example.com",
         password="password123"
     )
+
+
+@pytest.fixture
+def test_database_url() -> str:
+    """Throwaway PostgreSQL database for integration tests (its public schema is dropped)"""
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    return url
+
+
+async def _reset_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+
+
+@pytest_asyncio.fixture
+async def migrated_engine(test_database_url: str, monkeypatch: pytest.MonkeyPatch):
+    """Engine bound to a test database migrated to the latest Alembic revision"""
+    engine = create_async_engine(test_database_url)
+    await _reset_schema(engine)
+
+    # migrations/env.py reads the URL from the shared settings object
+    monkeypatch.setattr(config, "DATABASE_URL", test_database_url)
+    alembic_config = AlembicConfig(str(PROJECT_ROOT / "alembic.ini"))
+    # env.py drives its own event loop, so run it off this one
+    await asyncio.to_thread(alembic_command.upgrade, alembic_config, "head")
+
+    try:
+        yield engine
+    finally:
+        await _reset_schema(engine)
+        await engine.dispose()
@@ -37,3 +37,52 @@ class TestAuthService:
 
         assert result is None
         mock_user_repository.get_by_email.assert_called_once_with(email)
+
+
+class TestAuthServiceCreateUser:
+    """Unit tests for AuthService.create_user"""
+
+    @pytest.fixture(autouse=True)
+    def fast_hasher(self):
+        with patch("src.services.auth_service.password_hasher.hash", AsyncMock(return_value="hashed")):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_saves_profile_image_after_insert(self, mock_user_repository: AsyncMock, sample_user: User, sample_user_create_data: UserCreateModel):
+        mock_user_repository.create_if_email_free.return_value = sample_user
+        profile_image = MagicMock()
+        auth_service = AuthService(mock_user_repository)
+        auth_service.file_service = AsyncMock()
+
+        result = await auth_service.create_user(sample_user_create_data, profile_image)
+
+        assert result == sample_user
+        inserted = mock_user_repository.create_if_email_free.call_args.args[0]
+        assert inserted.password_hash == "hashed"
+        auth_service.file_service.store.assert_called_once_with(profile_image)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_returns_none_without_saving_image(self, mock_user_repository: AsyncMock, sample_user_create_data: UserCreateModel):
+        mock_user_repository.create_if_email_free.return_value = None
+        profile_image = MagicMock()
+        auth_service = AuthService(mock_user_repository)
+        auth_service.file_service = AsyncMock()
+
+        result = await auth_service.create_user(sample_user_create_data, profile_image)
+
+        assert result is None
+        auth_service.file_service.store.assert_not_called()
+        profile_image.discard.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_removes_user_when_image_cannot_be_saved(self, mock_user_repository: AsyncMock, sample_user: User, sample_user_create_data: UserCreateModel):
+        mock_user_repository.create_if_email_free.return_value = sample_user
+        profile_image = MagicMock()
+        auth_service = AuthService(mock_user_repository)
+        auth_service.file_service = AsyncMock()
+        auth_service.file_service.store.side_effect = OSError("disk full")
+
+        with pytest.raises(DatabaseError):
+            await auth_service.create_user(sample_user_create_data, profile_image)
+
+        mock_user_repository.delete_by_id.assert_called_once_with(sample_user.id)
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.responses import ModelResponse
+from src.schemas.api_response import APIResponse
+from src.schemas.blog import BlogDetail, UserInfo
+from src.services.blog_detail_cache import BlogDetailCache, DetailFragment
+
+BLOG_ID = "7d3c1f52-1c1e-4a44-9d0a-6a0f6c1b2e10"
+
+
+def detail_body(title: str) -> bytes:
+    author = UserInfo(id="u1", name='"isLikedByUser":false', image_url="https://example.com/a.png")
+    blog = BlogDetail(
+        id=BLOG_ID, title=title, body="Body", cover_image_url="https://example.com/c.png",
+        is_liked_by_user=False, total_likes=3, created_by=author, created_at="2026-01-02T03:04:05Z")
+    return ModelResponse(APIResponse(data={"blog": blog}, success=True, message="ok")).body
+
+
+class FragmentLoader:
+    """Counts loads and returns a fragment with a new title each time"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> DetailFragment:
+        self.calls += 1
+        await self.release.wait()
+        return DetailFragment.from_body(detail_body(f"Title {self.calls}"))
+
+
+class TestDetailFragment:
+    """Unit tests for DetailFragment"""
+
+    def test_only_the_like_flag_differs_between_viewers(self):
+        fragment = DetailFragment.from_body(detail_body('"isLikedByUser":false'))
+
+        liked = json.loads(fragment.render(True))["data"]["blog"]
+        not_liked = json.loads(fragment.render(False))["data"]["blog"]
+
+        assert liked["isLikedByUser"] is True
+        assert not_liked["isLikedByUser"] is False
+        assert liked["title"] == '"isLikedByUser":false'
+        assert {**liked, "isLikedByUser": False} == not_liked
+
+    def test_each_like_flag_gets_its_own_etag(self):
+        fragment = DetailFragment.from_body(detail_body("Title"))
+        retitled = DetailFragment.from_body(detail_body("Another title"))
+
+        assert fragment.etag(True) != fragment.etag(False)
+        assert fragment.etag(False) == DetailFragment.from_body(detail_body("Title")).etag(False)
+        assert retitled.etag(False) != fragment.etag(False)
+
+    def test_body_without_the_flag_is_rejected(self):
+        with pytest.raises(ValueError):
+            DetailFragment.from_body(b'{"data": {}}')
+
+
+class TestBlogDetailCache:
+    """Unit tests for BlogDetailCache"""
+
+    @pytest.mark.asyncio
+    async def test_fragment_is_reused_until_invalidated(self):
+        cache = BlogDetailCache(max_entries=4, ttl_seconds=60)
+        load = FragmentLoader()
+
+        await cache.get(BLOG_ID, load)
+        await cache.get(BLOG_ID, load)
+        assert load.calls == 1
+
+        cache.invalidate(BLOG_ID)
+        await cache.get(BLOG_ID, load)
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_load_started_before_a_write_is_not_stored(self):
+        cache = BlogDetailCache(max_entries=4, ttl_seconds=60)
+        load = FragmentLoader()
+        load.release.clear()
+
+        pending = asyncio.create_task(cache.get(BLOG_ID, load))
+        await asyncio.sleep(0)
+        cache.invalidate(BLOG_ID)
+        load.release.set()
+        await pending
+
+        fragment = await cache.get(BLOG_ID, load)
+
+        assert json.loads(fragment.render(False))["data"]["blog"]["title"] == "Title 2"
+        assert cache._versions == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidating_one_blog_keeps_the_others(self):
+        cache = BlogDetailCache(max_entries=4, ttl_seconds=60)
+        load = FragmentLoader()
+
+        await cache.get(BLOG_ID, load)
+        await cache.get("other", load)
+        cache.invalidate("other")
+        await cache.get(BLOG_ID, load)
+
+        assert load.calls == 2
+        assert cache.snapshot()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_reload_keeps_the_validators(self):
+        cache = BlogDetailCache(max_entries=4, ttl_seconds=5)
+
+        async def load() -> DetailFragment:
+            return DetailFragment.from_body(detail_body("Title"))
+
+        with patch("src.services.versioned_cache.time.monotonic", return_value=100.0):
+            first = await cache.get(BLOG_ID, load)
+        with patch("src.services.versioned_cache.time.monotonic", return_value=200.0):
+            reloaded = await cache.get(BLOG_ID, load)
+
+        assert reloaded is first
+        assert cache.snapshot()["misses"] == 2
@@ -0,0 +1,171 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from fastapi import HTTPException
+
+from src.repositories.blog_like_repository import Liker
+from src.schemas.pagination import IdCursor
+from src.services.blog_detail_cache import BlogDetailCache
+from src.services.blog_like_service import BlogLikeService
+from src.services.like_count_buffer import LikeCountBuffer
+from src.services.like_counters import InlineLikeCounter, ShardedLikeCounter, WriteBehindLikeCounter
+
+
+class TestBlogLikeServiceUpdate:
+    """Unit tests for BlogLikeService.update_like_status"""
+
+    @pytest.fixture(scope="function")
+    def blog_like_service(self, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock) -> BlogLikeService:
+        return BlogLikeService(mock_blog_repository, mock_blog_like_repository, InlineLikeCounter())
+
+    @pytest.mark.asyncio
+    async def test_like_is_a_single_repository_call(self, blog_like_service: BlogLikeService, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock):
+        blog_id, user_id = str(uuid4()), uuid4()
+        mock_blog_like_repository.set_like_status.return_value = True
+
+        result = await blog_like_service.update_like_status(blog_id, user_id, True)
+
+        assert result is True
+        mock_blog_like_repository.set_like_status.assert_called_once_with(
+            blog_id, user_id, True)
+        mock_blog_repository.exists.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_repeated_unlike_returns_requested_state(self, blog_like_service: BlogLikeService, mock_blog_like_repository: AsyncMock):
+        mock_blog_like_repository.set_like_status.return_value = False
+
+        result = await blog_like_service.update_like_status(str(uuid4()), uuid4(), False)
+
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_missing_blog_raises_not_found(self, blog_like_service: BlogLikeService, mock_blog_like_repository: AsyncMock):
+        mock_blog_like_repository.set_like_status.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await blog_like_service.update_like_status(str(uuid4()), uuid4(), True)
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_only_a_changed_like_invalidates_the_cached_detail(
+        self, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock
+    ):
+        detail_cache = AsyncMock(spec=BlogDetailCache)
+        service = BlogLikeService(mock_blog_repository, mock_blog_like_repository,
+                                  InlineLikeCounter(), detail_cache=detail_cache)
+        blog_id = uuid4()
+
+        mock_blog_like_repository.set_like_status.return_value = False
+        await service.update_like_status(str(blog_id), uuid4(), True)
+        detail_cache.invalidate.assert_not_called()
+
+        mock_blog_like_repository.set_like_status.return_value = True
+        await service.update_like_status(str(blog_id).upper(), uuid4(), True)
+        detail_cache.invalidate.assert_called_once_with(str(blog_id))
+
+
+class TestBlogLikeServiceWriteBehind:
+    """Unit tests for BlogLikeService with a WriteBehindLikeCounter"""
+
+    @pytest.fixture(scope="function")
+    def count_buffer(self) -> LikeCountBuffer:
+        return LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+
+    @pytest.fixture(scope="function")
+    def blog_like_service(self, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock, count_buffer: LikeCountBuffer) -> BlogLikeService:
+        return BlogLikeService(mock_blog_repository, mock_blog_like_repository, WriteBehindLikeCounter(count_buffer))
+
+    @pytest.mark.asyncio
+    async def test_transitions_are_buffered_instead_of_counted_inline(self, blog_like_service: BlogLikeService, mock_blog_like_repository: AsyncMock, count_buffer: LikeCountBuffer):
+        blog_id, user_id = uuid4(), uuid4()
+        mock_blog_like_repository.set_like_status.return_value = True
+
+        await blog_like_service.update_like_status(str(blog_id), user_id, True)
+        await blog_like_service.update_like_status(str(blog_id), uuid4(), True)
+        await blog_like_service.update_like_status(str(blog_id), user_id, False)
+
+        assert mock_blog_like_repository.set_like_status.call_args.kwargs == {"adjust_count": False}
+        assert count_buffer.pending(blog_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_like_is_not_buffered(self, blog_like_service: BlogLikeService, mock_blog_like_repository: AsyncMock, count_buffer: LikeCountBuffer):
+        blog_id = uuid4()
+        mock_blog_like_repository.set_like_status.return_value = False
+
+        await blog_like_service.update_like_status(str(blog_id), uuid4(), True)
+
+        assert count_buffer.pending(blog_id) == 0
+
+
+class TestBlogLikeServiceSharded:
+    """Unit tests for BlogLikeService with a ShardedLikeCounter"""
+
+    @pytest.mark.asyncio
+    async def test_transitions_go_to_a_counter_shard(self, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock):
+        counter = ShardedLikeCounter(shards=4, compact_interval_seconds=60)
+        blog_like_service = BlogLikeService(mock_blog_repository, mock_blog_like_repository, counter)
+        mock_blog_like_repository.set_like_status.return_value = True
+
+        for _ in range(20):
+            await blog_like_service.update_like_status(str(uuid4()), uuid4(), True)
+
+        shards = {call.kwargs["shard"] for call in mock_blog_like_repository.set_like_status.call_args_list}
+        assert shards <= set(range(4))
+        assert len(shards) > 1
+
+    @pytest.mark.asyncio
+    async def test_unapplied_likes_are_the_shard_sum(self, mock_blog_like_repository: AsyncMock):
+        counter = ShardedLikeCounter(shards=4, compact_interval_seconds=60)
+        blog_id = uuid4()
+        mock_blog_like_repository.sum_counter_shards.return_value = 7
+
+        assert await counter.unapplied(mock_blog_like_repository, blog_id) == 7
+        mock_blog_like_repository.sum_counter_shards.assert_called_once_with(blog_id)
+
+
+class TestBlogLikeServiceLikers:
+    """Unit tests for BlogLikeService.get_likers"""
+
+    @pytest.fixture(scope="function")
+    def blog_like_service(self, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock) -> BlogLikeService:
+        return BlogLikeService(mock_blog_repository, mock_blog_like_repository, InlineLikeCounter())
+
+    @pytest.mark.asyncio
+    async def test_page_total_comes_from_like_count(self, blog_like_service: BlogLikeService, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock):
+        blog_id = str(uuid4())
+        likers = sorted(
+            (Liker(id=uuid4(), name=f"User {i}", profile_image_url="me.png") for i in range(3)),
+            key=lambda liker: liker.id)
+        mock_blog_repository.get_like_count.return_value = 120_000
+        mock_blog_like_repository.get_likers_page.return_value = likers
+
+        page = await blog_like_service.get_likers(blog_id, None, 2)
+
+        mock_blog_like_repository.get_likers_page.assert_called_once_with(blog_id, None, 3)
+        assert page.total_likes == 120_000
+        assert [user.id for user in page.users] == [str(liker.id) for liker in likers[:2]]
+        assert page.has_next
+        assert IdCursor.decode(page.next_cursor).id == likers[1].id
+
+    @pytest.mark.asyncio
+    async def test_next_page_starts_after_cursor(self, blog_like_service: BlogLikeService, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock):
+        blog_id, after = str(uuid4()), uuid4()
+        mock_blog_repository.get_like_count.return_value = 1
+        mock_blog_like_repository.get_likers_page.return_value = []
+
+        page = await blog_like_service.get_likers(blog_id, IdCursor(id=after).encode(), 20)
+
+        mock_blog_like_repository.get_likers_page.assert_called_once_with(blog_id, after, 21)
+        assert not page.has_next
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_likers_of_missing_blog_raise_not_found(self, blog_like_service: BlogLikeService, mock_blog_repository: AsyncMock, mock_blog_like_repository: AsyncMock):
+        mock_blog_repository.get_like_count.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await blog_like_service.get_likers(str(uuid4()), None, 20)
+
+        assert exc_info.value.status_code == 404
+        mock_blog_like_repository.get_likers_page.assert_not_called()
@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.responses import RenderedBody
+from src.services.blog_list_cache import BlogListCache
+
+KEY = (1, 9, None, True)
+
+
+class Loader:
+    """Counts loads and returns a new body each time"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> RenderedBody:
+        self.calls += 1
+        await self.release.wait()
+        return RenderedBody.from_bytes(f"body-{self.calls}".encode())
+
+
+class TestBlogListCache:
+    """Unit tests for BlogListCache"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_body_is_served_without_loading(self):
+        cache = BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+        load = Loader()
+
+        assert (await cache.get(KEY, load)).body == b"body-1"
+        assert (await cache.get(KEY, load)).body == b"body-1"
+        assert load.calls == 1
+        assert cache.snapshot()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_body_is_served_while_it_reloads(self):
+        cache = BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+        load = Loader()
+        with patch("src.services.versioned_cache.time.monotonic", return_value=100.0):
+            await cache.get(KEY, load)
+
+        with patch("src.services.versioned_cache.time.monotonic", return_value=110.0):
+            assert (await cache.get(KEY, load)).body == b"body-1"
+            await asyncio.sleep(0)
+            assert (await cache.get(KEY, load)).body == b"body-2"
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_body_is_loaded_again(self):
+        cache = BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+        load = Loader()
+        with patch("src.services.versioned_cache.time.monotonic", return_value=100.0):
+            await cache.get(KEY, load)
+
+        with patch("src.services.versioned_cache.time.monotonic", return_value=200.0):
+            assert (await cache.get(KEY, load)).body == b"body-2"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_bodies_and_loads_started_before_it(self):
+        cache = BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+        load = Loader()
+        load.release.clear()
+
+        pending = asyncio.create_task(cache.get(KEY, load))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        load.release.set()
+
+        assert (await pending).body == b"body-1"
+        assert (await cache.get(KEY, load)).body == b"body-2"
+        assert cache.snapshot()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        cache = BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+        load = Loader()
+        load.release.clear()
+
+        requests = [asyncio.create_task(cache.get(KEY, load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        load.release.set()
+
+        assert [page.body for page in await asyncio.gather(*requests)] == [b"body-1"] * 5
+        assert load.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_body_is_evicted(self):
+        cache = BlogListCache(max_entries=2, ttl_seconds=5, stale_seconds=30)
+        load = Loader()
+
+        await cache.get((1, 9, None, True), load)
+        await cache.get((2, 9, None, True), load)
+        await cache.get((1, 9, None, True), load)
+        await cache.get((3, 9, None, True), load)
+        await cache.get((2, 9, None, True), load)
+
+        assert load.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_unchanged_reload_keeps_the_validators(self):
+        cache = BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+        renders = iter([b"same", b"same", b"changed"])
+
+        async def load() -> RenderedBody:
+            return RenderedBody.from_bytes(next(renders))
+
+        with patch("src.services.versioned_cache.time.monotonic", return_value=100.0):
+            first = await cache.get(KEY, load)
+        with patch("src.services.versioned_cache.time.monotonic", return_value=200.0):
+            reloaded = await cache.get(KEY, load)
+        with patch("src.services.versioned_cache.time.monotonic", return_value=300.0):
+            changed = await cache.get(KEY, load)
+
+        assert reloaded is first
+        assert changed.etag != first.etag
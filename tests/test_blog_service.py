@@ -0,0 +1,320 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, call
+from uuid import uuid4
+
+from src.exceptions import ResourceNotFoundError, ValidationError
+from src.models.blog import Blog
+from src.models.comment import Comment
+from src.models.user import User
+from src.repositories.blog_repository import BlogCard
+from src.schemas.blog import AddBlogPostPayload, UpdateBlogPostPayload
+from src.schemas.pagination import KeysetCursor
+from src.services.blog_detail_cache import BlogDetailCache
+from src.services.blog_list_cache import BlogListCache
+from src.services.blog_service import BlogService
+from src.services.like_count_buffer import LikeCountBuffer
+from src.services.like_counters import WriteBehindLikeCounter
+
+
+def make_blogs(count: int) -> list[BlogCard]:
+    now = datetime.now(timezone.utc)
+    return [
+        BlogCard(
+            id=uuid4(),
+            title=f"Blog {i}",
+            cover_image_url="/uploads/cover.jpg",
+            created_at=now - timedelta(minutes=i)
+        )
+        for i in range(count)
+    ]
+
+
+def make_comments(blog: Blog, author: User, count: int) -> list[Comment]:
+    now = datetime.now(timezone.utc)
+    comments = []
+    for i in range(count):
+        comment = Comment(
+            id=uuid4(),
+            content=f"Comment {i}",
+            created_by=author.id,
+            blog_id=blog.id,
+            created_at=now + timedelta(minutes=i),
+            updated_at=now + timedelta(minutes=i)
+        )
+        comment.author = author
+        comments.append(comment)
+    return comments
+
+
+class TestBlogServiceList:
+    """Unit tests for BlogService.get_blog_list"""
+
+    @pytest.fixture(scope="function")
+    def blog_service(self, mock_blog_repository: AsyncMock) -> BlogService:
+        return BlogService(blog_repo=mock_blog_repository)
+
+    @pytest.mark.asyncio
+    async def test_offset_page_links_to_cursor_of_last_item(self, blog_service: BlogService, mock_blog_repository: AsyncMock):
+        blogs = make_blogs(4)
+        mock_blog_repository.get_paginated_blogs.return_value = (blogs, 10)
+
+        items, meta = await blog_service.get_blog_list(page=1, page_size=3)
+
+        assert [item.id for item in items] == [blog.id for blog in blogs[:3]]
+        assert meta.current_page == 1
+        assert meta.total_pages == 4
+        assert meta.has_next
+        assert meta.prev_cursor is None
+        next_cursor = KeysetCursor.decode(meta.next_cursor)
+        assert next_cursor.id == blogs[2].id
+        assert next_cursor.direction == "next"
+
+    @pytest.mark.asyncio
+    async def test_total_can_be_skipped(self, blog_service: BlogService, mock_blog_repository: AsyncMock):
+        mock_blog_repository.get_paginated_blogs.return_value = (make_blogs(2), None)
+
+        _, meta = await blog_service.get_blog_list(page=2, page_size=3, include_total=False)
+
+        mock_blog_repository.get_paginated_blogs.assert_called_once_with(2, 3, False)
+        assert meta.total_items is None
+        assert meta.total_pages is None
+        assert not meta.has_next
+        assert meta.has_previous
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_fetches_one_extra_row_to_detect_more(self, blog_service: BlogService, mock_blog_repository: AsyncMock):
+        blogs = make_blogs(4)
+        anchor = KeysetCursor(created_at=datetime.now(timezone.utc), id=uuid4())
+        mock_blog_repository.get_blogs_by_keyset.return_value = blogs
+        mock_blog_repository.count.return_value = 20
+
+        items, meta = await blog_service.get_blog_list(page_size=3, cursor=anchor.encode())
+
+        mock_blog_repository.get_blogs_by_keyset.assert_called_once_with(
+            (anchor.created_at, anchor.id), 4, False)
+        assert [item.id for item in items] == [blog.id for blog in blogs[:3]]
+        assert meta.current_page is None
+        assert meta.has_next and meta.has_previous
+        assert KeysetCursor.decode(meta.next_cursor).id == blogs[2].id
+        assert KeysetCursor.decode(meta.prev_cursor).id == blogs[0].id
+
+    @pytest.mark.asyncio
+    async def test_backwards_cursor_keeps_rows_closest_to_anchor(self, blog_service: BlogService, mock_blog_repository: AsyncMock):
+        blogs = make_blogs(2)
+        anchor = KeysetCursor(created_at=datetime.now(timezone.utc), id=uuid4(), direction="prev")
+        mock_blog_repository.get_blogs_by_keyset.return_value = blogs
+        mock_blog_repository.count.return_value = 20
+
+        items, meta = await blog_service.get_blog_list(page_size=3, cursor=anchor.encode())
+
+        assert len(items) == 2
+        assert meta.has_next
+        assert not meta.has_previous
+        assert meta.prev_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self, blog_service: BlogService):
+        with pytest.raises(ValidationError):
+            await blog_service.get_blog_list(cursor="not-a-cursor")
+
+
+class TestBlogServiceCacheInvalidation:
+    """Blog writes invalidate the cached listings and details"""
+
+    @pytest.fixture
+    def list_cache(self) -> BlogListCache:
+        return BlogListCache(max_entries=4, ttl_seconds=5, stale_seconds=30)
+
+    @pytest.mark.asyncio
+    async def test_create_and_delete_bump_the_cache_version(
+        self, mock_blog_repository: AsyncMock, list_cache: BlogListCache,
+        sample_blog: Blog, sample_user: User
+    ):
+        service = BlogService(mock_blog_repository, list_cache=list_cache)
+        sample_blog.created_by = sample_user.id
+        mock_blog_repository.create.return_value = sample_blog
+        mock_blog_repository.get_by_id.return_value = sample_blog
+        mock_blog_repository.delete_by_id.return_value = True
+
+        await service.add_blog_post(
+            AddBlogPostPayload(title="t", body="b", cover_image_url="/images/default.jpg"), sample_user)
+        await service.delete_blog_post(str(sample_blog.id), sample_user)
+
+        assert list_cache.version == 2
+
+    @pytest.mark.asyncio
+    async def test_edit_and_delete_invalidate_the_cached_detail(
+        self, mock_blog_repository: AsyncMock, list_cache: BlogListCache,
+        sample_blog: Blog, sample_user: User
+    ):
+        detail_cache = AsyncMock(spec=BlogDetailCache)
+        service = BlogService(mock_blog_repository, list_cache=list_cache, detail_cache=detail_cache)
+        sample_blog.created_by = sample_user.id
+        mock_blog_repository.get_by_id.return_value = sample_blog
+        mock_blog_repository.update_by_id.return_value = sample_blog
+        mock_blog_repository.delete_by_id.return_value = True
+
+        await service.update_blog_post(
+            str(sample_blog.id), UpdateBlogPostPayload(title="new"), sample_user)
+        await service.delete_blog_post(str(sample_blog.id), sample_user)
+
+        assert detail_cache.invalidate.call_args_list == [
+            call(str(sample_blog.id)), call(str(sample_blog.id))]
+
+    @pytest.mark.asyncio
+    async def test_failed_delete_keeps_the_cache(
+        self, mock_blog_repository: AsyncMock, list_cache: BlogListCache,
+        sample_blog: Blog, sample_user: User
+    ):
+        service = BlogService(mock_blog_repository, list_cache=list_cache)
+        sample_blog.created_by = sample_user.id
+        mock_blog_repository.get_by_id.return_value = sample_blog
+        mock_blog_repository.delete_by_id.return_value = False
+
+        with pytest.raises(ResourceNotFoundError):
+            await service.delete_blog_post(str(sample_blog.id), sample_user)
+
+        assert list_cache.version == 0
+
+
+class TestBlogServiceDetail:
+    """Unit tests for BlogService.get_blog_details and get_blog_comments"""
+
+    @pytest.fixture(scope="function")
+    def blog_service(
+        self,
+        mock_blog_repository: AsyncMock,
+        mock_comment_repository: AsyncMock,
+        mock_blog_like_repository: AsyncMock
+    ) -> BlogService:
+        return BlogService(
+            blog_repo=mock_blog_repository,
+            comment_repo=mock_comment_repository,
+            blog_like_repo=mock_blog_like_repository
+        )
+
+    @pytest.mark.asyncio
+    async def test_detail_returns_first_comment_page_and_like_flag(
+        self,
+        blog_service: BlogService,
+        mock_blog_repository: AsyncMock,
+        mock_comment_repository: AsyncMock,
+        mock_blog_like_repository: AsyncMock,
+        sample_blog: Blog,
+        sample_user: User
+    ):
+        sample_blog.author = sample_user
+        comments = make_comments(sample_blog, sample_user, 21)
+        mock_blog_repository.get_by_id_with_relationships.return_value = sample_blog
+        mock_comment_repository.get_comments_page.return_value = comments
+        mock_blog_like_repository.has_liked.return_value = True
+
+        details = await blog_service.get_blog_details(str(sample_blog.id), sample_user.id)
+
+        mock_blog_like_repository.has_liked.assert_called_once_with(
+            str(sample_blog.id), sample_user.id)
+        mock_comment_repository.get_comments_page.assert_called_once_with(
+            str(sample_blog.id), None, 21)
+        assert details.blog.is_liked_by_user
+        assert [c.id for c in details.comments] == [str(c.id) for c in comments[:20]]
+        assert KeysetCursor.decode(details.comments_next_cursor).id == comments[19].id
+
+    @pytest.mark.asyncio
+    async def test_anonymous_detail_skips_like_lookup(
+        self,
+        blog_service: BlogService,
+        mock_blog_repository: AsyncMock,
+        mock_comment_repository: AsyncMock,
+        mock_blog_like_repository: AsyncMock,
+        sample_blog: Blog,
+        sample_user: User
+    ):
+        sample_blog.author = sample_user
+        mock_blog_repository.get_by_id_with_relationships.return_value = sample_blog
+        mock_comment_repository.get_comments_page.return_value = []
+
+        details = await blog_service.get_blog_details(str(sample_blog.id), None)
+
+        mock_blog_like_repository.has_liked.assert_not_called()
+        assert not details.blog.is_liked_by_user
+        assert details.comments == []
+        assert details.comments_next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_detail_total_includes_likes_not_yet_applied(
+        self,
+        mock_blog_repository: AsyncMock,
+        mock_comment_repository: AsyncMock,
+        mock_blog_like_repository: AsyncMock,
+        sample_blog: Blog,
+        sample_user: User
+    ):
+        count_buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+        count_buffer.add(sample_blog.id, 1)
+        count_buffer.add(sample_blog.id, 1)
+        blog_service = BlogService(
+            mock_blog_repository, mock_comment_repository, mock_blog_like_repository,
+            counter=WriteBehindLikeCounter(count_buffer))
+        sample_blog.author = sample_user
+        sample_blog.like_count = 5
+        mock_blog_repository.get_by_id_with_relationships.return_value = sample_blog
+        mock_comment_repository.get_comments_page.return_value = []
+
+        details = await blog_service.get_blog_details(str(sample_blog.id), None)
+
+        assert details.blog.total_likes == 7
+
+    @pytest.mark.asyncio
+    async def test_comments_page_continues_after_cursor(
+        self,
+        blog_service: BlogService,
+        mock_blog_repository: AsyncMock,
+        mock_comment_repository: AsyncMock,
+        sample_blog: Blog,
+        sample_user: User
+    ):
+        comments = make_comments(sample_blog, sample_user, 3)
+        anchor = KeysetCursor(created_at=datetime.now(timezone.utc), id=uuid4())
+        mock_blog_repository.exists.return_value = True
+        mock_comment_repository.get_comments_page.return_value = comments
+
+        page = await blog_service.get_blog_comments(str(sample_blog.id), anchor.encode(), 5)
+
+        mock_comment_repository.get_comments_page.assert_called_once_with(
+            str(sample_blog.id), (anchor.created_at, anchor.id), 6)
+        assert len(page.comments) == 3
+        assert not page.has_next
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_comments_of_missing_blog_raise_not_found(
+        self,
+        blog_service: BlogService,
+        mock_blog_repository: AsyncMock,
+        mock_comment_repository: AsyncMock
+    ):
+        mock_blog_repository.exists.return_value = False
+
+        with pytest.raises(ResourceNotFoundError):
+            await blog_service.get_blog_comments(str(uuid4()), None, 5)
+
+        mock_comment_repository.get_comments_page.assert_not_called()
+
+
+class TestBlogServiceImageCleanup:
+    """Cover images are left to the upload reaper on BlogService edits and deletes"""
+
+    @pytest.mark.asyncio
+    async def test_delete_leaves_the_cover_image_in_place(
+        self, mock_blog_repository: AsyncMock, sample_blog: Blog, sample_user: User
+    ):
+        service = BlogService(mock_blog_repository)
+        service.file_service = AsyncMock()
+        sample_blog.created_by = sample_user.id
+        mock_blog_repository.get_by_id.return_value = sample_blog
+        mock_blog_repository.delete_by_id.return_value = True
+
+        await service.delete_blog_post(str(sample_blog.id), sample_user)
+
+        assert service.file_service.method_calls == []
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.models.blog import Blog
+from src.repositories.count_strategies import CachedExactCount, CounterTableCount
+
+
+def session_returning(first=None) -> AsyncMock:
+    result = MagicMock()
+    result.first.return_value = first
+    session = AsyncMock()
+    session.exec.return_value = result
+    return session
+
+
+class TestCountStrategies:
+    """Unit tests for the blog count strategies"""
+
+    @pytest.mark.asyncio
+    async def test_counter_table_falls_back_when_counter_row_is_missing(self):
+        fallback = AsyncMock()
+        fallback.count.return_value = 7
+        session = session_returning(first=None)
+
+        total = await CounterTableCount(fallback=fallback).count(session, Blog)
+
+        assert total == 7
+        fallback.count.assert_called_once_with(session, Blog)
+
+    @pytest.mark.asyncio
+    async def test_cached_count_reuses_value_until_ttl_expires(self):
+        source = AsyncMock()
+        source.count.side_effect = [10, 12]
+        strategy = CachedExactCount(ttl_seconds=30, source=source)
+        session = AsyncMock()
+
+        with patch("src.repositories.count_strategies.time.monotonic", return_value=100.0):
+            assert await strategy.count(session, Blog) == 10
+        with patch("src.repositories.count_strategies.time.monotonic", return_value=129.0):
+            assert await strategy.count(session, Blog) == 10
+        with patch("src.repositories.count_strategies.time.monotonic", return_value=131.0):
+            assert await strategy.count(session, Blog) == 12
+        assert source.count.call_count == 2
@@ -0,0 +1,177 @@
+import io
+import os
+
+import pytest
+from unittest.mock import MagicMock
+from fastapi import FastAPI, Form, UploadFile
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from src.exceptions import FileValidationError, UnsupportedOperationError
+from src.middleware import RequestBodyLimitMiddleware
+from src.config import config
+from src.services import file_service
+from src.services.file_service import FileService
+from src.services.storage import LocalStorageBackend
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+def make_upload(content: bytes, filename: str = "photo.png") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename,
+                      headers=Headers({"content-type": "image/png"}))
+
+
+class TestFileServiceUploads:
+    """Unit tests for FileService streaming uploads"""
+
+    @pytest.mark.asyncio
+    async def test_upload_is_written_only_when_stored(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.services.file_service.image_pipeline", MagicMock())
+        storage = LocalStorageBackend(str(tmp_path))
+        service = FileService(upload_dir=str(tmp_path), storage=storage)
+
+        upload = await service.prepare_upload(make_upload(PNG))
+
+        assert not storage.path(upload.key).exists()
+        await service.store(upload)
+        assert storage.path(upload.key).read_bytes() == PNG
+        assert not upload.temp_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_identical_uploads_share_one_content_addressed_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.services.file_service.image_pipeline", MagicMock())
+        storage = LocalStorageBackend(str(tmp_path))
+        service = FileService(upload_dir=str(tmp_path), storage=storage)
+
+        first = await service.prepare_upload(make_upload(PNG, filename="a.png"))
+        await service.store(first)
+        second = await service.prepare_upload(make_upload(PNG, filename="b.png"))
+        await service.store(second)
+
+        assert first.key == second.key
+        digest = first.key.rsplit("/", 1)[1]
+        assert first.key.split("/")[:2] == [digest[:2], digest[2:4]]
+        assert [p for p in tmp_path.rglob("*") if p.is_file()] == [storage.path(first.key)]
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_is_abandoned_mid_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file_service, "CHUNK_SIZE", 16)
+        monkeypatch.setattr(file_service, "MAX_FILE_SIZE", 64)
+        upload = make_upload(PNG + b"\x00" * 10_000)
+
+        with pytest.raises(FileValidationError):
+            await FileService(upload_dir=str(tmp_path)).prepare_upload(upload)
+
+        # Stopped after the chunk that crossed the limit
+        assert upload.file.tell() == 80
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_content_must_match_extension(self, tmp_path):
+        with pytest.raises(FileValidationError):
+            await FileService(upload_dir=str(tmp_path)).prepare_upload(
+                make_upload(PNG, filename="photo.jpg"))
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_discard_removes_the_temp_file(self, tmp_path):
+        upload = await FileService(upload_dir=str(tmp_path)).prepare_upload(make_upload(PNG))
+
+        upload.discard()
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFileServiceDirectUploads:
+    """Unit tests for FileService direct uploads"""
+
+    @pytest.mark.asyncio
+    async def test_local_backend_cannot_presign(self, tmp_path):
+        service = FileService(storage=LocalStorageBackend(str(tmp_path)))
+
+        with pytest.raises(UnsupportedOperationError):
+            await service.create_direct_upload("image/png", 100, "ab" * 32)
+
+    @pytest.mark.asyncio
+    async def test_oversized_direct_upload_is_rejected(self, tmp_path):
+        service = FileService(storage=LocalStorageBackend(str(tmp_path)))
+
+        with pytest.raises(FileValidationError):
+            await service.create_direct_upload(
+                "image/png", file_service.MAX_FILE_SIZE + 1, "ab" * 32)
+
+    @pytest.mark.asyncio
+    async def test_claim_returns_url_of_stored_blob(self, tmp_path):
+        digest = "ab" * 32
+        blob = tmp_path / "ab" / "ab" / f"{digest}.png"
+        blob.parent.mkdir(parents=True)
+        blob.write_bytes(PNG)
+        os.utime(blob, (1, 1))
+        service = FileService(storage=LocalStorageBackend(str(tmp_path)))
+
+        url = await service.claim_direct_upload(f"/uploads/ab/ab/{digest}.png")
+
+        assert url == f"/uploads/ab/ab/{digest}.png"
+        assert blob.stat().st_mtime > 1
+
+    @pytest.mark.asyncio
+    async def test_claim_rejects_blob_that_is_not_the_declared_image(self, tmp_path):
+        digest = "ab" * 32
+        blob = tmp_path / "ab" / "ab" / f"{digest}.png"
+        blob.parent.mkdir(parents=True)
+        blob.write_bytes(b"<html>not an image</html>")
+        service = FileService(storage=LocalStorageBackend(str(tmp_path)))
+
+        with pytest.raises(FileValidationError):
+            await service.claim_direct_upload(f"/uploads/ab/ab/{digest}.png")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("image_url", [
+        "/images/default.jpg",
+        "/uploads/../secret.png",
+        "/uploads/ab/ab/" + "ab" * 32 + ".exe",
+        "/uploads/ab/ab/" + "ab" * 32 + ".png",
+    ])
+    async def test_claim_rejects_foreign_or_missing_blobs(self, tmp_path, image_url):
+        service = FileService(storage=LocalStorageBackend(str(tmp_path)))
+
+        with pytest.raises(FileValidationError):
+            await service.claim_direct_upload(image_url)
+
+
+class TestRequestBodyLimitMiddleware:
+    """Unit tests for RequestBodyLimitMiddleware"""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(RequestBodyLimitMiddleware, max_body_bytes=1024)
+
+        @app.post("/upload")
+        async def upload(image: UploadFile = Form(...)):
+            return {"size": len(await image.read())}
+
+        return TestClient(app)
+
+    def test_small_body_passes_through(self, client: TestClient):
+        response = client.post("/upload", files={"image": ("a.png", PNG, "image/png")})
+
+        assert response.status_code == 200
+        assert response.json() == {"size": len(PNG)}
+
+    def test_declared_oversized_body_is_rejected(self, client: TestClient):
+        response = client.post("/upload", files={"image": ("a.png", b"\x00" * 4096, "image/png")})
+
+        assert response.status_code == 413
+
+    def test_chunked_oversized_body_is_cut_off(self, client: TestClient):
+        def chunks():
+            for _ in range(8):
+                yield b"\x00" * 512
+
+        response = client.post("/upload", content=chunks(),
+                               headers={"content-type": "multipart/form-data; boundary=x"})
+
+        assert response.status_code == 413
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+from PIL import Image
+
+from src.services.file_service import FileService
+from src.services.image_derivatives import (
+    ImageDerivativePipeline,
+    generate_derivatives,
+    manifest_path,
+)
+
+DIGEST = "abcd" + "0" * 60
+IMAGE_URL = f"/uploads/ab/cd/{DIGEST}.png"
+
+
+@pytest.fixture
+def source_image(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "uploads" / "ab" / "cd" / f"{DIGEST}.png"
+    path.parent.mkdir(parents=True)
+    Image.new("RGB", (800, 400), "red").save(path)
+    return path
+
+
+class TestGenerateDerivatives:
+    """Unit tests for generate_derivatives"""
+
+    def test_writes_narrower_variants_and_manifest(self, source_image):
+        variants = generate_derivatives(str(source_image), [320, 640, 1280], ["webp"])
+
+        assert [(v["width"], v["format"]) for v in variants] == [(320, "webp"), (640, "webp")]
+        with Image.open(source_image.with_name(f"{DIGEST}.w320.webp")) as variant:
+            assert variant.size == (320, 160)
+            assert variant.format == "WEBP"
+        manifest = json.loads(manifest_path(source_image).read_text())
+        assert manifest["variants"] == variants
+
+    def test_small_image_is_reencoded_at_its_own_width(self, source_image):
+        variants = generate_derivatives(str(source_image), [1280], ["webp"])
+
+        assert [v["width"] for v in variants] == [800]
+
+    def test_existing_manifest_is_reused(self, source_image):
+        first = generate_derivatives(str(source_image), [320], ["webp"])
+        source_image.with_name(f"{DIGEST}.w320.webp").unlink()
+
+        assert generate_derivatives(str(source_image), [320], ["webp"]) == first
+        assert not source_image.with_name(f"{DIGEST}.w320.webp").exists()
+
+
+class TestImageSrcset:
+    """Unit tests for variant lookups behind FileService.build_srcset"""
+
+    @pytest.mark.asyncio
+    async def test_srcset_is_empty_until_the_manifest_is_read(self, source_image, monkeypatch):
+        pipeline = ImageDerivativePipeline(widths=[320, 640], formats=["webp"], workers=1)
+        monkeypatch.setattr("src.services.file_service.image_pipeline", pipeline)
+        service = FileService()
+        generate_derivatives(str(source_image), [320, 640], ["webp"])
+
+        assert service.build_srcset(IMAGE_URL) == {}
+        await asyncio.gather(*pipeline._reads.values())
+        srcset = service.build_srcset(IMAGE_URL)
+
+        assert list(srcset) == ["image/webp"]
+        entries = srcset["image/webp"].split(", ")
+        assert [entry.rsplit(" ", 1)[1] for entry in entries] == ["320w", "640w"]
+        assert entries[0].rsplit(" ", 1)[0].endswith(f"/uploads/ab/cd/{DIGEST}.w320.webp")
+
+    @pytest.mark.asyncio
+    async def test_missing_manifest_is_not_read_on_every_render(self, source_image):
+        pipeline = ImageDerivativePipeline(widths=[320], formats=["webp"], workers=1)
+
+        assert pipeline.variants(IMAGE_URL) == []
+        await asyncio.gather(*pipeline._reads.values())
+
+        assert pipeline.variants(IMAGE_URL) == []
+        assert pipeline._reads == {}
+
+    @pytest.mark.asyncio
+    async def test_paths_that_are_not_uploads_are_never_read(self, source_image):
+        pipeline = ImageDerivativePipeline(widths=[320], formats=["webp"], workers=1)
+
+        assert pipeline.variants("/images/default.jpg") == []
+        assert pipeline.variants("/uploads/legacy.png") == []
+        assert pipeline._reads == {}
+
+    @pytest.mark.asyncio
+    async def test_scheduled_generation_runs_off_the_request(self, source_image):
+        pipeline = ImageDerivativePipeline(widths=[320], formats=["webp"], workers=1)
+        try:
+            pipeline.schedule(source_image, IMAGE_URL)
+            for future in list(pipeline._pending):
+                await future
+
+            assert [v["width"] for v in pipeline.variants(IMAGE_URL)] == [320]
+        finally:
+            pipeline.shutdown()
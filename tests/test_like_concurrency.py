@@ -0,0 +1,148 @@
+"""
+Concurrency stress test for like/unlike.
+
+Fires overlapping like and unlike requests, many from the same users, at one
+blog against a real PostgreSQL database and checks that blogs.like_count
+ends up equal to the number of liked rows, inline, in write-behind mode and
+with sharded counters.
+Skipped unless TEST_DATABASE_URL is set.
+"""
+import asyncio
+import random
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.models.blog import Blog
+from src.models.blog_like import BlogLike
+from src.models.user import User
+from src.repositories.blog_like_repository import BlogLikeRepository
+from src.repositories.blog_repository import BlogRepository
+from src.services.blog_like_service import BlogLikeService
+from src.services.like_count_buffer import LikeCountBuffer
+from src.services.like_counters import InlineLikeCounter, LikeCounter, ShardedLikeCounter, WriteBehindLikeCounter
+
+USERS = 25
+TOGGLES = 400
+CONCURRENCY = 10
+
+
+async def seed_blog_and_users(engine: AsyncEngine) -> tuple[UUID, list[UUID]]:
+    user_ids = [uuid4() for _ in range(USERS)]
+    blog_id = uuid4()
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        await conn.execute(insert(User.__table__), [  # type: ignore[attr-defined]
+            {"id": user_id, "email": f"liker{i}@example.com", "name": f"Liker {i}",
+             "profile_image_url": "/images/default.jpg",
+             "password_hash": "not-a-real-hash", "role": "user"}
+            for i, user_id in enumerate(user_ids)
+        ])
+        await conn.execute(insert(Blog.__table__), [{  # type: ignore[attr-defined]
+            "id": blog_id, "title": "Viral", "body": "body",
+            "cover_image_url": "/images/default.jpg", "like_count": 0,
+            "created_by": user_ids[0], "created_at": now, "updated_at": now,
+        }])
+    return blog_id, user_ids
+
+
+async def toggle_concurrently(
+    session_maker: async_sessionmaker, blog_id: UUID, user_ids: list[UUID],
+    counter: LikeCounter
+) -> None:
+    rng = random.Random(99)
+    limit = asyncio.Semaphore(CONCURRENCY)
+
+    async def toggle(user_index: int, is_liked: bool) -> None:
+        async with limit, session_maker() as session:
+            service = BlogLikeService(
+                BlogRepository(session), BlogLikeRepository(session), counter)
+            await service.update_like_status(
+                str(blog_id), user_ids[user_index], is_liked)
+
+    # Few users and many toggles, so the same user's requests overlap
+    await asyncio.gather(*(
+        toggle(rng.randrange(USERS), rng.random() < 0.6) for _ in range(TOGGLES)
+    ))
+
+
+async def like_count_and_liked_rows(session_maker: async_sessionmaker, blog_id: UUID) -> tuple[int, int]:
+    async with session_maker() as session:
+        like_count = (await session.exec(  # type: ignore[call-overload]
+            select(Blog.like_count).where(Blog.id == blog_id))).scalar_one()
+        liked_rows = (await session.exec(  # type: ignore[call-overload]
+            select(func.count()).select_from(BlogLike)
+            .where(BlogLike.blog_id == blog_id, BlogLike.is_liked))).scalar_one()
+    return like_count, liked_rows
+
+
+@pytest.mark.asyncio
+async def test_like_count_matches_liked_rows_under_concurrent_toggles(migrated_engine: AsyncEngine):
+    blog_id, user_ids = await seed_blog_and_users(migrated_engine)
+    session_maker = async_sessionmaker(
+        bind=migrated_engine, class_=AsyncSession, expire_on_commit=False)
+
+    await toggle_concurrently(session_maker, blog_id, user_ids, InlineLikeCounter())
+
+    like_count, liked_rows = await like_count_and_liked_rows(session_maker, blog_id)
+    assert liked_rows > 0
+    assert like_count == liked_rows
+
+
+@pytest.mark.asyncio
+async def test_write_behind_count_matches_liked_rows_after_flush(migrated_engine: AsyncEngine):
+    blog_id, user_ids = await seed_blog_and_users(migrated_engine)
+    session_maker = async_sessionmaker(
+        bind=migrated_engine, class_=AsyncSession, expire_on_commit=False)
+    count_buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=TOGGLES)
+
+    await toggle_concurrently(
+        session_maker, blog_id, user_ids, WriteBehindLikeCounter(count_buffer))
+
+    like_count, liked_rows = await like_count_and_liked_rows(session_maker, blog_id)
+    assert like_count == 0
+    assert like_count + count_buffer.pending(blog_id) == liked_rows
+
+    await count_buffer.flush(session_maker)
+
+    like_count, liked_rows = await like_count_and_liked_rows(session_maker, blog_id)
+    assert like_count == liked_rows
+    assert count_buffer.pending(blog_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_sharded_count_matches_liked_rows_across_compaction(migrated_engine: AsyncEngine):
+    blog_id, user_ids = await seed_blog_and_users(migrated_engine)
+    session_maker = async_sessionmaker(
+        bind=migrated_engine, class_=AsyncSession, expire_on_commit=False)
+    counter = ShardedLikeCounter(shards=8, compact_interval_seconds=60)
+
+    # Compaction runs while toggles are still landing on the shards
+    await asyncio.gather(
+        toggle_concurrently(session_maker, blog_id, user_ids, counter),
+        *(counter.compactor.compact(session_maker) for _ in range(5)),
+    )
+
+    async with session_maker() as session:
+        unapplied = await counter.unapplied(BlogLikeRepository(session), blog_id)
+    like_count, liked_rows = await like_count_and_liked_rows(session_maker, blog_id)
+    assert like_count + unapplied == liked_rows
+
+    await counter.compactor.compact(session_maker)
+
+    like_count, liked_rows = await like_count_and_liked_rows(session_maker, blog_id)
+    assert like_count == liked_rows
+    async with session_maker() as session:
+        assert await counter.unapplied(BlogLikeRepository(session), blog_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_toggle_of_missing_blog_reports_not_found(migrated_engine: AsyncEngine):
+    session_maker = async_sessionmaker(
+        bind=migrated_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        assert await BlogLikeRepository(session).set_like_status(uuid4(), uuid4(), True) is None
@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from src.services.like_count_buffer import LikeCountBuffer
+from src.services.like_counter_compactor import LikeCounterCompactor
+
+
+def make_session_maker() -> MagicMock:
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__ = AsyncMock()
+    session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session_maker
+
+
+class TestLikeCountBuffer:
+    """Unit tests for LikeCountBuffer"""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_net_deltas_in_one_batch(self):
+        buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+        hot, cold, cancelled = uuid4(), uuid4(), uuid4()
+        for _ in range(3):
+            buffer.add(hot, 1)
+        buffer.add(cold, -1)
+        buffer.add(cancelled, 1)
+        buffer.add(cancelled, -1)
+
+        with patch("src.services.like_count_buffer.BlogRepository") as repository:
+            repository.return_value.apply_like_deltas = AsyncMock()
+            flushed = await buffer.flush(make_session_maker())
+
+        assert flushed == 2
+        repository.return_value.apply_like_deltas.assert_called_once_with({hot: 3, cold: -1})
+        assert buffer.pending(hot) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_deltas(self):
+        buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+        blog_id = uuid4()
+        buffer.add(blog_id, 1)
+
+        with patch("src.services.like_count_buffer.BlogRepository") as repository:
+            repository.return_value.apply_like_deltas = AsyncMock(side_effect=RuntimeError("db down"))
+            with pytest.raises(RuntimeError):
+                await buffer.flush(make_session_maker())
+
+        assert buffer.pending(blog_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_what_is_left(self):
+        buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+        blog_id = uuid4()
+        buffer.add(blog_id, 1)
+
+        with patch("src.services.like_count_buffer.BlogRepository") as repository:
+            repository.return_value.apply_like_deltas = AsyncMock()
+            buffer.stop()
+            await buffer.run(make_session_maker())
+
+        repository.return_value.apply_like_deltas.assert_called_with({blog_id: 1})
+
+    @pytest.mark.asyncio
+    async def test_batch_being_written_still_counts_as_pending(self):
+        buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+        blog_id = uuid4()
+        buffer.add(blog_id, 1)
+        seen_during_write = []
+
+        async def apply_like_deltas(batch):
+            buffer.add(blog_id, 1)
+            seen_during_write.append(buffer.pending(blog_id))
+
+        with patch("src.services.like_count_buffer.BlogRepository") as repository:
+            repository.return_value.apply_like_deltas = apply_like_deltas
+            await buffer.flush(make_session_maker())
+
+        assert seen_during_write == [2]
+        assert buffer.pending(blog_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_on_shutdown_is_logged_not_raised(self, caplog):
+        buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=100)
+        buffer.add(uuid4(), 1)
+
+        with patch("src.services.like_count_buffer.BlogRepository") as repository:
+            repository.return_value.apply_like_deltas = AsyncMock(side_effect=RuntimeError("db down"))
+            buffer.stop()
+            await buffer.run(make_session_maker())
+
+        repository.return_value.apply_like_deltas.assert_awaited()
+        assert any("on shutdown" in record.getMessage() for record in caplog.records)
+
+    def test_reaching_max_pending_wakes_the_flusher(self):
+        buffer = LikeCountBuffer(flush_interval_seconds=60, max_pending=2)
+        buffer.add(uuid4(), 1)
+        assert not buffer._wake.is_set()
+        buffer.add(uuid4(), 1)
+        assert buffer._wake.is_set()
+
+
+class TestLikeCounterCompactor:
+    """Unit tests for LikeCounterCompactor"""
+
+    @pytest.mark.asyncio
+    async def test_failed_compaction_on_shutdown_is_logged_not_raised(self, caplog):
+        compactor = LikeCounterCompactor(interval_seconds=60)
+
+        with patch("src.services.like_counter_compactor.BlogLikeRepository") as repository:
+            repository.return_value.fold_counter_shards = AsyncMock(side_effect=RuntimeError("db down"))
+            compactor.stop()
+            await compactor.run(make_session_maker())
+
+        repository.return_value.fold_counter_shards.assert_awaited()
+        assert any("on shutdown" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,96 @@
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import config
+from src.db.pool_metrics import InstrumentedAsyncQueuePool, pool_status
+from src.dependencies.metrics_deps import MetricsTokenBearer
+from src.metrics import Histogram
+
+
+@pytest.fixture
+def metrics_client() -> TestClient:
+    router = APIRouter(dependencies=[Depends(MetricsTokenBearer())])
+
+    @router.get("/probe")
+    async def probe():
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/metrics")
+    return TestClient(app)
+
+
+class TestHistogram:
+    """Unit tests for Histogram"""
+
+    def test_snapshot_reports_cumulative_bucket_counts(self):
+        histogram = Histogram(buckets=[0.01, 0.1, 1.0])
+
+        for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"] == {
+            "le_0.01": 1,
+            "le_0.1": 3,
+            "le_1": 4,
+            "le_inf": 5,
+        }
+
+    def test_value_on_bucket_boundary_counts_in_that_bucket(self):
+        histogram = Histogram(buckets=[0.1, 1.0])
+
+        histogram.observe(0.1)
+
+        assert histogram.snapshot()["buckets"]["le_0.1"] == 1
+
+
+class TestPoolStatus:
+    """Unit tests for pool_status"""
+
+    def test_reports_configured_pool_limits(self):
+        engine = create_async_engine(
+            "postgresql+asyncpg://user@localhost/db",
+            poolclass=InstrumentedAsyncQueuePool, pool_size=3, max_overflow=7)
+
+        status = pool_status(engine)
+
+        assert status["size"] == 3
+        assert status["max_overflow"] == 7
+        assert engine.sync_engine.pool.recreate().max_overflow == 7
+
+
+class TestMetricsTokenBearer:
+    """Unit tests for MetricsTokenBearer"""
+
+    def test_request_without_token_is_rejected(self, metrics_client: TestClient, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_TOKEN", "secret")
+
+        assert metrics_client.get("/metrics/probe").status_code == 403
+
+    def test_wrong_token_is_rejected(self, metrics_client: TestClient, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_TOKEN", "secret")
+
+        response = metrics_client.get(
+            "/metrics/probe", headers={"Authorization": "Bearer wrong"})
+
+        assert response.status_code == 403
+
+    def test_unset_token_rejects_every_request(self, metrics_client: TestClient, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_TOKEN", "")
+
+        response = metrics_client.get(
+            "/metrics/probe", headers={"Authorization": "Bearer "})
+
+        assert response.status_code == 403
+
+    def test_configured_token_is_accepted(self, metrics_client: TestClient, monkeypatch):
+        monkeypatch.setattr(config, "METRICS_TOKEN", "secret")
+
+        response = metrics_client.get(
+            "/metrics/probe", headers={"Authorization": "Bearer secret"})
+
+        assert response.status_code == 200
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.exceptions import ServiceUnavailableError
+from src.password_hasher import PasswordHasher
+
+
+class TestPasswordHasher:
+    """Unit tests for PasswordHasher"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_run_on_the_executor(self):
+        hasher = PasswordHasher(executor_kind="thread", workers=1, max_queue=1)
+        try:
+            password_hash = await hasher.hash("secret1")
+
+            assert await hasher.verify("secret1", password_hash) is True
+            assert await hasher.verify("wrong", password_hash) is False
+            snapshot = hasher.snapshot()
+            assert snapshot["hash_seconds"]["count"] == 3
+            assert snapshot["queue_wait_seconds"]["count"] == 3
+            assert snapshot["in_flight"] == 0
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_workers_and_queue_are_full(self, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr(
+            "src.password_hasher.generate_password_hash",
+            lambda password: release.wait(5) and "hashed")
+        hasher = PasswordHasher(executor_kind="thread", workers=1, max_queue=1)
+        try:
+            running = asyncio.ensure_future(hasher.hash("a"))
+            queued = asyncio.ensure_future(hasher.hash("b"))
+            await asyncio.sleep(0)
+
+            with pytest.raises(ServiceUnavailableError) as exc_info:
+                await hasher.hash("c")
+
+            assert exc_info.value.status_code == 503
+            assert hasher.rejected == 1
+            release.set()
+            assert await asyncio.gather(running, queued) == ["hashed", "hashed"]
+            assert hasher.snapshot()["in_flight"] == 0
+        finally:
+            release.set()
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_holds_its_slot_until_the_hash_finishes(self, monkeypatch):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_hash(password):
+            started.set()
+            return release.wait(5) and "hashed"
+
+        monkeypatch.setattr("src.password_hasher.generate_password_hash", slow_hash)
+        hasher = PasswordHasher(executor_kind="thread", workers=1, max_queue=0)
+        try:
+            running = asyncio.ensure_future(hasher.hash("a"))
+            await asyncio.to_thread(started.wait, 5)
+            running.cancel()
+            await asyncio.sleep(0)
+
+            with pytest.raises(ServiceUnavailableError):
+                await hasher.hash("b")
+
+            release.set()
+            while hasher.snapshot()["in_flight"]:
+                await asyncio.sleep(0.01)
+            assert await hasher.hash("c") == "hashed"
+        finally:
+            release.set()
+            hasher.shutdown()
@@ -0,0 +1,100 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.dependencies.token_deps import decode_access_token
+from src.exceptions import TokenExpiredError
+from src.models.user import User
+from src.repositories.principal_cache import PrincipalCache
+from src.repositories.user_repository import UserRepository
+
+
+def make_session(user: User | None) -> AsyncMock:
+    session = AsyncMock()
+    session.exec.return_value = MagicMock(first=MagicMock(return_value=user))
+    session.expunge = MagicMock()
+    session.add = MagicMock()
+    return session
+
+
+class TestPrincipalCache:
+    """Unit tests for PrincipalCache"""
+
+    def test_least_recently_used_entry_is_evicted(self, sample_user: User):
+        cache = PrincipalCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", sample_user)
+        cache.put("b", sample_user)
+        cache.get("a")
+        cache.put("c", sample_user)
+
+        assert cache.get("a") is sample_user
+        assert cache.get("b") is None
+        assert cache.get("c") is sample_user
+
+    def test_entries_expire_after_ttl(self, sample_user: User):
+        cache = PrincipalCache(max_entries=10, ttl_seconds=30)
+        with patch("src.repositories.principal_cache.time.monotonic", return_value=100.0):
+            cache.put("a", sample_user)
+        with patch("src.repositories.principal_cache.time.monotonic", return_value=129.0):
+            assert cache.get("a") is sample_user
+        with patch("src.repositories.principal_cache.time.monotonic", return_value=130.0):
+            assert cache.get("a") is None
+
+
+class TestUserRepositoryPrincipal:
+    """UserRepository.get_principal reads through the principal cache"""
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_makes_no_query(self, sample_user: User):
+        session = make_session(sample_user)
+        repo = UserRepository(session, PrincipalCache(max_entries=10, ttl_seconds=60))
+
+        first = await repo.get_principal(str(sample_user.id))
+        second = await repo.get_principal(str(sample_user.id))
+
+        assert first is second is sample_user
+        assert session.exec.await_count == 1
+        session.expunge.assert_called_once_with(sample_user)
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_the_cached_principal(self, sample_user: User):
+        session = make_session(sample_user)
+        repo = UserRepository(session, PrincipalCache(max_entries=10, ttl_seconds=60))
+        await repo.get_principal(str(sample_user.id))
+
+        await repo.update(sample_user)
+        await repo.get_principal(str(sample_user.id))
+
+        assert session.exec.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self, sample_user: User):
+        session = make_session(None)
+        repo = UserRepository(session, PrincipalCache(max_entries=10, ttl_seconds=60))
+
+        assert await repo.get_principal(str(sample_user.id)) is None
+        assert await repo.get_principal(str(sample_user.id)) is None
+        assert session.exec.await_count == 2
+
+
+class TestDecodeAccessToken:
+    """decode_access_token verifies a request's token once"""
+
+    def test_payload_is_reused_within_a_request(self):
+        request = SimpleNamespace(state=SimpleNamespace())
+        payload = {"user": {"user_id": "42"}}
+        with patch("src.dependencies.token_deps.verify_access_token", return_value=payload) as verify:
+            assert decode_access_token(request, "token") is payload
+            assert decode_access_token(request, "token") is payload
+
+        verify.assert_called_once_with("token")
+
+    def test_failure_is_replayed_without_decoding_again(self):
+        request = SimpleNamespace(state=SimpleNamespace())
+        with patch("src.dependencies.token_deps.verify_access_token",
+                   side_effect=TokenExpiredError(token_type="access")) as verify:
+            for _ in range(2):
+                with pytest.raises(TokenExpiredError):
+                    decode_access_token(request, "token")
+
+        verify.assert_called_once_with("token")
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from src.db.routing import ReadYourWritesTracker
+
+
+class TestReadYourWritesTracker:
+    """Unit tests for ReadYourWritesTracker"""
+
+    def test_recent_writer_is_sticky_until_window_expires(self):
+        tracker = ReadYourWritesTracker(window_seconds=5)
+
+        with patch("src.db.routing.time.monotonic", return_value=100.0):
+            tracker.record_write("user-1")
+        with patch("src.db.routing.time.monotonic", return_value=104.0):
+            assert tracker.recently_wrote("user-1")
+        with patch("src.db.routing.time.monotonic", return_value=106.0):
+            assert not tracker.recently_wrote("user-1")
+
+    def test_unknown_principal_is_not_sticky(self):
+        tracker = ReadYourWritesTracker(window_seconds=5)
+
+        assert not tracker.recently_wrote("user-1")
+
+    def test_oldest_entries_are_evicted_beyond_capacity(self):
+        tracker = ReadYourWritesTracker(window_seconds=60, max_entries=2)
+
+        for key in ("a", "b", "c"):
+            tracker.record_write(key)
+
+        assert not tracker.recently_wrote("a")
+        assert tracker.recently_wrote("b")
+        assert tracker.recently_wrote("c")
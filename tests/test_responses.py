@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+
+from fastapi import FastAPI, Request, status
+from fastapi.testclient import TestClient
+
+from src.responses import ModelResponse, RenderedBody, conditional_response
+from src.schemas.api_response import APIResponse
+from src.schemas.blog import BlogDetail, BlogWithCommentsResponse, Comment, UserInfo
+
+
+def sample_details() -> APIResponse:
+    author = UserInfo(id="u1", name="Author", image_url="https://example.com/a.png")
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+    return APIResponse(
+        data=BlogWithCommentsResponse(
+            blog=BlogDetail(
+                id="b1", title="Title", body="Body", cover_image_url="https://example.com/c.png",
+                is_liked_by_user=False, total_likes=3, created_by=author, created_at=created_at),
+            comments=[Comment(id="c1", content="Hi", created_by=author, created_at=created_at)],
+        ),
+        success=True,
+        message="Blog details fetched successfully",
+    )
+
+
+class TestModelResponse:
+    """ModelResponse must send the same JSON FastAPI's response_model path does"""
+
+    def test_body_matches_response_model_serialisation(self):
+        app = FastAPI()
+
+        @app.get("/validated", response_model=APIResponse[BlogWithCommentsResponse])
+        async def validated():
+            return sample_details()
+
+        @app.get("/direct", response_model=APIResponse[BlogWithCommentsResponse])
+        async def direct():
+            return ModelResponse(sample_details())
+
+        client = TestClient(app)
+        validated_response = client.get("/validated")
+        direct_response = client.get("/direct")
+
+        assert direct_response.headers["content-type"] == "application/json"
+        assert direct_response.json() == validated_response.json()
+        assert direct_response.json()["data"]["blog"]["isLikedByUser"] is False
+        assert direct_response.json()["data"]["blog"]["createdAt"] == "2026-01-02T03:04:05.678000Z"
+
+    def test_status_code_is_passed_through(self):
+        response = ModelResponse(sample_details(), status_code=status.HTTP_201_CREATED)
+
+        assert response.status_code == 201
+        assert response.headers["content-length"] == str(len(response.body))
+
+
+def conditional_client(page: RenderedBody) -> tuple[TestClient, list[int]]:
+    app = FastAPI()
+    renders: list[int] = []
+
+    def render() -> bytes:
+        renders.append(1)
+        return page.body
+
+    @app.get("/page")
+    async def get_page(request: Request):
+        return conditional_response(request, page.etag, render, page.last_modified)
+
+    return TestClient(app), renders
+
+
+class TestConditionalResponse:
+    """Conditional GETs answer 304 without building the body"""
+
+    page = RenderedBody(b'{"data": []}', '"abc123"', 1767323045.0)
+
+    def test_first_request_gets_the_body_and_validators(self):
+        client, renders = conditional_client(self.page)
+
+        response = client.get("/page")
+
+        assert response.status_code == 200
+        assert response.content == self.page.body
+        assert response.headers["etag"] == '"abc123"'
+        assert response.headers["last-modified"] == "Fri, 02 Jan 2026 03:04:05 GMT"
+        assert response.headers["cache-control"] == "no-cache"
+        assert len(renders) == 1
+
+    def test_matching_etag_gets_304_without_rendering(self):
+        client, renders = conditional_client(self.page)
+
+        for if_none_match in ['"abc123"', 'W/"abc123"', '"old", "abc123"', "*"]:
+            response = client.get("/page", headers={"If-None-Match": if_none_match})
+
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == '"abc123"'
+        assert renders == []
+
+    def test_changed_etag_gets_the_body(self):
+        client, _ = conditional_client(self.page)
+
+        response = client.get("/page", headers={"If-None-Match": '"old"'})
+
+        assert response.status_code == 200
+        assert response.content == self.page.body
+
+    def test_if_modified_since_is_used_only_without_an_etag(self):
+        client, _ = conditional_client(self.page)
+
+        unchanged = client.get("/page", headers={"If-Modified-Since": "Fri, 02 Jan 2026 03:04:05 GMT"})
+        older = client.get("/page", headers={"If-Modified-Since": "Fri, 02 Jan 2026 03:04:04 GMT"})
+        etag_wins = client.get("/page", headers={
+            "If-Modified-Since": "Fri, 02 Jan 2026 03:04:05 GMT", "If-None-Match": '"old"'})
+        malformed = client.get("/page", headers={"If-Modified-Since": "yesterday"})
+
+        assert unchanged.status_code == 304
+        assert older.status_code == 200
+        assert etag_wins.status_code == 200
+        assert malformed.status_code == 200
@@ -0,0 +1,109 @@
+"""
+S3StorageBackend against a real S3-compatible endpoint (MinIO, LocalStack...).
+
+    S3_TEST_ENDPOINT_URL=http://localhost:9000 S3_TEST_BUCKET=blog-test \\
+        pytest tests/test_s3_storage.py
+"""
+import base64
+import hashlib
+import os
+import urllib.request
+
+import pytest
+
+from src.services.storage import S3StorageBackend
+
+boto3 = pytest.importorskip("boto3")
+
+ENDPOINT_URL = os.getenv("S3_TEST_ENDPOINT_URL")
+BUCKET = os.getenv("S3_TEST_BUCKET", "blog-test")
+
+pytestmark = pytest.mark.skipif(
+    not ENDPOINT_URL, reason="S3_TEST_ENDPOINT_URL is not set")
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+@pytest.fixture
+def backend() -> S3StorageBackend:
+    access_key = os.getenv("S3_TEST_ACCESS_KEY_ID", "test")
+    secret_key = os.getenv("S3_TEST_SECRET_ACCESS_KEY", "test")
+    client = boto3.client(
+        "s3", endpoint_url=ENDPOINT_URL, region_name="us-east-1",
+        aws_access_key_id=access_key, aws_secret_access_key=secret_key)
+    try:
+        client.create_bucket(Bucket=BUCKET)
+    except client.exceptions.BucketAlreadyOwnedByYou:
+        pass
+    return S3StorageBackend(
+        bucket=BUCKET, endpoint_url=ENDPOINT_URL, region="us-east-1",
+        access_key_id=access_key, secret_access_key=secret_key)
+
+
+@pytest.mark.asyncio
+async def test_save_exists_and_delete(backend: S3StorageBackend, tmp_path):
+    source = tmp_path / "blob.png"
+    source.write_bytes(PNG)
+    key = f"ab/cd/{hashlib.sha256(PNG).hexdigest()}.png"
+
+    await backend.save(key, source, "image/png")
+
+    assert await backend.exists(key)
+    assert await backend.modified_at(key) is not None
+    assert key in [stored.key async for stored in backend.scan()]
+
+    assert await backend.delete(key) == len(PNG)
+    assert not await backend.exists(key)
+
+
+@pytest.mark.asyncio
+async def test_presigned_upload_accepts_matching_body(backend: S3StorageBackend):
+    digest = hashlib.sha256(PNG).hexdigest()
+    key = f"ef/01/{digest}.png"
+    presigned = backend.presign_upload(key, "image/png", len(PNG), digest)
+    assert presigned is not None
+
+    request = urllib.request.Request(
+        presigned.url, data=PNG, method=presigned.method, headers=presigned.headers)
+    with urllib.request.urlopen(request) as response:
+        assert response.status == 200
+
+    assert await backend.exists(key)
+    await backend.delete(key)
+
+
+def test_checksum_header_is_base64_of_the_digest(backend: S3StorageBackend):
+    digest = hashlib.sha256(PNG).hexdigest()
+
+    presigned = backend.presign_upload("ab/cd/x.png", "image/png", len(PNG), digest)
+
+    assert presigned is not None
+    assert presigned.headers["x-amz-checksum-sha256"] == \
+        base64.b64encode(bytes.fromhex(digest)).decode()
+
+
+
+def test_presigned_get_url_is_reused_while_fresh(backend: S3StorageBackend):
+    key = "ab/cd/" + "ab" * 32 + ".png"
+
+    first = backend.url(key)
+    signed_at = backend._signed_urls[key][1]
+
+    assert "X-Amz-Signature" in first
+    assert backend.url(key) == first
+
+    backend.signed_url_reuse_seconds = 0
+    backend.url(key)
+
+    assert backend._signed_urls[key][1] > signed_at
+
+
+@pytest.mark.asyncio
+async def test_read_prefix_fetches_only_the_leading_bytes(backend: S3StorageBackend, tmp_path):
+    source = tmp_path / "blob.png"
+    source.write_bytes(PNG)
+    key = f"ab/cd/{hashlib.sha256(PNG).hexdigest()}.png"
+    await backend.save(key, source, "image/png")
+
+    assert await backend.read_prefix(key, 8) == PNG[:8]
+    assert await backend.read_prefix("ab/cd/missing.png", 8) is None
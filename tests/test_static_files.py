@@ -0,0 +1,91 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from src.static_files import IMMUTABLE_CACHE_CONTROL, CachedStaticFiles, accepted_encodings
+
+DIGEST = "ab" + "cd" + "0" * 60
+
+
+@pytest.fixture
+def client(tmp_path) -> TestClient:
+    blob = tmp_path / "ab" / "cd" / f"{DIGEST}.png"
+    blob.parent.mkdir(parents=True)
+    blob.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4)
+    manifest = tmp_path / "ab" / "cd" / f"{DIGEST}.variants.json"
+    manifest.write_text('{"variants": []}' + " " * 2000)
+    (tmp_path / "ab" / "cd" / f"{DIGEST}.variants.json.gz").write_bytes(
+        gzip.compress(manifest.read_bytes()))
+    (tmp_path / "legacy.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+    app = Starlette(routes=[Mount(
+        "/uploads", CachedStaticFiles(directory=str(tmp_path), max_age_seconds=60))])
+    return TestClient(app)
+
+
+class TestCachedStaticFiles:
+    """Unit tests for CachedStaticFiles"""
+
+    def test_content_addressed_files_are_immutable(self, client: TestClient):
+        response = client.get(f"/uploads/ab/cd/{DIGEST}.png")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_other_files_get_the_configured_max_age(self, client: TestClient):
+        response = client.get("/uploads/legacy.png")
+
+        assert response.headers["cache-control"] == "public, max-age=60"
+
+    def test_conditional_request_gets_304(self, client: TestClient):
+        etag = client.get(f"/uploads/ab/cd/{DIGEST}.png").headers["etag"]
+
+        response = client.get(f"/uploads/ab/cd/{DIGEST}.png", headers={"if-none-match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_stale_etag_gets_the_body(self, client: TestClient):
+        response = client.get(f"/uploads/ab/cd/{DIGEST}.png", headers={"if-none-match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.content.startswith(b"\x89PNG")
+
+    def test_missing_content_addressed_file_is_404_even_when_conditional(self, client: TestClient):
+        missing = "ab/cd/abcd" + "f" * 60 + ".png"
+
+        response = client.get(f"/uploads/{missing}", headers={"if-none-match": "*"})
+
+        assert response.status_code == 404
+
+    def test_range_request_returns_partial_content(self, client: TestClient):
+        response = client.get(f"/uploads/ab/cd/{DIGEST}.png", headers={"range": "bytes=0-7"})
+
+        assert response.status_code == 206
+        assert response.content == b"\x89PNG\r\n\x1a\n"
+
+    def test_precompressed_sibling_is_served_when_accepted(self, client: TestClient):
+        path = f"/uploads/ab/cd/{DIGEST}.variants.json"
+
+        compressed = client.get(path, headers={"accept-encoding": "gzip"})
+        plain = client.get(path, headers={"accept-encoding": "identity"})
+
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["content-type"].startswith("application/json")
+        assert compressed.content == plain.content
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["vary"] == "accept-encoding"
+
+    def test_missing_file_is_404_without_cache_headers(self, client: TestClient):
+        response = client.get("/uploads/missing.png")
+
+        assert response.status_code == 404
+        assert "cache-control" not in response.headers
+
+
+def test_accepted_encodings_drops_refused_codings():
+    assert accepted_encodings("gzip;q=1.0, br;q=0, deflate") == {"gzip", "deflate"}
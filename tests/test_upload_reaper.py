@@ -0,0 +1,134 @@
+import os
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.services import upload_reaper as upload_reaper_module
+from src.services.storage import LocalStorageBackend
+from src.services.upload_reaper import UploadReaper
+
+OLD = time.time() - 3600
+
+
+def write_blob(root, digest: str, size: int = 100, mtime: float = OLD, ext: str = "png"):
+    path = root / digest[:2] / digest[2:4] / f"{digest}.{ext}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\x00" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def url_of(path, root) -> str:
+    return "/uploads/" + path.relative_to(root).as_posix()
+
+
+class TestUploadReaper:
+    """Unit tests for UploadReaper.sweep"""
+
+    @pytest.fixture(autouse=True)
+    def no_pipeline(self, monkeypatch):
+        monkeypatch.setattr(upload_reaper_module, "image_pipeline", MagicMock())
+
+    @pytest.fixture
+    def reaper(self, tmp_path) -> UploadReaper:
+        return UploadReaper(LocalStorageBackend(str(tmp_path)), upload_dir=str(tmp_path),
+                            grace_seconds=300, batch_size=2)
+
+    @staticmethod
+    def references(*urls: str):
+        async def find_referenced(image_urls: list[str]) -> set[str]:
+            return set(image_urls) & set(urls)
+        return find_referenced
+
+    @pytest.mark.asyncio
+    async def test_unreferenced_upload_and_variants_are_deleted(self, reaper, tmp_path):
+        orphan = write_blob(tmp_path, "ab" * 32, size=100)
+        variant = orphan.with_name(f"{'ab' * 32}.w320.webp")
+        variant.write_bytes(b"\x00" * 40)
+        os.utime(variant, (OLD, OLD))
+
+        report = await reaper.sweep(self.references())
+
+        assert not orphan.exists() and not variant.exists()
+        assert report.files_deleted == 1
+        assert report.bytes_reclaimed == 140
+
+    @pytest.mark.asyncio
+    async def test_referenced_uploads_are_kept_across_batches(self, reaper, tmp_path):
+        kept = [write_blob(tmp_path, f"{i:02x}" * 32) for i in range(5)]
+        orphan = write_blob(tmp_path, "ff" * 32)
+
+        report = await reaper.sweep(self.references(*(url_of(p, tmp_path) for p in kept)))
+
+        assert all(path.exists() for path in kept)
+        assert not orphan.exists()
+        assert report.files_scanned == 6
+        assert report.files_deleted == 1
+
+    @pytest.mark.asyncio
+    async def test_recent_uploads_are_kept(self, reaper, tmp_path):
+        recent = write_blob(tmp_path, "ab" * 32, mtime=time.time())
+
+        report = await reaper.sweep(self.references())
+
+        assert recent.exists()
+        assert report.files_deleted == 0
+
+    @pytest.mark.asyncio
+    async def test_unreferenced_legacy_uploads_are_deleted_alone(self, reaper, tmp_path):
+        orphan = tmp_path / "1700000000-photo.png"
+        referenced = tmp_path / "1700000000-photo.jpg"
+        for path in (orphan, referenced):
+            path.write_bytes(b"\x00" * 10)
+            os.utime(path, (OLD, OLD))
+
+        report = await reaper.sweep(self.references("/uploads/1700000000-photo.jpg"))
+
+        assert not orphan.exists()
+        assert referenced.exists()
+        assert report.files_deleted == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_temp_files_are_swept(self, reaper, tmp_path):
+        stale = tmp_path / ".stale.part"
+        stale.write_bytes(b"\x00" * 10)
+        os.utime(stale, (OLD, OLD))
+        in_progress = tmp_path / ".in-progress.part"
+        in_progress.write_bytes(b"\x00" * 10)
+
+        report = await reaper.sweep(self.references())
+
+        assert not stale.exists()
+        assert in_progress.exists()
+        assert report.temp_files_deleted == 1
+        assert report.bytes_reclaimed == 10
+
+    @pytest.mark.asyncio
+    async def test_interrupted_variant_temp_files_are_swept(self, reaper, tmp_path):
+        blob = write_blob(tmp_path, "ab" * 32, mtime=time.time())
+        stale = blob.with_name(f".{'ab' * 32}.w320.webp.part")
+        stale.write_bytes(b"\x00" * 10)
+        os.utime(stale, (OLD, OLD))
+        encoding = blob.with_name(f".{'ab' * 32}.w640.webp.part")
+        encoding.write_bytes(b"\x00" * 10)
+
+        report = await reaper.sweep(self.references())
+
+        assert not stale.exists()
+        assert encoding.exists() and blob.exists()
+        assert report.temp_files_deleted == 1
+        assert report.bytes_reclaimed == 10
+
+    @pytest.mark.asyncio
+    async def test_totals_accumulate_across_passes(self, reaper, tmp_path):
+        write_blob(tmp_path, "ab" * 32)
+        await reaper.sweep(self.references())
+        write_blob(tmp_path, "cd" * 32)
+        await reaper.sweep(self.references())
+
+        snapshot = reaper.snapshot()
+
+        assert snapshot["runs"] == 2
+        assert snapshot["totals"]["files_deleted"] == 2
+        assert snapshot["last_run"]["files_deleted"] == 1